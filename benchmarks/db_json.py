@@ -0,0 +1,175 @@
+"""List responses rendered by PostgreSQL versus the pydantic path.
+
+Walks every page of the students, courses and users lists twice: once
+through the regular service methods (rows loaded into ORM objects or result
+rows, DTOs validated and serialized by pydantic-core) and once through the
+``db_json`` methods, where json_build_object/json_agg render the page in the
+database, and reports the time per page of both paths. That both paths
+produce the same documents is checked by tests/test_db_json.py.
+
+Runs against the database configured by DATABASE_URL, which must be
+PostgreSQL with migrations applied. The created rows are removed at the end.
+
+Usage: python -m benchmarks.db_json [--rows 5000] [--limit 100] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from pydantic_core import to_json
+from sqlalchemy import delete
+
+from src.core.db.database import async_session, engine
+from src.core.dependencies import read_only
+from src.models import Course, Faculty, Group, Instructor, Student, User
+from src.models.enum import SemesterEnum, UserRoleEnum
+from src.service import CourseService, StudentService, UserService
+
+ADMIN = User(id=0, user_role=UserRoleEnum.ADMIN)
+
+
+async def create_fixtures(rows: int) -> dict:
+    """Creates students and courses of one group and instructor, returns IDs."""
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        faculty = Faculty(name=f"bench-{tag}")
+        group = Group(name=f"bench-{tag}")
+        users = [
+            User(
+                first_name="Bench",
+                last_name=str(number),
+                username=f"bench-{tag}-{number}",
+                password="-",
+                user_role=UserRoleEnum.STUDENT,
+            )
+            for number in range(rows + 1)
+        ]
+        session.add_all([faculty, group, *users])
+        await session.flush()
+
+        instructor = Instructor(
+            user_id=users[0].id,
+            position="-",
+            department=f"bench-{tag}",
+            academic_degree="-",
+        )
+        session.add(instructor)
+        await session.flush()
+
+        session.add_all(
+            Student(
+                user_id=user.id,
+                student_number=f"{tag}-{number}",
+                group_id=group.id,
+                enrollment_year=2020 + number % 5,
+                faculty_id=faculty.id,
+            )
+            for number, user in enumerate(users[1:])
+        )
+        session.add_all(
+            Course(
+                title=f"Course {number}",
+                description="Introduction to the subject " * 4,
+                course_code=f"{tag}-{number}",
+                credits=number % 6 + 1,
+                instructor_id=instructor.id,
+                semester=SemesterEnum.AUTUMN if number % 2 else SemesterEnum.SPRING,
+                year=2020 + number % 5,
+                capacity=number % 50 or None,
+            )
+            for number in range(rows)
+        )
+        await session.commit()
+        return {
+            "group_id": group.id,
+            "faculty_id": faculty.id,
+            "instructor_id": instructor.id,
+            "user_ids": [user.id for user in users],
+        }
+
+
+async def remove_fixtures(fixtures: dict) -> None:
+    async with async_session() as session:
+        instructor_id = fixtures["instructor_id"]
+        await session.execute(delete(Course).filter_by(instructor_id=instructor_id))
+        await session.execute(delete(Instructor).filter_by(id=instructor_id))
+        await session.execute(delete(Student).filter_by(group_id=fixtures["group_id"]))
+        await session.execute(delete(User).where(User.id.in_(fixtures["user_ids"])))
+        await session.execute(delete(Group).filter_by(id=fixtures["group_id"]))
+        await session.execute(delete(Faculty).filter_by(id=fixtures["faculty_id"]))
+        await session.commit()
+
+
+async def walk(service_cls, method: str, filters: dict) -> list[bytes]:
+    """Returns the JSON of every page of a list, following the cursors."""
+    pages = []
+    cursor = None
+    async with async_session() as session:
+        service = await read_only(service_cls)(session)
+        while True:
+            page = await getattr(service, method)(cursor=cursor, **filters)
+            content = page if isinstance(page, bytes) else to_json(page)
+            pages.append(content)
+            cursor = json.loads(content)["next_cursor"]
+            if cursor is None:
+                return pages
+
+
+def count_items(pages: list[bytes]) -> int:
+    return sum(
+        len(next(v for v in json.loads(p).values() if isinstance(v, list)))
+        for p in pages
+    )
+
+
+async def main(rows: int, limit: int, repeat: int) -> None:
+    fixtures = await create_fixtures(rows)
+    try:
+        lists = (
+            (
+                "students",
+                StudentService,
+                "get_students",
+                {"group_id": fixtures["group_id"]},
+            ),
+            (
+                "courses",
+                CourseService,
+                "get_courses",
+                {"instructor_id": fixtures["instructor_id"]},
+            ),
+            (
+                "users",
+                UserService,
+                "get_all_users",
+                {"current_user": ADMIN},
+            ),
+        )
+        print(f"{rows} rows per list, {limit} items per page")
+        for label, service_cls, method, filters in lists:
+            options = {**filters, "limit": limit}
+            for path, name in (("pydantic", method), ("db_json", f"{method}_db_json")):
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    pages = await walk(service_cls, name, options)
+                elapsed = (time.perf_counter() - started) / repeat
+                items = count_items(pages)
+                print(
+                    f"{label:<9} {path:<9} {elapsed / len(pages) * 1000:8.2f} ms/page"
+                    f" {elapsed / items * 1e6:8.2f} us/item"
+                )
+    finally:
+        await remove_fixtures(fixtures)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit, args.repeat))
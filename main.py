@@ -1,13 +1,29 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from src.routers import router
+from fastapi.responses import ORJSONResponse
+from src.core.middleware import MetricsMiddleware, QueryStatsMiddleware
+from src.routers import router, metrics_router
+from src.service.auth import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    password_hasher.shutdown()
 
 
 app = FastAPI(
     title="University FastAPI",
     description="API для университета",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(router)
+app.include_router(metrics_router)
 
 if __name__ == "__main__":
     import uvicorn
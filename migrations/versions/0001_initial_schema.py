@@ -0,0 +1,157 @@
+"""Initial schema
+
+Creates the tables previously created by _create_db.py. Databases that were
+created by that script already have this schema and should be marked with
+``alembic stamp 0001`` instead of being upgraded.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "faculty",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "group",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "user",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("first_name", sa.String(), nullable=False),
+        sa.Column("last_name", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column(
+            "user_role",
+            sa.Enum("ADMIN", "STUDENT", "INSTRUCTOR", name="userroleenum"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("username"),
+    )
+    op.create_table(
+        "instructor",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.String(), nullable=False),
+        sa.Column("department", sa.String(), nullable=False),
+        sa.Column("academic_degree", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "news_event",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("publish_date", sa.DateTime(), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("type", sa.Enum("NEWS", "EVENT", name="typeenum"), nullable=False),
+        sa.Column("event_date", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "student",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("student_number", sa.String(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("enrollment_year", sa.Integer(), nullable=False),
+        sa.Column("faculty_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["group_id"], ["group.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["faculty_id"], ["faculty.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "course",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("course_code", sa.String(), nullable=False),
+        sa.Column("credits", sa.Integer(), nullable=False),
+        sa.Column("instructor_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "semester",
+            sa.Enum("AUTUMN", "SPRING", name="semesterenum"),
+            nullable=False,
+        ),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["instructor_id"], ["instructor.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "enrollment",
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("enrollment_date", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("ACTIVE", "COMPLETED", "DROPPED", name="statusenum"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+        sa.ForeignKeyConstraint(["course_id"], ["course.id"]),
+        sa.PrimaryKeyConstraint("student_id", "course_id"),
+    )
+    op.create_table(
+        "schedule",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=False),
+        sa.Column("classroom", sa.String(), nullable=False),
+        sa.Column(
+            "lesson_type",
+            sa.Enum("LECTURE", "PRACTICE", "LAB", name="lessontypeenum"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["course_id"], ["course.id"]),
+        sa.PrimaryKeyConstraint("id", "course_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schedule")
+    op.drop_table("enrollment")
+    op.drop_table("course")
+    op.drop_table("student")
+    op.drop_table("news_event")
+    op.drop_table("instructor")
+    op.drop_table("user")
+    op.drop_table("group")
+    op.drop_table("faculty")
+    for enum_name in (
+        "lessontypeenum",
+        "statusenum",
+        "semesterenum",
+        "typeenum",
+        "userroleenum",
+    ):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,68 @@
+"""Indexes for list endpoint filters
+
+Covers the filter combinations of StudentService.get_students,
+CourseService.get_courses and InstructorService.get_instructors:
+
+- student: group / faculty filters, optionally with enrollment_year,
+  and enrollment_year alone; user_id for lookups by user
+- course: year with or without semester, semester alone ordered by id
+  (keyset pages), instructor_id
+- enrollment: course_id with or without status, status alone yielding
+  student ids for the student filter subquery
+- instructor: department, user_id
+
+Indexes are built with CREATE INDEX CONCURRENTLY so that existing tables
+stay writable while the migration runs.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_student_group_id_enrollment_year", "student", ["group_id", "enrollment_year"]),
+    (
+        "ix_student_faculty_id_enrollment_year",
+        "student",
+        ["faculty_id", "enrollment_year"],
+    ),
+    ("ix_student_enrollment_year", "student", ["enrollment_year"]),
+    ("ix_student_user_id", "student", ["user_id"]),
+    ("ix_course_year_semester", "course", ["year", "semester"]),
+    ("ix_course_semester_id", "course", ["semester", "id"]),
+    ("ix_course_instructor_id", "course", ["instructor_id"]),
+    ("ix_enrollment_course_id_status", "enrollment", ["course_id", "status"]),
+    ("ix_enrollment_status_student_id", "enrollment", ["status", "student_id"]),
+    ("ix_instructor_department", "instructor", ["department"]),
+    ("ix_instructor_user_id", "instructor", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
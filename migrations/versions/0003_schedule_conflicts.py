@@ -0,0 +1,70 @@
+"""Schedule conflict constraints
+
+Adds schedule.instructor_id (copied from the course) and exclusion
+constraints that reject overlapping lessons in one classroom or for one
+instructor. The constraints are backed by GiST indexes on
+(classroom, tsrange) and (instructor_id, tsrange), which requires the
+btree_gist extension for the equality part.
+
+Existing overlapping lessons make the upgrade fail and have to be
+resolved first.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EXCLUDE_CONSTRAINTS = [
+    ("ex_schedule_classroom_overlap", "classroom"),
+    ("ex_schedule_instructor_overlap", "instructor_id"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column("schedule", sa.Column("instructor_id", sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE schedule SET instructor_id = course.instructor_id "
+        "FROM course WHERE course.id = schedule.course_id"
+    )
+    op.alter_column("schedule", "instructor_id", nullable=False)
+    op.create_foreign_key(
+        "schedule_instructor_id_fkey",
+        "schedule",
+        "instructor",
+        ["instructor_id"],
+        ["id"],
+    )
+
+    op.create_check_constraint(
+        "ck_schedule_time_order", "schedule", "end_time > start_time"
+    )
+    for name, column in EXCLUDE_CONSTRAINTS:
+        op.execute(
+            f"ALTER TABLE schedule ADD CONSTRAINT {name} EXCLUDE USING gist "
+            f"({column} WITH =, tsrange(start_time, end_time) WITH &&)"
+        )
+    op.create_index(
+        "ix_schedule_course_id_start_time", "schedule", ["course_id", "start_time"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_course_id_start_time", table_name="schedule")
+    for name, _ in reversed(EXCLUDE_CONSTRAINTS):
+        op.drop_constraint(name, "schedule")
+    op.drop_constraint("ck_schedule_time_order", "schedule")
+    op.drop_constraint("schedule_instructor_id_fkey", "schedule", type_="foreignkey")
+    op.drop_column("schedule", "instructor_id")
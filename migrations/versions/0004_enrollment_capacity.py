@@ -0,0 +1,61 @@
+"""Course capacity and enrollment waitlist
+
+Adds course.capacity (NULL for unlimited) and course.enrolled_count, the
+number of active enrollments, initialized from existing data. Adds the
+WAITLISTED enrollment status and a partial index over the waitlist of a
+course in arrival order.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A new enum value cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE statusenum ADD VALUE IF NOT EXISTS 'WAITLISTED'")
+
+    op.add_column("course", sa.Column("capacity", sa.Integer(), nullable=True))
+    op.add_column(
+        "course",
+        sa.Column("enrolled_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE course SET enrolled_count = active.count "
+        "FROM (SELECT course_id, count(*) AS count FROM enrollment "
+        "WHERE status = 'ACTIVE' GROUP BY course_id) AS active "
+        "WHERE active.course_id = course.id"
+    )
+    op.create_check_constraint(
+        "ck_course_capacity",
+        "course",
+        "capacity IS NULL OR enrolled_count <= capacity",
+    )
+    op.create_index(
+        "ix_enrollment_waitlist",
+        "enrollment",
+        ["course_id", "enrollment_date"],
+        postgresql_where=sa.text("status = 'WAITLISTED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_enrollment_waitlist", table_name="enrollment")
+    op.drop_constraint("ck_course_capacity", "course")
+    op.drop_column("course", "enrolled_count")
+    op.drop_column("course", "capacity")
+    # PostgreSQL cannot drop an enum value; waitlisted enrollments are
+    # dropped so that the remaining code does not see an unknown status
+    op.execute("UPDATE enrollment SET status = 'DROPPED' WHERE status = 'WAITLISTED'")
@@ -0,0 +1,52 @@
+"""Indexes for the news feed
+
+The feed is paged by keyset on (publish_date, id) in descending order,
+optionally filtered by type; upcoming feeds filter on event_date.
+
+Indexes are built with CREATE INDEX CONCURRENTLY so that the table
+stays writable while the migration runs.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_news_event_publish_date_id", "news_event", ["publish_date", "id"]),
+    (
+        "ix_news_event_type_publish_date_id",
+        "news_event",
+        ["type", "publish_date", "id"],
+    ),
+    ("ix_news_event_event_date", "news_event", ["event_date"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,166 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable
+
+from src.models import Faculty, Group
+from src.settings import settings
+
+
+class TTLCache:
+    """Bounded in-process cache with per-entry TTL and LRU eviction.
+
+    Entries expire ``ttl`` seconds after being stored. When the cache is full,
+    the least recently used entry is evicted. The cache is meant to be used
+    from a single event loop and therefore does not lock.
+
+    Every invalidation bumps ``generation``. A caller that loads a value from
+    the database can capture the generation beforehand and pass it to ``set``:
+    if an invalidation happened in the meantime, the possibly stale value
+    is not stored.
+
+    Attributes:
+        maxsize (int): Maximum number of entries
+        ttl (float): Entry lifetime in seconds
+        hits (int): Number of successful lookups
+        misses (int): Number of lookups that found nothing
+        generation (int): Invalidation counter
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns a cached value or ``default`` if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: int = None) -> None:
+        """Stores a value, evicting the least recently used entry if needed.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store
+            generation (int, optional): Generation captured before the value
+                was loaded; the value is dropped if it is outdated
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Invalidates a single entry."""
+        self.generation += 1
+        self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Invalidates every entry whose key matches the predicate."""
+        self.generation += 1
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Invalidates all entries."""
+        self.generation += 1
+        self._data.clear()
+
+
+class ReferenceCache:
+    """Process-local ``id -> name`` map of a small, rarely changing table.
+
+    Names are loaded on demand: IDs that are not in the map yet, including
+    rows created by another worker, are fetched with the request's
+    EntityLoader, so lookups of several tables gathered together are
+    batched like any other loads. Handlers of this worker keep the map
+    current with ``set`` and ``discard``; renames made by other workers are
+    not picked up until the process restarts.
+
+    Attributes:
+        model (DeclarativeBase): Model of the table, with ``id`` and ``name``
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._names: dict[int, str] = {}
+
+    async def resolve(self, loader, ids: Iterable[int]) -> dict[int, str]:
+        """Returns names for the given IDs, loading the unknown ones.
+
+        Args:
+            loader (EntityLoader): Loader of the current request, used only
+                for IDs missing from the map
+            ids (Iterable[int]): IDs to resolve
+
+        Returns:
+            dict[int, str]: Names of the found IDs; unknown IDs are omitted
+        """
+        ids = set(ids)
+        missing = ids - self._names.keys()
+        if missing:
+            for row in await loader.load_many(self.model, sorted(missing)):
+                if row is not None:
+                    self._names[row.id] = row.name
+        return {i: self._names[i] for i in ids if i in self._names}
+
+    def set(self, model_id: int, name: str) -> None:
+        """Adds or renames an entry after a write in this worker."""
+        self._names[model_id] = name
+
+    def discard(self, model_id: int) -> None:
+        """Removes an entry after a deletion in this worker."""
+        self._names.pop(model_id, None)
+
+
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# Serialized pages of GET /api/course keyed by the normalized filters
+course_list_cache = TTLCache(
+    maxsize=settings.COURSE_CACHE_MAXSIZE, ttl=settings.COURSE_CACHE_TTL_SECONDS
+)
+
+# Serialized first pages of GET /api/news keyed by the feed filters
+news_feed_cache = TTLCache(
+    maxsize=settings.NEWS_CACHE_MAXSIZE, ttl=settings.NEWS_CACHE_TTL_SECONDS
+)
+
+
+def discard_course_lists(course) -> None:
+    """Invalidates the cached course list pages that may contain a course.
+
+    Args:
+        course (Course | Row): Course, or a row with its ``semester``,
+            ``year`` and ``instructor_id``
+    """
+
+    def affected(key: tuple) -> bool:
+        semester, year, instructor_id = key[:3]
+        return (
+            semester in (None, course.semester.name)
+            and year in (None, course.year)
+            and instructor_id in (None, course.instructor_id)
+        )
+
+    course_list_cache.discard_where(affected)
+
+
+group_names = ReferenceCache(Group)
+faculty_names = ReferenceCache(Faculty)
@@ -1,11 +1,36 @@
+from itertools import cycle
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from typing import AsyncGenerator, Any
 
+from src.core.db.pool import InstrumentedQueuePool
+from src.core.db.stats import instrument_engine
 from src.settings import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+def _create_engine(url: str):
+    """Creates an engine with the pool configured from settings.
+
+    Statements executed by the engine are counted per request,
+    see src.core.db.stats.
+    """
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    instrument_engine(new_engine)
+    return new_engine
+
+
+engine = _create_engine(settings.DATABASE_URL)
 
 async_session = sessionmaker(
     bind=engine,
@@ -15,6 +40,34 @@ async_session = sessionmaker(
     autocommit=False,
 )
 
+# Read-only engines for streaming replicas. Without replicas configured,
+# reads go to the primary.
+read_engines = [_create_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+if not read_engines:
+    read_engines = [engine]
+
+_read_sessions = cycle(
+    [
+        sessionmaker(
+            bind=read_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+        )
+        for read_engine in read_engines
+    ]
+)
+
+
+def read_session() -> AsyncSession:
+    """Creates a session bound to the next read engine (round-robin).
+
+    Replicas may lag behind the primary, so read-only sessions must not be
+    used for reads that have to observe a write made in the same request.
+    """
+    return next(_read_sessions)()
+
 
 async def get_async_db() -> AsyncGenerator[Any, Any]:
     db = async_session()
@@ -22,3 +75,11 @@ async def get_async_db() -> AsyncGenerator[Any, Any]:
         yield db
     finally:
         await db.close()
+
+
+async def get_async_read_db() -> AsyncGenerator[Any, Any]:
+    db = read_session()
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,74 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStats:
+    """Counters collected by InstrumentedQueuePool.
+
+    Attributes:
+        checkouts (int): Number of successful connection checkouts
+        timeouts (int): Number of checkouts that failed with a pool timeout
+        wait_total (float): Total time spent waiting for a connection, seconds
+        wait_max (float): Longest wait for a connection, seconds
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that measures how long checkouts wait for a connection.
+
+    Occupancy (checked out, idle, overflow) is read from the pool itself,
+    the pool only adds counters that SQLAlchemy does not keep.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.stats.wait_total += waited
+            self.stats.wait_max = max(self.stats.wait_max, waited)
+        self.stats.checkouts += 1
+        return connection
+
+
+def pool_status(engine) -> dict:
+    """Returns a snapshot of the connection pool of an engine.
+
+    Args:
+        engine (AsyncEngine): Engine created with InstrumentedQueuePool
+
+    Returns:
+        dict: Pool size, occupancy and checkout counters
+    """
+    pool = engine.pool
+    stats = pool.stats
+    return {
+        "url": engine.url.render_as_string(hide_password=True),
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_avg_ms": (
+            stats.wait_total / stats.checkouts * 1000 if stats.checkouts else 0.0
+        ),
+        "wait_max_ms": stats.wait_max * 1000,
+    }
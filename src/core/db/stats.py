@@ -0,0 +1,52 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+
+class QueryStats:
+    """Statements executed on behalf of a single request.
+
+    Attributes:
+        count (int): Number of executed statements
+        duration (float): Total time spent executing them, seconds
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+# Stats of the request being served. The object is mutated in place,
+# so statements executed in tasks spawned by the request are counted too.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_engine(engine) -> None:
+    """Attaches statement counters to an engine.
+
+    Every statement is timed and added to the QueryStats of the current
+    request, if any. Statements executed outside a request are ignored.
+
+    Args:
+        engine (AsyncEngine): Engine to instrument
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += time.perf_counter() - context._query_started
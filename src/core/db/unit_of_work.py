@@ -0,0 +1,71 @@
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """Groups the writes of several DAO calls into one transaction.
+
+    While a unit of work is active on a session, DAOs sharing that session
+    neither commit nor roll back: their statements stay in one transaction,
+    which is committed once when the block exits normally and rolled back
+    when it exits with an exception. Side effects that must only happen
+    after the data is durable, such as cache invalidation, are registered
+    with ``after_commit`` and dropped on rollback.
+
+    A unit of work opened inside another one on the same session joins it.
+
+    Usage examples:
+        async with UnitOfWork(student_dao.session) as uow:
+            student = await student_dao.add(student_data)
+            await user_dao.update(student.user_id, user_role=UserRoleEnum.STUDENT)
+            uow.after_commit(lambda: course_list_cache.clear())
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initializes the unit of work.
+
+        Args:
+            session (AsyncSession): Session shared by the DAOs taking part
+        """
+        self.session = session
+        self._outer: UnitOfWork | None = None
+        self._callbacks: list[Callable[[], None]] = []
+
+    @staticmethod
+    def current(session: AsyncSession) -> "UnitOfWork | None":
+        """Returns the unit of work active on a session, if any."""
+        return session.info.get(UNIT_OF_WORK_KEY)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Schedules a callback to run after the transaction is committed."""
+        if self._outer is not None:
+            self._outer.after_commit(callback)
+        else:
+            self._callbacks.append(callback)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._outer = self.current(self.session)
+        if self._outer is None:
+            self.session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._outer is not None:
+            return False
+
+        del self.session.info[UNIT_OF_WORK_KEY]
+        if exc_type is not None:
+            await self.session.rollback()
+            return False
+
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        for callback in self._callbacks:
+            callback()
+        return False
@@ -1,12 +1,27 @@
+import inspect
+
 import jwt
 from fastapi import Depends, HTTPException
 from fastapi import Cookie
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import user_cache
+from src.core.db.database import get_async_read_db
 from src.crud.users import UserDAO
 from src.models import User
 from src.models.enum import UserRoleEnum
 from src.settings import settings
 
+# Поля пользователя, которые сохраняются в user_cache
+CACHED_USER_FIELDS = [
+    column.key for column in User.__table__.columns if column.key != "password"
+]
+
+
+def _user_snapshot(user: User) -> dict:
+    """Снимает значения полей пользователя для хранения в user_cache."""
+    return {name: getattr(user, name) for name in CACHED_USER_FIELDS}
+
 
 async def get_current_user(
     access_token: str = Cookie(None), db_user: UserDAO = Depends()
@@ -14,14 +29,17 @@ async def get_current_user(
     """Получает аутентифицированного пользователя на основе JWT токена.
 
     Извлекает access token из куки, проверяет его валидность и возвращает
-    соответствующего пользователя из базы данных.
+    соответствующего пользователя. Пользователи кэшируются в памяти процесса
+    (см. user_cache), поэтому база данных запрашивается только при промахе.
+    В кэше хранится снимок полей пользователя без хэша пароля, и каждый
+    запрос получает собственную копию, не привязанную ни к одной сессии.
 
     Args:
         access_token (str, optional): JWT токен из cookie. Defaults to None.
         db_user (UserDAO): DAO для работы с пользователями (внедряется через зависимость)
 
     Returns:
-        User: Объект аутентифицированного пользователя
+        User: Отсоединённая копия аутентифицированного пользователя
 
     Raises:
         HTTPException:
@@ -41,7 +59,13 @@ async def get_current_user(
     if username is None:
         raise HTTPException(status_code=401, detail="Неверный токен")
 
-    user = await db_user.find_one(username=username)
+    snapshot = user_cache.get(username)
+    if snapshot is None:
+        generation = user_cache.generation
+        snapshot = _user_snapshot(await db_user.find_one(username=username))
+        user_cache.set(username, snapshot, generation=generation)
+
+    user = User(**snapshot)
     if not user.is_active:
         raise HTTPException(status_code=403, detail="Пользователь деактивирован")
     return user
@@ -91,3 +115,38 @@ async def get_admin_or_instructor_user(user: User = Depends(get_current_user)) -
             status_code=403, detail="Only admin or instructor can do this"
         )
     return user
+
+
+def read_only(service_cls):
+    """Создаёт зависимость, которая собирает сервис на сессии реплики.
+
+    Все DAO сервиса получают одну read-only сессию (см. get_async_read_db).
+    Используется только в эндпоинтах, которые ничего не пишут и не читают
+    только что записанные данные: реплика может отставать от primary.
+
+    Пример: ``service: CourseService = Depends(read_only(CourseService))``
+
+    Args:
+        service_cls (type): Класс сервиса, конструктор которого принимает
+            DAO-объекты (аннотированные классами DAO)
+
+    Returns:
+        Callable: Зависимость FastAPI, возвращающая экземпляр сервиса
+    """
+    parameters = [
+        parameter
+        for name, parameter in inspect.signature(
+            service_cls.__init__
+        ).parameters.items()
+        if name != "self"
+    ]
+
+    async def dependency(session: AsyncSession = Depends(get_async_read_db)):
+        return service_cls(
+            **{
+                parameter.name: parameter.annotation(session)
+                for parameter in parameters
+            }
+        )
+
+    return dependency
@@ -0,0 +1,101 @@
+import hashlib
+from typing import Callable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.settings import settings
+
+
+def compute_etag(content: bytes) -> str:
+    """Returns a strong ETag for a response body."""
+    return '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+
+def version_etag(*version) -> str:
+    """Returns a weak ETag for a resource version, e.g. its id and updated_at.
+
+    Unlike compute_etag, it is known before the response is built, so a
+    matching request can be answered without hydrating the response model.
+    """
+    raw = "/".join(str(part) for part in version).encode()
+    return 'W/"' + hashlib.blake2b(raw, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Checks an ETag against an If-None-Match header.
+
+    If-None-Match uses the weak comparison (RFC 9110, 13.1.2),
+    so the ``W/`` prefix of both tags is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == opaque for tag in tags)
+
+
+def _cache_headers(etag: str, public: bool) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": "{}, max-age={}, must-revalidate".format(
+            "public" if public else "private", settings.HTTP_CACHE_MAX_AGE
+        ),
+    }
+
+
+def conditional_response(
+    request: Request, data: BaseModel, public: bool = False
+) -> Response:
+    """Serializes a read response with an ETag and answers conditional GETs.
+
+    The ETag is a hash of the serialized body, so it changes whenever any
+    field of the response changes, including names joined from other tables.
+    A matching If-None-Match header gets an empty 304 response. Resources
+    with a version column use versioned_response instead.
+
+    Args:
+        request (Request): Incoming request
+        data (BaseModel): Response data
+        public (bool): Whether shared caches may store the response;
+            data visible only to authorized users must stay private
+
+    Returns:
+        Response: 200 with the JSON body or 304 without it
+    """
+    content = to_json(data)
+    etag = compute_etag(content)
+    headers = _cache_headers(etag, public)
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="application/json", headers=headers)
+
+
+def versioned_response(
+    request: Request,
+    etag: str,
+    build: Callable[[], BaseModel],
+    public: bool = False,
+) -> Response:
+    """Answers a conditional GET of a resource with a version ETag.
+
+    Used instead of conditional_response for rows with a version column:
+    the response data is only built and serialized when the client does
+    not have the current version.
+
+    Args:
+        request (Request): Incoming request
+        etag (str): ETag of the current version, see version_etag
+        build (Callable[[], BaseModel]): Builds the response data
+        public (bool): Whether shared caches may store the response
+
+    Returns:
+        Response: 200 with the JSON body or 304 without it
+    """
+    headers = _cache_headers(etag, public)
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(to_json(build()), media_type="application/json", headers=headers)
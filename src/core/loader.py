@@ -0,0 +1,131 @@
+import asyncio
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.db.database import get_async_db
+
+
+class EntityLoader:
+    """Request-scoped loader of entities by primary key with batching.
+
+    Loads of one model issued in the same event loop tick, e.g. from
+    ``asyncio.gather``, are coalesced into a single
+    ``SELECT ... WHERE id = ANY(:ids)`` query. Every loaded entity, and
+    every ID found missing, is memoized for the lifetime of the loader,
+    so repeated lookups of the same entity cost nothing.
+
+    The loader is created per request through Depends, like DAOs, and
+    shares their session. A batch is executed inline by the first load
+    that joined it, and batches run one at a time, so loads may be gathered
+    with each other but not with DAO calls: a session cannot run concurrent
+    queries. Memoized entities are not refreshed by later writes; use the
+    DAO to read data back after a write.
+
+    Usage examples:
+        loader = EntityLoader(session)
+        group, faculty = await asyncio.gather(
+            loader.load(Group, student.group_id),
+            loader.load(Faculty, student.faculty_id),
+        )
+        students = await loader.load_many(Student, [1, 2, 3])
+    """
+
+    def __init__(self, session: AsyncSession = Depends(get_async_db)):
+        """Initializes the loader with a database session.
+
+        Args:
+            session (AsyncSession): Asynchronous SQLAlchemy session,
+                injected through FastAPI Depends
+        """
+        self.session = session
+        self._results: dict[type, dict[int, asyncio.Future]] = {}
+        self._pending: dict[type, list[int]] = {}
+        self._lock = asyncio.Lock()
+
+    async def load(self, model, model_id: int):
+        """Loads an entity by its primary key.
+
+        Args:
+            model (DeclarativeBase): Model with a single-column primary key
+            model_id (int): Primary key value
+
+        Returns:
+            model | None: Found entity or None if it does not exist
+        """
+        results = self._results.setdefault(model, {})
+        future = results.get(model_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            results[model_id] = future
+            if model in self._pending:
+                self._pending[model].append(model_id)
+            else:
+                self._pending[model] = [model_id]
+                await self._dispatch(model)
+        return await asyncio.shield(future)
+
+    async def load_many(self, model, model_ids: list[int]) -> list:
+        """Loads entities by their primary keys with at most one query.
+
+        Args:
+            model (DeclarativeBase): Model with a single-column primary key
+            model_ids (list[int]): Primary key values
+
+        Returns:
+            list[model | None]: Entities in the order of ``model_ids``,
+                None for the missing ones
+        """
+        return list(await asyncio.gather(*(self.load(model, i) for i in model_ids)))
+
+    async def find_one(self, model, model_id: int):
+        """Loads an entity by its primary key or fails like BaseDAO.find_one.
+
+        Raises:
+            HTTPException: 404 if the entity does not exist
+        """
+        entity = await self.load(model, model_id)
+        if entity is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{model.__name__} with filter {{'id': {model_id}}} not found",
+            )
+        return entity
+
+    async def _dispatch(self, model) -> None:
+        """Runs one batched query for the IDs of a model collected in this tick.
+
+        Runs inline, in the task of the load that started the batch; the
+        other loads of the batch wait for its result.
+        """
+        batch = self._pending[model]
+        futures = self._results[model]
+        try:
+            # Let the other loads issued in this tick join the batch
+            await asyncio.sleep(0)
+            async with self._lock:
+                del self._pending[model]
+                (primary_key,) = model.__table__.primary_key.columns
+                query = select(model).where(
+                    primary_key == any_(literal(batch, ARRAY(primary_key.type)))
+                )
+                result = await self.session.execute(query)
+                found = {getattr(e, primary_key.key): e for e in result.scalars()}
+        except BaseException as e:
+            if self._pending.get(model) is batch:
+                del self._pending[model]
+            # Failed loads are forgotten so that a later load can retry
+            for model_id in batch:
+                future = futures.pop(model_id)
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+        for model_id in batch:
+            futures[model_id].set_result(found.get(model_id))
@@ -0,0 +1,108 @@
+from bisect import bisect_left
+
+# Upper bounds of the request latency histogram buckets, seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(**labels) -> str:
+    """Renders a Prometheus label set."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", r"\\").replace('"', r"\""))
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def metric_lines(name: str, kind: str, description: str, samples: list) -> list:
+    """Renders one metric family in the Prometheus text format.
+
+    Args:
+        name (str): Metric name
+        kind (str): Metric type (counter, gauge, histogram)
+        description (str): HELP text
+        samples (list[tuple[dict, float]]): Label sets with their values
+
+    Returns:
+        list[str]: Lines of the metric family
+    """
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_labels(**labels)} {value}" for labels, value in samples)
+    return lines
+
+
+class RequestMetrics:
+    """HTTP request counters collected by MetricsMiddleware.
+
+    Updates are plain dictionary and integer operations executed on the
+    event loop thread, so no locking is needed on the request path.
+    Cumulative bucket values are only computed when metrics are rendered.
+
+    Attributes:
+        in_flight (int): Number of requests being served right now
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.in_flight = 0
+        # (method, route) -> [per-bucket counts with a trailing +Inf bucket, sum]
+        self._latency = {}
+        # (method, route, status) -> number of responses
+        self._responses = {}
+
+    def observe(self, method: str, route: str, status: int, duration: float):
+        """Records one served request.
+
+        Args:
+            method (str): HTTP method
+            route (str): Route template, e.g. /api/students/{id}
+            status (int): Response status code
+            duration (float): Time to serve the request, seconds
+        """
+        key = (method, route)
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        histogram[0][bisect_left(self.buckets, duration)] += 1
+        histogram[1] += duration
+
+        key = (method, route, status)
+        self._responses[key] = self._responses.get(key, 0) + 1
+
+    def render(self) -> list:
+        """Renders the collected counters in the Prometheus text format."""
+        name = "http_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Time to serve HTTP requests",
+            f"# TYPE {name} histogram",
+        ]
+        for (method, route), (counts, total) in list(self._latency.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                labels = _labels(method=method, route=route, le=bound)
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"{name}_sum{labels} {total}")
+            lines.append(f"{name}_count{labels} {cumulative}")
+
+        lines += metric_lines(
+            "http_responses_total",
+            "counter",
+            "HTTP responses by status code",
+            [
+                ({"method": method, "route": route, "status": status}, count)
+                for (method, route, status), count in list(self._responses.items())
+            ],
+        )
+        lines += metric_lines(
+            "http_requests_in_flight",
+            "gauge",
+            "HTTP requests being served",
+            [({}, self.in_flight)],
+        )
+        return lines
+
+
+request_metrics = RequestMetrics()
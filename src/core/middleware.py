@@ -0,0 +1,106 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.db.stats import QueryStats, current_query_stats
+from src.core.metrics import request_metrics
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Counts database statements executed while serving each request.
+
+    The number of statements and the time spent in the database are
+    reported in the ``Server-Timing`` response header. Requests exceeding
+    settings.SLOW_REQUEST_QUERY_COUNT statements or settings.SLOW_REQUEST_DB_MS
+    milliseconds in the database are logged with a warning.
+
+    For streaming responses the header is sent before the body is produced,
+    so it only covers the statements executed up to that point; the log
+    line covers the whole request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            self._log_if_slow(scope, stats)
+
+    @staticmethod
+    def _log_if_slow(scope: Scope, stats: QueryStats):
+        too_many = 0 < settings.SLOW_REQUEST_QUERY_COUNT <= stats.count
+        too_long = 0 < settings.SLOW_REQUEST_DB_MS <= stats.duration_ms
+        if too_many or too_long:
+            logger.warning(
+                "%s %s executed %d queries in %.1f ms",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                stats.duration_ms,
+            )
+
+
+class MetricsMiddleware:
+    """Collects request latency and status counters for the /metrics endpoint.
+
+    Requests are labelled by route template rather than by the raw path,
+    so the number of label sets stays bounded. Requests that matched no
+    route are labelled ``unmatched``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        request_metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_metrics.in_flight -= 1
+            route = scope.get("route")
+            request_metrics.observe(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status,
+                time.perf_counter() - started,
+            )
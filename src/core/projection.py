@@ -0,0 +1,72 @@
+from fastapi import HTTPException
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.schemas import Page
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> list[str] | None:
+    """Parses the ``fields`` query parameter of a list endpoint.
+
+    Args:
+        fields (str | None): Comma-separated names of response fields,
+            e.g. ``"id,title"``
+        schema (type[BaseModel]): Schema of the list items
+
+    Returns:
+        list[str] | None: Requested fields in schema order, None when the
+            parameter is absent and the full items are returned
+
+    Raises:
+        HTTPException: 400 if a field is not part of the schema
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(status_code=400, detail="No fields requested")
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return [name for name in schema.model_fields if name in requested]
+
+
+def project(row, fields: list[str]) -> dict:
+    """Builds a sparse response item from a row or an object."""
+    return {name: getattr(row, name) for name in fields}
+
+
+def page_of(schema: type[BaseModel], rows: list, next_cursor: str, fields=None) -> Page:
+    """Builds a list endpoint page from model objects or projected rows.
+
+    Args:
+        schema (type[BaseModel]): Schema of the list items
+        rows (list): Model objects or rows as returned by BaseDAO.find_page
+        next_cursor (str): Cursor of the next page
+        fields (list[str], optional): Fields requested with ``fields=``
+
+    Returns:
+        Page: Page of full items, or of sparse items when fields are given
+    """
+    if fields is None:
+        items = [schema.model_validate(row) for row in rows]
+        return Page[schema](items=items, next_cursor=next_cursor)
+    return Page[dict](
+        items=[project(row, fields) for row in rows], next_cursor=next_cursor
+    )
+
+
+def json_page(items: bytes, next_cursor: str | None, key: str = "items") -> bytes:
+    """Wraps a JSON array rendered by BaseDAO.find_page_json into a page body.
+
+    Args:
+        items (bytes): JSON array of the page items
+        next_cursor (str | None): Cursor of the next page
+        key (str): Name of the items member, ``items`` as in Page
+
+    Returns:
+        bytes: JSON object shaped like the page schema of the endpoint
+    """
+    return b'{"%s":%s,"next_cursor":%s}' % (key.encode(), items, to_json(next_cursor))
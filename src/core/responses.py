@@ -0,0 +1,19 @@
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class ModelResponse(Response):
+    """JSON response rendered straight from a validated Pydantic model.
+
+    Returning a model from an endpoint makes FastAPI dump it to a dict,
+    validate it again against the return annotation and encode it with
+    jsonable_encoder. Wrapping the model in ModelResponse skips all of that:
+    the model is serialized to bytes once by pydantic-core. The return
+    annotation of the endpoint is still used for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return to_json(content)
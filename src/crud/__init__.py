@@ -5,3 +5,5 @@ from src.crud.students import StudentDAO
 from src.crud.instructor import InstructorDAO
 from src.crud.courses import CourseDAO
 from src.crud.enrollments import EnrollmentDAO
+from src.crud.schedule import ScheduleDAO
+from src.crud.news import NewsDAO
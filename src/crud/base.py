@@ -1,10 +1,65 @@
+import base64
+import binascii
+import json
+import operator
+from datetime import date, datetime
+from enum import Enum
+
 from fastapi import Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import insert, delete, update
+from sqlalchemy import (
+    DateTime,
+    Enum as SQLEnum,
+    Text,
+    case,
+    cast,
+    insert,
+    delete,
+    func,
+    update,
+    tuple_,
+    literal,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.core.db.database import get_async_db
+from src.core.db.database import get_async_db, get_async_read_db
+from src.core.db.unit_of_work import UnitOfWork
+from src.settings import settings
+
+# Lookup suffixes accepted in filter keyword arguments, e.g. year__gte=2020
+FILTER_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda column, values: column.in_(values),
+    "not_in": lambda column, values: column.not_in(values),
+    "is_null": lambda column, flag: column.is_(None) if flag else column.is_not(None),
+}
+
+
+def _encode_cursor_value(value):
+    """Converts a keyset value to a JSON-compatible representation."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_cursor_value(column, value):
+    """Restores a keyset value using the Python type of its column."""
+    python_type = column.type.python_type
+    if issubclass(python_type, Enum):
+        return python_type[value]
+    if issubclass(python_type, (datetime, date)):
+        return python_type.fromisoformat(value)
+    return value
 
 
 class BaseDAO:
@@ -13,11 +68,20 @@ class BaseDAO:
     Requires setting the `model` attribute in child classes.
     Automatically manages sessions through dependency injection.
 
+    Writes commit immediately unless they run inside a UnitOfWork on the
+    same session, which commits them together.
+
+    Filter keyword arguments of the find methods are column names,
+    optionally followed by a lookup from FILTER_OPERATORS:
+    ``find_all(year__gte=2020, semester__in=[...], capacity__is_null=False)``.
+
     Attributes:
         model (DeclarativeBase): SQLAlchemy model for operations
     """
 
     model = None
+    # Constraint name -> message reported instead of the raw database error
+    constraint_errors: dict[str, str] = {}
 
     def __init__(self, session: AsyncSession = Depends(get_async_db)):
         """Initializes DAO with a database session.
@@ -28,6 +92,48 @@ class BaseDAO:
         """
         self.session = session
 
+    @classmethod
+    def read_only(cls, session: AsyncSession = Depends(get_async_read_db)):
+        """Creates a DAO bound to a read replica session.
+
+        Usage: ``dao: UserDAO = Depends(UserDAO.read_only)``
+
+        Args:
+            session (AsyncSession): Read-only session, injected through FastAPI Depends
+
+        Returns:
+            BaseDAO: DAO instance working with a replica
+        """
+        return cls(session)
+
+    async def _commit(self) -> None:
+        """Commits a write unless a unit of work will commit it."""
+        if UnitOfWork.current(self.session) is None:
+            await self.session.commit()
+
+    async def _rollback(self) -> None:
+        """Rolls back a failed write unless a unit of work will roll it back."""
+        if UnitOfWork.current(self.session) is None:
+            await self.session.rollback()
+
+    async def release_connection(self) -> None:
+        """Ends the session's transaction so its connection returns to the pool.
+
+        Call after the reads a request needs before awaiting slow work that
+        does not use the database. Loaded objects stay usable, since sessions
+        do not expire them on commit; the next statement checks a connection
+        out again. Inside a unit of work nothing happens.
+        """
+        await self._commit()
+
+    def _after_commit(self, callback) -> None:
+        """Runs a callback now, or after the unit of work commits if one is active."""
+        uow = UnitOfWork.current(self.session)
+        if uow is None:
+            callback()
+        else:
+            uow.after_commit(callback)
+
     async def add(self, data: dict | BaseModel):
         """Creates a new record in the database.
 
@@ -48,11 +154,45 @@ class BaseDAO:
 
             query = insert(self.model).values(**data).returning(self.model)
             result = await self.session.execute(query)
-            await self.session.commit()
+            await self._commit()
             return result.scalar_one()
         except Exception as e:
-            await self.session.rollback()
-            raise HTTPException(status_code=409, detail=f"Database error: {str(e)}")
+            await self._rollback()
+            raise self._database_error(e)
+
+    async def add_many(self, rows: list[dict | BaseModel]) -> list:
+        """Creates many records in a single transaction.
+
+        Rows are sent as multi-row INSERT ... VALUES ... RETURNING statements
+        (SQLAlchemy "insertmanyvalues" batching) instead of one statement
+        and one commit per record.
+
+        Args:
+            rows (list[dict | BaseModel]): Dictionaries or Pydantic models
+                with data for creation
+
+        Returns:
+            list[model]: Created model instances in the order of ``rows``
+
+        Raises:
+            HTTPException: 409 on database errors; nothing is inserted then
+        """
+        if not rows:
+            return []
+        try:
+            data = [
+                row.model_dump() if isinstance(row, BaseModel) else row for row in rows
+            ]
+            query = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            result = await self.session.execute(query, data)
+            created = result.scalars().all()
+            await self._commit()
+            return created
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
 
     async def find_one(self, **filter_by):
         """Finds one record by given filters.
@@ -64,7 +204,7 @@ class BaseDAO:
         Returns:
             model: Found model object
         """
-        query = select(self.model).filter_by(**filter_by)
+        query = select(self.model).where(*self._filter_clauses(filter_by))
         res = await self.session.execute(query)
         result = res.scalar_one_or_none()
         if not result:
@@ -84,79 +224,514 @@ class BaseDAO:
         Returns:
             model: Found model object or None if not found (for special cases)
         """
-        query = select(self.model).filter_by(**filter_by)
+        query = select(self.model).where(*self._filter_clauses(filter_by))
         res = await self.session.execute(query)
         return res.scalar_one_or_none()
 
-    async def find_all(self, **filter_by):
+    async def find_all(
+        self,
+        *criteria,
+        order_by: str = None,
+        descending: bool = False,
+        limit: int = None,
+        **filter_by,
+    ):
         """Finds all records by given filters.
 
         Args:
+            *criteria: Additional SQLAlchemy WHERE clauses
+                (example: User.id.in_([1, 2]))
+            order_by (str, optional): Column to order by, followed by the
+                primary key; unordered by default
+            descending (bool): Walk the ordering from the largest value
+            limit (int, optional): Maximum number of records to return
             **filter_by: Arguments for WHERE condition
-                (example: is_active=True)
+                (example: is_active=True, id__in=[1, 2])
 
         Returns:
             list[model]: List of found model objects
         """
-        query = select(self.model).filter_by(**filter_by)
+        query = select(self.model).where(*criteria, *self._filter_clauses(filter_by))
+        if order_by is not None:
+            query = query.order_by(
+                *(
+                    c.desc() if descending else c.asc()
+                    for c in self._keyset_columns(order_by)
+                )
+            )
+        if limit is not None:
+            query = query.limit(limit)
         result = await self.session.execute(query)
         return result.scalars().all()
 
-    async def delete(self, model_id: int):
-        """Deletes a record by ID.
+    def _filter_clauses(self, filter_by: dict) -> list:
+        """Turns filter keyword arguments into WHERE clauses.
 
         Args:
-            model_id (int): Record ID to delete
+            filter_by (dict): Column names, optionally with a lookup suffix,
+                mapped to values (example: {"year__gte": 2020})
 
         Returns:
-            bool | None: True if deletion was successful,
-                None if record was not found
+            list[ColumnElement]: WHERE clauses
+
+        Raises:
+            HTTPException: 400 if the model has no such column or the
+                lookup is unknown
         """
-        query = select(self.model).filter_by(id=model_id)
-        result = await self.session.execute(query)
-        if not result.scalar_one_or_none():
+        table = self.model.__table__
+        clauses = []
+        for key, value in filter_by.items():
+            name, _, lookup = key.partition("__")
+            compare = FILTER_OPERATORS.get(lookup or "eq")
+            if name not in table.c or compare is None:
+                raise HTTPException(
+                    status_code=400, detail=f"Cannot filter by unknown field {key}"
+                )
+            clauses.append(compare(table.c[name], value))
+        return clauses
+
+    def _projection_columns(self, fields: list[str]) -> list:
+        """Returns the table columns named by ``fields``.
+
+        Raises:
+            HTTPException: 400 if the model has no such column
+        """
+        table = self.model.__table__
+        unknown = [name for name in fields if name not in table.c]
+        if unknown:
             raise HTTPException(
-                status_code=404,
-                detail=f"{self.model.__name__} with id {model_id} not found",
+                status_code=400,
+                detail=f"Cannot select unknown fields {', '.join(unknown)}",
             )
-        stmt = delete(self.model).where(self.model.id == model_id)
-        await self.session.execute(stmt)
-        await self.session.commit()
+        return [table.c[name] for name in fields]
+
+    def exists(self, *criteria, **filter_by):
+        """Builds an EXISTS condition over the records of this DAO.
+
+        Criteria referring to the model of the enclosing query are
+        correlated with it, which makes the condition a semi-join:
+        ``Student`` rows having an enrollment in a course are found with
+        ``student_dao.find_page(enrollment_dao.exists(
+        Enrollment.student_id == Student.id, course_id=1))``.
 
+        Args:
+            *criteria: SQLAlchemy WHERE clauses, usually joining to the
+                enclosing query
+            **filter_by: Arguments for WHERE condition
+
+        Returns:
+            Exists: Condition to pass as a criterion of another query
+        """
+        return (
+            select(literal_column("1"))
+            .select_from(self.model)
+            .where(*criteria, *self._filter_clauses(filter_by))
+            .exists()
+        )
+
+    def _keyset_columns(self, order_by: str) -> list:
+        """Returns the columns that define a stable keyset ordering.
+
+        The requested column is followed by the primary key columns,
+        which break ties between rows sharing the same value.
+
+        Args:
+            order_by (str): Name of the column to order by
+
+        Returns:
+            list[Column]: Ordering columns
+
+        Raises:
+            HTTPException: 400 if the model has no such column
+        """
+        table = self.model.__table__
+        if order_by not in table.c:
+            raise HTTPException(
+                status_code=400, detail=f"Cannot order by unknown field {order_by}"
+            )
+        column = table.c[order_by]
+        return [column] + [c for c in table.primary_key.columns if c is not column]
+
+    @staticmethod
+    def encode_cursor(values: list) -> str:
+        """Packs keyset values into an opaque URL-safe cursor token."""
+        raw = json.dumps([_encode_cursor_value(v) for v in values]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, columns: list) -> list:
+        """Unpacks a cursor token produced by encode_cursor.
+
+        Raises:
+            HTTPException: 400 if the token is malformed or does not match
+                the ordering columns
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+            if not isinstance(values, list) or len(values) != len(columns):
+                raise ValueError(cursor)
+            return [_decode_cursor_value(c, v) for c, v in zip(columns, values)]
+        except (ValueError, KeyError, TypeError, binascii.Error):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    def _after_cursor(self, columns: list, cursor: str, descending: bool):
+        """Builds the WHERE clause selecting the rows that follow a cursor."""
+        values = self.decode_cursor(cursor, columns)
+        keyset = tuple_(*columns)
+        bound = tuple_(*(literal(v, c.type) for c, v in zip(columns, values)))
+        return keyset < bound if descending else keyset > bound
+
+    async def _fetch_page(
+        self,
+        query,
+        limit: int,
+        cursor: str = None,
+        order_by: str = "id",
+        descending: bool = False,
+        projected: bool = False,
+    ):
+        """Applies keyset pagination to a query whose first entity is the model.
+
+        Args:
+            query (Select): Query selecting the model (optionally with extra columns)
+            limit (int): Page size, capped by settings.PAGE_SIZE_MAX
+            cursor (str, optional): Token returned with the previous page
+            order_by (str): Column to order by, primary key by default
+            descending (bool): Walk the ordering from the largest value
+            projected (bool): The query selects table columns, including the
+                ordering columns, instead of the model
+
+        Returns:
+            tuple[list[Row], str | None]: Page rows and the cursor of the next page
+                (None when this is the last page)
+        """
+        limit = max(1, min(limit, settings.PAGE_SIZE_MAX))
+        columns = self._keyset_columns(order_by)
+
+        if cursor is not None:
+            query = query.where(self._after_cursor(columns, cursor, descending))
+
+        query = query.order_by(
+            *(c.desc() if descending else c.asc() for c in columns)
+        ).limit(limit + 1)
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1] if projected else rows[-1][0]
+            next_cursor = self.encode_cursor([getattr(last, c.key) for c in columns])
+        return rows, next_cursor
+
+    async def find_page(
+        self,
+        *criteria,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        order_by: str = "id",
+        descending: bool = False,
+        fields: list[str] = None,
+        **filter_by,
+    ):
+        """Finds one page of records using keyset (cursor) pagination.
+
+        Every page costs the same regardless of its position, because the
+        cursor is turned into a WHERE condition on the ordering columns
+        instead of an OFFSET.
+
+        With ``fields``, only these columns are selected and the records are
+        returned as plain result rows with attribute access: nothing else is
+        transferred, and no model objects are built or tracked by the session.
+
+        Args:
+            *criteria: Additional SQLAlchemy WHERE clauses
+            limit (int): Page size, capped by settings.PAGE_SIZE_MAX
+            cursor (str, optional): Token returned with the previous page
+            order_by (str): Column to order by, primary key by default
+            descending (bool): Walk the ordering from the largest value
+            fields (list[str], optional): Names of the columns to select;
+                the ordering columns are always selected as well
+            **filter_by: Arguments for WHERE condition
+                (example: is_active=True)
+
+        Returns:
+            tuple[list[model | Row], str | None]: Found model objects, or rows
+                when ``fields`` is given, and the cursor of the next page
+                (None when this is the last page)
+        """
+        projected = fields is not None
+        if projected:
+            columns = self._projection_columns(fields)
+            selected = {c.key for c in columns}
+            columns += [
+                c for c in self._keyset_columns(order_by) if c.key not in selected
+            ]
+            query = select(*columns)
+        else:
+            query = select(self.model)
+        query = query.where(*criteria, *self._filter_clauses(filter_by))
+        rows, next_cursor = await self._fetch_page(
+            query,
+            limit=limit,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+            projected=projected,
+        )
+        if projected:
+            return rows, next_cursor
+        return [row[0] for row in rows], next_cursor
+
+    async def find_page_json(
+        self,
+        *criteria,
+        fields: list[str],
+        expressions: dict = None,
+        joins: list[tuple] = (),
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        order_by: str = "id",
+        descending: bool = False,
+        **filter_by,
+    ) -> tuple[bytes, str | None]:
+        """Finds one page of records rendered to a JSON array by PostgreSQL.
+
+        Works like find_page, but every record is turned into a JSON object
+        with json_build_object and the page is aggregated with json_agg, so
+        the database returns the whole page as one text value. No result rows
+        are decoded and no model objects or DTOs are built; the array is
+        passed on as it is.
+
+        Objects are rendered the way pydantic serializes the corresponding
+        response schema: keys in the order of ``fields``, enum columns as
+        their lower-case member names, i.e. the enum values, and timestamps
+        in ISO 8601. Only the formatting whitespace differs.
+
+        Args:
+            *criteria: Additional SQLAlchemy WHERE clauses
+            fields (list[str]): Keys of the JSON objects; each is a column of
+                the model unless it is given in ``expressions``
+            expressions (dict, optional): Key -> SQL expression for the keys
+                that are not model columns (example: {"group_name": Group.name})
+            joins (list[tuple]): (target, onclause) pairs joined to the model
+                for the expressions
+            limit (int): Page size, capped by settings.PAGE_SIZE_MAX
+            cursor (str, optional): Token returned with the previous page
+            order_by (str): Column to order by, primary key by default
+            descending (bool): Walk the ordering from the largest value
+            **filter_by: Arguments for WHERE condition
+                (example: is_active=True)
+
+        Returns:
+            tuple[bytes, str | None]: JSON array of the page and the cursor of
+                the next page (None when this is the last page)
+
+        Raises:
+            HTTPException: 400 if a field is neither a model column nor
+                an expression
+        """
+        expressions = expressions or {}
+        limit = max(1, min(limit, settings.PAGE_SIZE_MAX))
+        columns = self._keyset_columns(order_by)
+        ordering = [c.desc() if descending else c.asc() for c in columns]
+
+        names = [name for name in fields if name not in expressions]
+        values = dict(zip(names, self._projection_columns(names)), **expressions)
+        item = func.json_build_object(
+            *(
+                part
+                for name in fields
+                for part in (literal(name), self._json_value(values[name]))
+            )
+        )
+
+        query = select(
+            item.label("item"),
+            *(c.label(f"key_{i}") for i, c in enumerate(columns)),
+            func.row_number().over(order_by=ordering).label("position"),
+        ).select_from(self.model)
+        for target, onclause in joins:
+            query = query.join(target, onclause)
+        query = query.where(*criteria, *self._filter_clauses(filter_by))
+        if cursor is not None:
+            query = query.where(self._after_cursor(columns, cursor, descending))
+        page = query.order_by(*ordering).limit(limit + 1).subquery()
+
+        keys = [page.c[f"key_{i}"] for i in range(len(columns))]
+        summary = select(
+            cast(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(page.c.item, page.c.position)
+                    ).filter(page.c.position <= limit),
+                    func.json_build_array(),
+                ),
+                Text,
+            ),
+            cast(
+                func.json_agg(func.json_build_array(*keys)).filter(
+                    page.c.position == limit
+                ),
+                Text,
+            ),
+            func.count() > limit,
+        )
+        result = await self.session.execute(summary)
+        items, last, has_more = result.one()
+
+        next_cursor = None
+        if has_more:
+            next_cursor = self.encode_cursor(json.loads(last)[0])
+        return items.encode(), next_cursor
+
+    @staticmethod
+    def _json_value(expression):
+        """Adapts an expression to its JSON form in the response schemas.
+
+        Enum columns store member names, while responses carry the values,
+        which are the lower-cased names. Timestamps are formatted like
+        datetime.isoformat: PostgreSQL drops trailing zeros of the
+        fractional seconds, pydantic always writes all six digits.
+        """
+        if isinstance(expression.type, SQLEnum):
+            return func.lower(cast(expression, Text))
+        if isinstance(expression.type, DateTime) and not expression.type.timezone:
+            return func.to_char(expression, 'YYYY-MM-DD"T"HH24:MI:SS') + case(
+                (func.date_trunc("second", expression) == expression, ""),
+                else_=func.to_char(expression, ".US"),
+            )
+        return expression
+
+    async def _stream_rows(self, query, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams result rows of a query through a server-side cursor.
+
+        Rows are fetched from the database in batches of ``chunk_size``,
+        so memory usage does not depend on the size of the result.
+
+        Args:
+            query (Select): Query to execute
+            chunk_size (int): Number of rows fetched per round-trip
+
+        Yields:
+            Row: Result rows one by one
+        """
+        result = await self.session.stream(
+            query.execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions():
+            for row in partition:
+                yield row
+
+    async def stream(
+        self, *criteria, chunk_size: int = settings.EXPORT_CHUNK_SIZE, **filter_by
+    ):
+        """Streams all records matching the filters ordered by primary key.
+
+        Unlike find_all, the result is never materialized as a whole:
+        records are read through a server-side cursor in batches.
+
+        Args:
+            *criteria: Additional SQLAlchemy WHERE clauses
+            chunk_size (int): Number of rows fetched per round-trip
+            **filter_by: Arguments for WHERE condition
+                (example: is_active=True)
+
+        Yields:
+            model: Found model objects one by one
+        """
+        query = (
+            select(self.model)
+            .where(*criteria, *self._filter_clauses(filter_by))
+            .order_by(*self.model.__table__.primary_key.columns)
+        )
+        async for row in self._stream_rows(query, chunk_size=chunk_size):
+            yield row[0]
+
+    def _database_error(self, error: Exception) -> HTTPException:
+        """Converts a failed write into a 409 response.
+
+        Violations of constraints listed in ``constraint_errors`` are reported
+        with their message, anything else with the database error text.
+        """
+        text = str(error)
+        for constraint, message in self.constraint_errors.items():
+            if constraint in text:
+                return HTTPException(status_code=409, detail=message)
+        return HTTPException(status_code=409, detail=f"Database error: {text}")
+
+    def _not_found(self, model_id: int) -> HTTPException:
+        return HTTPException(
+            status_code=404,
+            detail=f"{self.model.__name__} with id {model_id} not found",
+        )
+
+    async def delete(self, model_id: int, *criteria):
+        """Deletes a record by ID with a single DELETE ... RETURNING statement.
+
+        Args:
+            model_id (int): Record ID to delete
+            *criteria: Additional SQLAlchemy WHERE clauses the record must match
+                (example: Course.instructor_id == 1)
+
+        Returns:
+            bool: True if deletion was successful
+
+        Raises:
+            HTTPException: 404 if no record with this ID matches the criteria,
+                409 on database errors
+        """
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == model_id, *criteria)
+            .returning(self.model.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            deleted_id = result.scalar_one_or_none()
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
+
+        if deleted_id is None:
+            raise self._not_found(model_id)
+
+        await self._commit()
         return True
 
-    async def update(self, model_id: int, **update_data):
-        """Updates a record by ID.
+    async def update(self, model_id: int, *criteria, **update_data):
+        """Updates a record by ID with a single UPDATE ... RETURNING statement.
 
         Args:
             model_id (int): Record ID to update
+            *criteria: Additional SQLAlchemy WHERE clauses the record must match
+                (example: Course.instructor_id == 1)
             **update_data: Data to update
                 (example: username="new_name")
 
         Returns:
-            model | None: Updated model object
-                or None if record was not found
+            model: Updated model object
+
+        Raises:
+            HTTPException: 404 if no record with this ID matches the criteria,
+                409 on database errors
         """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == model_id, *criteria)
+            .values(**update_data)
+            .returning(self.model)
+        )
         try:
-            query = select(self.model).filter_by(id=model_id)
-            result = await self.session.execute(query)
-            if not result.scalar_one_or_none():
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"{self.model.__name__} with id {model_id} not found",
-                )
-
-            stmt = (
-                update(self.model)
-                .where(self.model.id == model_id)
-                .values(**update_data)
-                .returning(self.model)
-            )
             result = await self.session.execute(stmt)
-            await self.session.commit()
+            updated = result.scalar_one_or_none()
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
 
-            return result.scalars().all()
+        if updated is None:
+            raise self._not_found(model_id)
 
-        except Exception as e:
-            await self.session.rollback()
-            raise HTTPException(status_code=409, detail=f"Database error: {str(e)}")
+        await self._commit()
+        return updated
@@ -1,5 +1,11 @@
+from sqlalchemy import func
+from sqlalchemy.future import select
+
 from src.crud.base import BaseDAO
 from src.models import Course
+from src.settings import settings
+
+SEARCH_CONFIGS = ("russian", "english")
 
 
 class CourseDAO(BaseDAO):
@@ -17,9 +23,69 @@ class CourseDAO(BaseDAO):
                 "instructor_id": 1
             })
         found_course = await course_dao.find_one_or_none(name="Introduction to Programming")
+        found_courses = await course_dao.search(["introduct", "program"])
 
     Attributes:
         model (Course): SQLAlchemy Course model used for operations
     """
 
     model = Course
+    constraint_errors = {
+        "ck_course_capacity": "Capacity is lower than the number of enrolled students",
+    }
+
+    @staticmethod
+    def _search_query(terms: list[str]):
+        """Builds a tsquery matching courses that contain every term as a prefix.
+
+        Each term is stemmed by every configuration of the search vector,
+        so a word matches whichever language it is written in.
+        """
+        tsquery = None
+        for term in terms:
+            term_query = None
+            for config in SEARCH_CONFIGS:
+                config_query = func.to_tsquery(config, f"{term}:*")
+                term_query = (
+                    config_query
+                    if term_query is None
+                    else term_query.op("||")(config_query)
+                )
+            tsquery = term_query if tsquery is None else tsquery.op("&&")(term_query)
+        return tsquery
+
+    async def search(
+        self,
+        terms: list[str],
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        offset: int = 0,
+    ) -> list[Course]:
+        """Finds courses whose title and description contain all terms.
+
+        The match runs on the GIN-indexed search_vector column. Courses are
+        ranked by cover density, title matches weighing more than matches
+        in the description.
+
+        Args:
+            terms (list[str]): Words or word prefixes consisting of letters
+                and digits only
+            limit (int): Page size, capped by settings.PAGE_SIZE_MAX
+            offset (int): Number of courses to skip
+
+        Returns:
+            list[Course]: Found courses, best matches first
+        """
+        if not terms:
+            return []
+
+        tsquery = self._search_query(terms)
+        rank = func.ts_rank_cd(Course.search_vector, tsquery)
+        query = (
+            select(Course)
+            .where(Course.search_vector.op("@@")(tsquery))
+            .order_by(rank.desc(), Course.id)
+            .limit(max(1, min(limit, settings.PAGE_SIZE_MAX)))
+            .offset(offset)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
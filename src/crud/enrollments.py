@@ -1,5 +1,20 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import insert, or_, update
+from sqlalchemy.future import select
+
+from src.core.cache import discard_course_lists
 from src.crud.base import BaseDAO
-from src.models import Enrollment
+from src.models import Course, Enrollment
+from src.models.enum import StatusEnum
+
+# Enrollments holding a seat or a place in the waitlist
+OPEN_STATUSES = (StatusEnum.ACTIVE, StatusEnum.WAITLISTED)
+
+# Course columns returned by seat counter updates, enough to find the
+# cached course lists showing the course
+SEAT_COURSE_COLUMNS = (Course.semester, Course.year, Course.instructor_id)
 
 
 class EnrollmentDAO(BaseDAO):
@@ -8,14 +23,16 @@ class EnrollmentDAO(BaseDAO):
     Inherits basic CRUD operations from BaseDAO and adds
     specialized methods for working with the Enrollment entity.
 
+    Seats are accounted for in Course.enrolled_count. A seat is taken with
+    a single conditional UPDATE of the course row, so concurrent enrollments
+    to one course are serialized by its row lock only and the count never
+    exceeds the capacity. Nothing else is locked: enrollments to other
+    courses proceed in parallel. Cached course lists show the count, so
+    the pages that may contain the course are dropped whenever it changes.
+
     Usage examples:
         enrollment_dao = EnrollmentDAO()
-        new_enrollment = await enrollment_dao.add({
-                "student_id": 1,
-                "course_id": 1,
-                "semester": "Spring",
-                "grade": None
-            })
+        enrollment = await enrollment_dao.enroll(student_id=1, course_id=1)
         found_enrollment = await enrollment_dao.find_one_or_none(
             student_id=1, course_id=1
         )
@@ -25,3 +42,193 @@ class EnrollmentDAO(BaseDAO):
     """
 
     model = Enrollment
+
+    async def _take_seat(self, course_id: int):
+        """Increments the seat counter of a course unless it is full.
+
+        Returns:
+            Row | None: Semester, year and instructor of the course if a seat
+                was taken, None otherwise
+        """
+        stmt = (
+            update(Course)
+            .where(
+                Course.id == course_id,
+                or_(Course.capacity.is_(None), Course.enrolled_count < Course.capacity),
+            )
+            .values(enrolled_count=Course.enrolled_count + 1)
+            .returning(*SEAT_COURSE_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def _release_seat(self, course_id: int):
+        """Decrements the seat counter of a course.
+
+        Returns:
+            Row: Semester, year and instructor of the course
+        """
+        result = await self.session.execute(
+            update(Course)
+            .where(Course.id == course_id)
+            .values(enrolled_count=Course.enrolled_count - 1)
+            .returning(*SEAT_COURSE_COLUMNS)
+        )
+        return result.one()
+
+    async def _find_for_update(self, student_id: int, course_id: int):
+        """Finds an enrollment and locks its row until the end of the transaction."""
+        query = (
+            select(Enrollment)
+            .filter_by(student_id=student_id, course_id=course_id)
+            .with_for_update()
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def promote_waitlisted(self, course_id: int) -> int:
+        """Moves students from the waitlist to free seats in arrival order.
+
+        Called after seats are freed, by a drop or a capacity increase, in the
+        transaction that freed them; commits nothing itself. Waitlist rows
+        locked by concurrent transactions are skipped instead of waited for.
+
+        Args:
+            course_id (int): Course ID
+
+        Returns:
+            int: Number of promoted students
+        """
+        promoted = 0
+        while await self._take_seat(course_id) is not None:
+            query = (
+                select(Enrollment)
+                .filter_by(course_id=course_id, status=StatusEnum.WAITLISTED)
+                .order_by(Enrollment.enrollment_date, Enrollment.student_id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            waiting = (await self.session.execute(query)).scalar_one_or_none()
+            if waiting is None:
+                await self._release_seat(course_id)
+                break
+            await self.session.execute(
+                update(Enrollment)
+                .filter_by(student_id=waiting.student_id, course_id=course_id)
+                .values(status=StatusEnum.ACTIVE)
+            )
+            promoted += 1
+        return promoted
+
+    async def enroll(self, student_id: int, course_id: int) -> Enrollment:
+        """Enrolls a student in a course, or puts them on its waitlist if it is full.
+
+        A previously dropped enrollment is reopened.
+
+        Args:
+            student_id (int): Student ID
+            course_id (int): Course ID
+
+        Returns:
+            Enrollment: Enrollment with status ACTIVE or WAITLISTED
+
+        Raises:
+            HTTPException:
+                404 - If the course is not found
+                409 - If the student is already enrolled, waitlisted or has
+                    completed the course, or on database errors
+        """
+        try:
+            existing = await self._find_for_update(student_id, course_id)
+            if existing is not None and existing.status != StatusEnum.DROPPED:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Enrollment is already {existing.status.value}",
+                )
+
+            course = await self._take_seat(course_id)
+            if course is None:
+                # Join the waitlist holding the course row, so that a concurrent
+                # drop either frees its seat before the retry below or sees
+                # this enrollment when it looks for someone to promote
+                locked = await self.session.execute(
+                    select(Course.id).where(Course.id == course_id).with_for_update()
+                )
+                if locked.scalar_one_or_none() is None:
+                    raise HTTPException(
+                        status_code=404, detail=f"Course with id {course_id} not found"
+                    )
+                course = await self._take_seat(course_id)
+            status = StatusEnum.WAITLISTED if course is None else StatusEnum.ACTIVE
+
+            values = {"status": status, "enrollment_date": datetime.utcnow()}
+            if existing is None:
+                stmt = insert(Enrollment).values(
+                    student_id=student_id, course_id=course_id, **values
+                )
+            else:
+                stmt = (
+                    update(Enrollment)
+                    .filter_by(student_id=student_id, course_id=course_id)
+                    .values(**values)
+                )
+            result = await self.session.execute(stmt.returning(Enrollment))
+            enrollment = result.scalar_one()
+            await self._commit()
+            if course is not None:
+                self._after_commit(lambda: discard_course_lists(course))
+            return enrollment
+        except HTTPException:
+            await self._rollback()
+            raise
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
+
+    async def drop(self, student_id: int, course_id: int) -> Enrollment:
+        """Drops an active or waitlisted enrollment.
+
+        A freed seat is given to the first student on the waitlist.
+
+        Args:
+            student_id (int): Student ID
+            course_id (int): Course ID
+
+        Returns:
+            Enrollment: Enrollment with status DROPPED
+
+        Raises:
+            HTTPException: 404 if there is no active or waitlisted enrollment,
+                409 on database errors
+        """
+        try:
+            existing = await self._find_for_update(student_id, course_id)
+            if existing is None or existing.status not in OPEN_STATUSES:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Student {student_id} is not enrolled in course {course_id}",
+                )
+            held_seat = existing.status == StatusEnum.ACTIVE
+
+            result = await self.session.execute(
+                update(Enrollment)
+                .filter_by(student_id=student_id, course_id=course_id)
+                .values(status=StatusEnum.DROPPED)
+                .returning(Enrollment)
+            )
+            enrollment = result.scalar_one()
+
+            if held_seat:
+                course = await self._release_seat(course_id)
+                await self.promote_waitlisted(course_id)
+
+            await self._commit()
+            if held_seat:
+                self._after_commit(lambda: discard_course_lists(course))
+            return enrollment
+        except HTTPException:
+            await self._rollback()
+            raise
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
@@ -0,0 +1,29 @@
+from src.crud.base import BaseDAO
+from src.models import NewsEvent
+
+
+class NewsDAO(BaseDAO):
+    """Data Access Object (DAO) for managing news and events in the database.
+
+    Inherits basic CRUD operations from BaseDAO and adds
+    specialized methods for working with the NewsEvent entity.
+
+    Usage examples:
+        news_dao = NewsDAO()
+        news = await news_dao.add({
+                "title": "Open day",
+                "content": "Everyone is welcome",
+                "publish_date": datetime.utcnow(),
+                "author_id": 1,
+                "type": TypeEnum.EVENT,
+                "event_date": datetime(2026, 11, 1, 12, 0)
+            })
+        feed, next_cursor = await news_dao.find_page(
+            order_by="publish_date", descending=True
+        )
+
+    Attributes:
+        model (NewsEvent): SQLAlchemy NewsEvent model used for operations
+    """
+
+    model = NewsEvent
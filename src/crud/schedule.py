@@ -1,3 +1,8 @@
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.future import select
+
 from src.crud.base import BaseDAO
 from src.models import Schedule
 
@@ -8,18 +13,21 @@ class ScheduleDAO(BaseDAO):
     Inherits basic CRUD operations from BaseDAO and adds
     specialized methods for working with the Schedule entity.
 
+    Overlapping lessons in one classroom or for one instructor are rejected
+    by exclusion constraints of the schedule table and reported as 409.
+
     Usage examples:
         schedule_dao = ScheduleDAO()
-        new_schedule = await schedule_dao.add({
+        new_lesson = await schedule_dao.add({
                 "course_id": 1,
-                "group_id": 1,
-                "day_of_week": "Monday",
-                "start_time": "09:00",
-                "end_time": "10:30",
-                "room": "101"
+                "instructor_id": 1,
+                "start_time": datetime(2026, 9, 1, 9, 0),
+                "end_time": datetime(2026, 9, 1, 10, 30),
+                "classroom": "101",
+                "lesson_type": LessonTypeEnum.LECTURE
             })
-        found_schedule = await schedule_dao.find_one_or_none(
-            course_id=1, group_id=1, day_of_week="Monday"
+        lessons = await schedule_dao.find_overlapping(
+            datetime(2026, 9, 1), datetime(2026, 9, 8), classroom="101"
         )
 
     Attributes:
@@ -27,3 +35,38 @@ class ScheduleDAO(BaseDAO):
     """
 
     model = Schedule
+    constraint_errors = {
+        "ex_schedule_classroom_overlap": "Classroom is already booked for this time",
+        "ex_schedule_instructor_overlap": "Instructor already has a lesson at this time",
+        "ck_schedule_time_order": "Lesson must end after it starts",
+    }
+
+    async def find_overlapping(
+        self, start_time: datetime, end_time: datetime, **filter_by
+    ) -> list[Schedule]:
+        """Finds lessons overlapping the half-open interval [start_time, end_time).
+
+        The condition is written as a range overlap on
+        tsrange(start_time, end_time), the expression indexed by the exclusion
+        constraints, so the lookup is an index scan rather than a table scan.
+
+        Args:
+            start_time (datetime): Interval start
+            end_time (datetime): Interval end
+            **filter_by: Arguments for WHERE condition
+                (example: classroom="101")
+
+        Returns:
+            list[Schedule]: Lessons ordered by start time
+        """
+        lesson_range = func.tsrange(Schedule.start_time, Schedule.end_time)
+        query = (
+            select(Schedule)
+            .where(
+                lesson_range.op("&&")(func.tsrange(start_time, end_time)),
+                *self._filter_clauses(filter_by),
+            )
+            .order_by(Schedule.start_time, Schedule.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
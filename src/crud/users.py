@@ -1,5 +1,9 @@
+from sqlalchemy import update
+
+from src.core.cache import user_cache
 from src.crud.base import BaseDAO
 from src.models import User
+from src.models.enum import UserRoleEnum
 
 
 class UserDAO(BaseDAO):
@@ -16,8 +20,76 @@ class UserDAO(BaseDAO):
             })
         found_user = await user_dao.find_one_or_none(username="john_doe")
 
+    Every write goes through user_cache invalidation, so changes such as
+    deactivation or a new role are visible to get_current_user as soon as
+    they are committed.
+
     Attributes:
         model (User): SQLAlchemy User model used for operations
     """
 
     model = User
+
+    async def update(self, model_id: int, *criteria, **update_data):
+        """Updates a user by ID and evicts them from the user cache.
+
+        Args:
+            model_id (int): User ID to update
+            *criteria: Additional SQLAlchemy WHERE clauses
+            **update_data: Data to update
+                (example: is_active=False)
+
+        Returns:
+            User: Updated user object
+        """
+        user = await super().update(model_id, *criteria, **update_data)
+        username = user.username
+        self._after_commit(lambda: user_cache.pop(username))
+        return user
+
+    async def delete(self, model_id: int, *criteria):
+        """Deletes a user by ID and clears the user cache.
+
+        Args:
+            model_id (int): User ID to delete
+            *criteria: Additional SQLAlchemy WHERE clauses
+
+        Returns:
+            bool: True if deletion was successful
+        """
+        result = await super().delete(model_id, *criteria)
+        self._after_commit(user_cache.clear)
+        return result
+
+    async def set_role(self, user_ids: list[int], user_role: UserRoleEnum) -> int:
+        """Assigns a role to many users with a single UPDATE statement.
+
+        Args:
+            user_ids (list[int]): IDs of users to update
+            user_role (UserRoleEnum): Role to assign
+
+        Returns:
+            int: Number of updated users
+        """
+        if not user_ids:
+            return 0
+        try:
+            stmt = (
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(user_role=user_role)
+                .returning(User.username)
+            )
+            result = await self.session.execute(stmt)
+            usernames = result.scalars().all()
+            await self._commit()
+        except Exception as e:
+            await self._rollback()
+            raise self._database_error(e)
+
+        def evict() -> None:
+            for username in usernames:
+                user_cache.pop(username)
+
+        self._after_commit(evict)
+        return len(usernames)
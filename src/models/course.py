@@ -1,14 +1,34 @@
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import CheckConstraint, Computed, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models import Base
 from src.models.enum import SemesterEnum, StatusEnum, LessonTypeEnum
 
+# Course titles and descriptions are written in Russian or English, so both
+# stemmers are applied; title words rank higher than description words
+COURSE_SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
 
 class Course(Base):
     __tablename__ = "course"
+    __table_args__ = (
+        Index("ix_course_year_semester", "year", "semester"),
+        Index("ix_course_semester_id", "semester", "id"),
+        Index("ix_course_search_vector", "search_vector", postgresql_using="gin"),
+        CheckConstraint(
+            "capacity IS NULL OR enrolled_count <= capacity",
+            name="ck_course_capacity",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(nullable=False)
@@ -16,14 +36,36 @@ class Course(Base):
     course_code: Mapped[str] = mapped_column(nullable=False)
     credits: Mapped[int] = mapped_column(nullable=False)
     instructor_id: Mapped[int] = mapped_column(
-        ForeignKey("instructor.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("instructor.id", ondelete="CASCADE"), nullable=False, index=True
     )
     semester: Mapped[SemesterEnum] = mapped_column(nullable=False)
     year: Mapped[int] = mapped_column(nullable=False)
+    # Maximum number of active enrollments, None for unlimited
+    capacity: Mapped[Optional[int]] = mapped_column(nullable=True)
+    # Number of active enrollments, maintained by EnrollmentService
+    enrolled_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    # Full-text search document, generated by the database and never loaded
+    # with the course
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(COURSE_SEARCH_VECTOR, persisted=True), deferred=True
+    )
 
 
 class Enrollment(Base):
     __tablename__ = "enrollment"
+    __table_args__ = (
+        Index("ix_enrollment_course_id_status", "course_id", "status"),
+        Index("ix_enrollment_status_student_id", "status", "student_id"),
+        # Waitlist of a course in arrival order
+        Index(
+            "ix_enrollment_waitlist",
+            "course_id",
+            "enrollment_date",
+            postgresql_where=text("status = 'WAITLISTED'"),
+        ),
+    )
 
     student_id: Mapped[int] = mapped_column(ForeignKey("student.id"), primary_key=True)
     course_id: Mapped[int] = mapped_column(ForeignKey("course.id"), primary_key=True)
@@ -33,9 +75,30 @@ class Enrollment(Base):
 
 class Schedule(Base):
     __tablename__ = "schedule"
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="ck_schedule_time_order"),
+        # No two lessons may overlap in one classroom or for one instructor.
+        # The GiST indexes behind the constraints also serve timetable queries.
+        ExcludeConstraint(
+            ("classroom", "="),
+            (text("tsrange(start_time, end_time)"), "&&"),
+            name="ex_schedule_classroom_overlap",
+            using="gist",
+        ),
+        ExcludeConstraint(
+            ("instructor_id", "="),
+            (text("tsrange(start_time, end_time)"), "&&"),
+            name="ex_schedule_instructor_overlap",
+            using="gist",
+        ),
+        Index("ix_schedule_course_id_start_time", "course_id", "start_time"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     course_id: Mapped[int] = mapped_column(ForeignKey("course.id"), primary_key=True)
+    instructor_id: Mapped[int] = mapped_column(
+        ForeignKey("instructor.id"), nullable=False
+    )
     start_time: Mapped[datetime] = mapped_column(nullable=False)
     end_time: Mapped[datetime] = mapped_column(nullable=False)
     classroom: Mapped[str] = mapped_column(nullable=False)
@@ -21,9 +21,15 @@ class StatusEnum(Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
     DROPPED = "dropped"
+    WAITLISTED = "waitlisted"
 
 
 class LessonTypeEnum(Enum):
     LECTURE = "lecture"
     PRACTICE = "practice"
     LAB = "lab"
+
+
+class ExportFormatEnum(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
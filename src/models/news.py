@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import func, ForeignKey
+from sqlalchemy import func, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models import Base
@@ -9,6 +9,12 @@ from src.models.enum import TypeEnum
 
 class NewsEvent(Base):
     __tablename__ = "news_event"
+    __table_args__ = (
+        # Feed pages are keyset scans newest-first, optionally by type
+        Index("ix_news_event_publish_date_id", "publish_date", "id"),
+        Index("ix_news_event_type_publish_date_id", "type", "publish_date", "id"),
+        Index("ix_news_event_event_date", "event_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(nullable=False)
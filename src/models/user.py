@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import mapped_column, Mapped
 from src.models.base import Base
 from datetime import datetime
@@ -24,16 +24,20 @@ class User(Base):
 
 class Student(Base):
     __tablename__ = "student"
+    __table_args__ = (
+        Index("ix_student_group_id_enrollment_year", "group_id", "enrollment_year"),
+        Index("ix_student_faculty_id_enrollment_year", "faculty_id", "enrollment_year"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
     )
     student_number: Mapped[str] = mapped_column(nullable=False)
     group_id: Mapped[int] = mapped_column(
         ForeignKey("group.id", ondelete="CASCADE"), nullable=False
     )
-    enrollment_year: Mapped[int] = mapped_column(nullable=False)
+    enrollment_year: Mapped[int] = mapped_column(nullable=False, index=True)
     faculty_id: Mapped[int] = mapped_column(
         ForeignKey("faculty.id", ondelete="CASCADE"), nullable=False
     )
@@ -43,8 +47,8 @@ class Instructor(Base):
     __tablename__ = "instructor"
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
     )
     position: Mapped[str] = mapped_column(nullable=False)
-    department: Mapped[str] = mapped_column(nullable=False)
+    department: Mapped[str] = mapped_column(nullable=False, index=True)
     academic_degree: Mapped[str] = mapped_column(nullable=False)
@@ -6,6 +6,12 @@ from src.routers.faculty import router as faculty
 from src.routers.students import router as students
 from src.routers.instructors import router as instructors
 from src.routers.course import router as course
+from src.routers.schedule import router as schedule
+from src.routers.enrollments import router as enrollments
+from src.routers.news import router as news
+from src.routers.export import router as export
+from src.routers.admin import router as admin
+from src.routers.metrics import router as metrics_router
 
 router = APIRouter(prefix="/api")
 router.include_router(auth, prefix="/auth", tags=["Authorization"])
@@ -15,3 +21,8 @@ router.include_router(faculty, prefix="/faculty", tags=["Faculty"])
 router.include_router(students, prefix="/students", tags=["Students"])
 router.include_router(instructors, prefix="/instructors", tags=["Instructors"])
 router.include_router(course, prefix="/course", tags=["Course"])
+router.include_router(schedule, prefix="/schedule", tags=["Schedule"])
+router.include_router(enrollments, prefix="/enrollments", tags=["Enrollments"])
+router.include_router(news, prefix="/news", tags=["News"])
+router.include_router(export, prefix="/export", tags=["Export"])
+router.include_router(admin, prefix="/admin", tags=["Admin"])
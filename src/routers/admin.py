@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+
+from src.core.db.database import engine, read_engines
+from src.core.db.pool import pool_status
+from src.core.dependencies import get_admin_user
+from src.models import User
+from src.schemas import DatabasePoolsResponse, PoolStatus
+
+router = APIRouter()
+
+
+@router.get("/db/pools", summary="Database connection pool status")
+async def get_pool_status(
+    user: User = Depends(get_admin_user),
+) -> DatabasePoolsResponse:
+    """Reports connection pool usage of this worker.
+
+    Args:
+        user (User): Authorized administrator
+
+    Returns:
+        DatabasePoolsResponse: Occupancy and checkout counters of the primary
+            and replica pools
+
+    Raises:
+        HTTPException: 403 if user is not an administrator
+    """
+    pools = [PoolStatus(role="primary", **pool_status(engine))]
+    pools.extend(
+        PoolStatus(role="replica", **pool_status(read_engine))
+        for read_engine in read_engines
+        if read_engine is not engine
+    )
+    return DatabasePoolsResponse(pools=pools)
@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Response, Cookie
 from src.crud import UserDAO
 from src.schemas import AuthResponse, CreateUserRequest, CreateUserResponse
-from src.service.auth import AuthService, pwd_context
+from src.service.auth import AuthService, password_hasher
 from src.settings import settings
 
 router = APIRouter()
@@ -23,13 +23,17 @@ async def register_user(
         CreateUserResponse: Created user
 
     Raises:
-        HTTPException: 400 if user already exists
+        HTTPException:
+            400 if user already exists
+            503 if too many password hashing requests are pending
     """
     existing_user = await db_user.find_one_or_none(username=user.username)
 
     if existing_user:
         raise HTTPException(status_code=400, detail="User is already registered")
-    user.password = pwd_context.hash(user.password)
+    # Hashing may wait in the hasher queue, which must not hold a pool connection
+    await db_user.release_connection()
+    user.password = await password_hasher.hash(user.password)
     user = await db_user.add(user)
 
     return CreateUserResponse(
@@ -62,11 +66,15 @@ async def login(
         AuthResponse: Access and refresh tokens
 
     Raises:
-        HTTPException: 401 for invalid credentials
+        HTTPException:
+            401 for invalid credentials
+            503 if too many password hashing requests are pending
     """
     user = await db_user.find_one(username=username)
+    # Verification may wait in the hasher queue, which must not hold a pool connection
+    await db_user.release_connection()
 
-    if not user or not pwd_context.verify(password, user.password):
+    if not user or not await password_hasher.verify(password, user.password):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     tokens = AuthService.generate_tokens(user)
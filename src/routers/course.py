@@ -1,12 +1,14 @@
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from fastapi import APIRouter, Depends
-
-from src.core.dependencies import get_admin_or_instructor_user
+from src.core.dependencies import get_admin_or_instructor_user, read_only
+from src.core.etag import conditional_response
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
 from src.service import CourseService
 from src.models import User
 from src.models.enum import SemesterEnum
-from src.schemas import CreateCourseRequest, CourseInfo, UpdateCourseRequest
+from src.schemas import CreateCourseRequest, CourseInfo, UpdateCourseRequest, Page
+from src.settings import settings
 
 router = APIRouter()
 
@@ -34,15 +36,43 @@ async def create_course(
     return result
 
 
+@router.get("/search", summary="Search courses")
+async def search_courses(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    offset: int = Query(0, ge=0),
+    course_service: CourseService = Depends(read_only(CourseService)),
+) -> list[CourseInfo]:
+    """Searches courses by words of their title and description.
+
+    Words may be given in Russian or English and match as prefixes.
+
+    Args:
+        q (str): Search query
+        limit (int): Page size
+        offset (int): Number of courses to skip
+        course_service (CourseService): Service for working with courses
+
+    Returns:
+        list[CourseInfo]: Found courses, best matches first
+    """
+    result = await course_service.search_courses(query=q, limit=limit, offset=offset)
+    return ModelResponse(result)
+
+
 @router.get("/{id}", summary="Get course details by ID")
 async def get_course(
     course_id: int,
-    course_service: CourseService = Depends(CourseService),
+    request: Request,
+    course_service: CourseService = Depends(read_only(CourseService)),
 ) -> CourseInfo:
     """Gets course information by its ID.
 
+    The response carries an ETag; a matching If-None-Match gets 304.
+
     Args:
         course_id (int): Unique course identifier
+        request (Request): Incoming request
         course_service (CourseService): Service for working with courses
 
     Returns:
@@ -52,27 +82,44 @@ async def get_course(
         HTTPException: 404 if course is not found
     """
     result = await course_service.get_course(course_id=course_id)
-    return result
+    return conditional_response(request, result, public=True)
 
 
 @router.get("", summary="Get filtered courses")
 async def get_courses(
     semester: SemesterEnum = None,
     year: int = None,
-    course_service: CourseService = Depends(CourseService),
-) -> List[CourseInfo]:
-    """Returns a filtered list of courses.
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    db_json: bool = False,
+    course_service: CourseService = Depends(read_only(CourseService)),
+) -> Page[CourseInfo]:
+    """Returns a filtered page of courses.
+
+    Pages are served from an in-process cache of serialized responses.
 
     Args:
         semester (SemesterEnum, optional): Filter by semester
         year (int, optional): Filter by year
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        db_json (bool): Let the database render the page to JSON
         course_service (CourseService): Service for working with courses
 
     Returns:
-        List[CourseInfo]: List of courses matching the filters
+        Page[CourseInfo]: Courses matching the filters and the next page cursor
     """
-    result = await course_service.get_courses(semester=semester, year=year)
-    return result
+    content = await course_service.get_courses_json(
+        semester=semester,
+        year=year,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, CourseInfo),
+        db_json=db_json,
+    )
+    return Response(content, media_type="application/json")
 
 
 @router.put("/{id}", summary="Update course")
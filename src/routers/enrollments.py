@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.core.dependencies import (
+    get_admin_or_instructor_user,
+    get_current_user,
+    read_only,
+)
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
+from src.models import User
+from src.models.enum import StatusEnum
+from src.schemas import EnrollRequest, EnrollmentInfo, Page
+from src.service import EnrollmentService
+from src.settings import settings
+
+router = APIRouter()
+
+
+@router.post("", summary="Enroll in a course")
+async def enroll(
+    enroll_data: EnrollRequest,
+    enrollment_service: EnrollmentService = Depends(EnrollmentService),
+    user: User = Depends(get_current_user),
+) -> EnrollmentInfo:
+    """Enrolls a student in a course.
+
+    If the course is full, the student is put on its waitlist
+    and the enrollment is returned with status WAITLISTED.
+
+    Args:
+        enroll_data (EnrollRequest): Course and, for administrators, student
+        enrollment_service (EnrollmentService): Service for working with enrollments
+        user (User): Authorized student or administrator
+
+    Returns:
+        EnrollmentInfo: Created enrollment
+
+    Raises:
+        HTTPException:
+            403 if user may not enroll this student
+            404 if student or course is not found
+            409 if student is already enrolled in the course
+    """
+    result = await enrollment_service.enroll(enroll_data=enroll_data, user=user)
+    return result
+
+
+@router.delete("/{course_id}", summary="Drop a course")
+async def drop(
+    course_id: int,
+    student_id: int = None,
+    enrollment_service: EnrollmentService = Depends(EnrollmentService),
+    user: User = Depends(get_current_user),
+) -> EnrollmentInfo:
+    """Drops an enrollment; the freed seat goes to the first waitlisted student.
+
+    Args:
+        course_id (int): Course ID
+        student_id (int, optional): Student ID, required for administrators
+        enrollment_service (EnrollmentService): Service for working with enrollments
+        user (User): Authorized student or administrator
+
+    Returns:
+        EnrollmentInfo: Dropped enrollment
+
+    Raises:
+        HTTPException:
+            403 if user may not manage this student
+            404 if student is not enrolled in the course
+    """
+    result = await enrollment_service.drop(
+        course_id=course_id, user=user, student_id=student_id
+    )
+    return result
+
+
+@router.get("/course/{course_id}", summary="Get enrollments of a course")
+async def get_course_enrollments(
+    course_id: int,
+    status: StatusEnum = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    enrollment_service: EnrollmentService = Depends(read_only(EnrollmentService)),
+    user: User = Depends(get_admin_or_instructor_user),
+) -> Page[EnrollmentInfo]:
+    """Returns a page of enrollments of a course.
+
+    Args:
+        course_id (int): Course ID
+        status (StatusEnum, optional): Filter by enrollment status
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        enrollment_service (EnrollmentService): Service for working with enrollments
+        user (User): Authorized administrator or instructor of the course
+
+    Returns:
+        Page[EnrollmentInfo]: Enrollments and the next page cursor
+
+    Raises:
+        HTTPException: 403 if the course belongs to another instructor
+    """
+    result = await enrollment_service.get_course_enrollments(
+        course_id=course_id,
+        user=user,
+        status=status,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, EnrollmentInfo),
+    )
+    return ModelResponse(result)
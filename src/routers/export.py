@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from src.core.dependencies import get_admin_user
+from src.models import User
+from src.models.enum import ExportFormatEnum
+from src.service.export import ExportService
+
+router = APIRouter()
+
+
+def _streaming_response(body, export_format: ExportFormatEnum, name: str):
+    """Wraps an export body into a downloadable streaming response."""
+    return StreamingResponse(
+        body,
+        media_type=ExportService.MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'
+        },
+    )
+
+
+@router.get("/students", summary="Export all students")
+async def export_students(
+    export_format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+    user: User = Depends(get_admin_user),
+) -> StreamingResponse:
+    """Streams all students as NDJSON or CSV.
+
+    Args:
+        export_format (ExportFormatEnum): Output format
+        user (User): Authorized administrator
+
+    Returns:
+        StreamingResponse: Students with their group and faculty names
+
+    Raises:
+        HTTPException: 403 if user is not an administrator
+    """
+    body = ExportService.export_students(export_format)
+    return _streaming_response(body, export_format, "students")
+
+
+@router.get("/users", summary="Export all users")
+async def export_users(
+    export_format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+    user: User = Depends(get_admin_user),
+) -> StreamingResponse:
+    """Streams all users as NDJSON or CSV.
+
+    Args:
+        export_format (ExportFormatEnum): Output format
+        user (User): Authorized administrator
+
+    Returns:
+        StreamingResponse: Users without password hashes
+
+    Raises:
+        HTTPException: 403 if user is not an administrator
+    """
+    body = ExportService.export_users(export_format)
+    return _streaming_response(body, export_format, "users")
+
+
+@router.get("/enrollments", summary="Export course enrollments")
+async def export_enrollments(
+    export_format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+    course_id: int = None,
+    user: User = Depends(get_admin_user),
+) -> StreamingResponse:
+    """Streams course enrollments as NDJSON or CSV.
+
+    Args:
+        export_format (ExportFormatEnum): Output format
+        course_id (int, optional): Export only enrollments of this course
+        user (User): Authorized administrator
+
+    Returns:
+        StreamingResponse: Enrollments
+
+    Raises:
+        HTTPException: 403 if user is not an administrator
+    """
+    body = ExportService.export_enrollments(export_format, course_id=course_id)
+    return _streaming_response(body, export_format, "enrollments")
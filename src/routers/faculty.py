@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
 
+from src.core.cache import faculty_names
 from src.core.dependencies import get_admin_user
 from src.crud import FacultyDAO
 from src.models import User
@@ -28,6 +29,7 @@ async def create_faculty(
         HTTPException: 403 if user is not an administrator
     """
     faculty = await db_faculty.add({"name": name})
+    faculty_names.set(faculty.id, faculty.name)
 
     return CreateFacultyResponse(id=faculty.id, name=faculty.name)
 
@@ -54,4 +56,5 @@ async def delete_faculty(
             404 if faculty is not found
     """
     faculty = await db_faculty.delete(model_id=faculty_id)
+    faculty_names.discard(faculty_id)
     return faculty
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
 
+from src.core.cache import group_names
 from src.core.dependencies import get_admin_user
 from src.crud import GroupDAO
 from src.models import User
@@ -28,6 +29,7 @@ async def create_group(
         HTTPException: 403 if user is not an administrator
     """
     group = await db_group.add({"name": name})
+    group_names.set(group.id, group.name)
 
     return CreateGroupResponse(id=group.id, name=group.name)
 
@@ -54,4 +56,5 @@ async def delete_group(
             404 if group is not found
     """
     group = await db_group.delete(model_id=group_id)
+    group_names.discard(group_id)
     return group
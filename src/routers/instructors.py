@@ -1,11 +1,13 @@
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request
 
-from fastapi import APIRouter, Depends
-
-from src.core.dependencies import get_admin_user
+from src.core.dependencies import get_admin_user, read_only
+from src.core.etag import conditional_response
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
 from src.service import InstructorService
 from src.models import User
-from src.schemas import CreateInstructorRequest, InstructorInfo
+from src.schemas import CreateInstructorRequest, InstructorInfo, Page
+from src.settings import settings
 
 router = APIRouter()
 
@@ -36,12 +38,16 @@ async def add_student(
 @router.get("/{id}", summary="Get instructor data")
 async def get_instructor(
     instructor_id: int,
-    instructor_service: InstructorService = Depends(InstructorService),
+    request: Request,
+    instructor_service: InstructorService = Depends(read_only(InstructorService)),
 ) -> InstructorInfo:
     """Gets instructor information by their ID.
 
+    The response carries an ETag; a matching If-None-Match gets 304.
+
     Args:
         instructor_id (int): Unique instructor identifier
+        request (Request): Incoming request
         instructor_service (InstructorService): Service for working with instructors
 
     Returns:
@@ -51,26 +57,36 @@ async def get_instructor(
         HTTPException: 404 if instructor is not found
     """
     result = await instructor_service.get_instructor(instructor_id=instructor_id)
-    return result
+    return conditional_response(request, result, public=True)
 
 
 @router.get("", summary="Get instructors by filters")
 async def get_instructors(
     department: str = None,
     course_id: int = None,
-    instructor_service: InstructorService = Depends(InstructorService),
-) -> List[InstructorInfo]:
-    """Returns a filtered list of instructors.
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    instructor_service: InstructorService = Depends(read_only(InstructorService)),
+) -> Page[InstructorInfo]:
+    """Returns a filtered page of instructors.
 
     Args:
         department (str, optional): Filter by department
         course_id (int, optional): Filter by course ID that the instructor teaches
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
         instructor_service (InstructorService): Service for working with instructors
 
     Returns:
-        List[InstructorInfo]: List of instructors matching the filters
+        Page[InstructorInfo]: Instructors matching the filters and the next page cursor
     """
     result = await instructor_service.get_instructors(
-        department=department, course_id=course_id
+        department=department,
+        course_id=course_id,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, InstructorInfo),
     )
-    return result
+    return ModelResponse(result)
@@ -0,0 +1,108 @@
+from ipaddress import ip_address, ip_network
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from src.core.cache import course_list_cache, news_feed_cache, user_cache
+from src.core.db.database import engine, read_engines
+from src.core.db.pool import pool_status
+from src.core.metrics import metric_lines, request_metrics
+from src.service.auth import password_hasher
+from src.settings import settings
+
+router = APIRouter()
+
+CACHES = {
+    "course_list": course_list_cache,
+    "news_feed": news_feed_cache,
+    "user": user_cache,
+}
+
+
+ALLOWED_NETWORKS = [ip_network(net) for net in settings.METRICS_ALLOWED_NETWORKS]
+
+
+def _check_client(request: Request) -> None:
+    """Rejects clients outside settings.METRICS_ALLOWED_NETWORKS.
+
+    Raises:
+        HTTPException: 403 if the client address is not allowed
+    """
+    try:
+        client = ip_address(request.client.host)
+    except (AttributeError, ValueError):
+        client = None
+    if client is None or not any(client in network for network in ALLOWED_NETWORKS):
+        raise HTTPException(status_code=403, detail="Metrics are not available")
+
+
+def _pool_samples(key: str) -> list:
+    """Returns one pool_status value of every engine labelled by pool role."""
+    samples = [({"pool": "primary"}, pool_status(engine)[key])]
+    samples.extend(
+        ({"pool": f"replica{number}"}, pool_status(read_engine)[key])
+        for number, read_engine in enumerate(read_engines)
+        if read_engine is not engine
+    )
+    return samples
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request) -> PlainTextResponse:
+    """Reports runtime metrics of this worker in the Prometheus text format.
+
+    Only clients from settings.METRICS_ALLOWED_NETWORKS, the local host by
+    default, may read the metrics. Behind a reverse proxy the client address
+    is the proxy's, so the proxy must not forward /metrics from outside.
+
+    Args:
+        request (Request): Incoming request
+
+    Returns:
+        PlainTextResponse: Request latency and status counters, connection
+            pool usage, cache hit rates and password hashing queue depth
+
+    Raises:
+        HTTPException: 403 if the client address is not allowed
+    """
+    _check_client(request)
+    lines = request_metrics.render()
+    for key, kind, description in (
+        ("size", "gauge", "Configured connection pool size"),
+        ("checked_out", "gauge", "Connections in use"),
+        ("idle", "gauge", "Idle connections in the pool"),
+        ("overflow", "gauge", "Connections opened above the pool size"),
+        ("checkouts", "counter", "Connection checkouts"),
+        ("timeouts", "counter", "Connection checkouts that timed out"),
+    ):
+        suffix = "_total" if kind == "counter" else ""
+        lines += metric_lines(
+            f"db_pool_{key}{suffix}", kind, description, _pool_samples(key)
+        )
+    for attribute, kind, description in (
+        ("hits", "counter", "Cache lookups that found an entry"),
+        ("misses", "counter", "Cache lookups that found nothing"),
+        ("entries", "gauge", "Entries stored in the cache"),
+    ):
+        suffix = "_total" if kind == "counter" else ""
+        lines += metric_lines(
+            f"cache_{attribute}{suffix}",
+            kind,
+            description,
+            [
+                (
+                    {"cache": name},
+                    len(cache) if attribute == "entries" else getattr(cache, attribute),
+                )
+                for name, cache in CACHES.items()
+            ],
+        )
+    lines += metric_lines(
+        "password_hash_pending",
+        "gauge",
+        "Password hashing calls running or queued",
+        [({}, password_hasher.pending)],
+    )
+    return PlainTextResponse(
+        "\n".join(lines) + "\n", media_type="text/plain; version=0.0.4"
+    )
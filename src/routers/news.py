@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.core.dependencies import get_admin_or_instructor_user, read_only
+from src.core.projection import parse_fields
+from src.models import User
+from src.models.enum import TypeEnum
+from src.schemas import NewsInfo, Page, PublishNewsRequest
+from src.service import NewsService
+from src.settings import settings
+
+router = APIRouter()
+
+
+@router.post("", summary="Publish news or event")
+async def publish(
+    news_data: PublishNewsRequest,
+    news_service: NewsService = Depends(NewsService),
+    user: User = Depends(get_admin_or_instructor_user),
+) -> NewsInfo:
+    """Publishes a news item or an event.
+
+    Args:
+        news_data (PublishNewsRequest): Data of the publication
+        news_service (NewsService): Service for working with news
+        user (User): Authorized administrator or instructor
+
+    Returns:
+        NewsInfo: Published news item or event
+
+    Raises:
+        HTTPException:
+            403 if user does not have permission to publish
+            422 if an event has no event date
+    """
+    result = await news_service.publish(news_data=news_data, user=user)
+    return result
+
+
+@router.get("", summary="Get news feed")
+async def get_feed(
+    type: TypeEnum = None,
+    upcoming: bool = False,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    news_service: NewsService = Depends(read_only(NewsService)),
+) -> Page[NewsInfo]:
+    """Returns a page of news and events, newest first.
+
+    First pages are served from an in-process cache of serialized responses.
+
+    Args:
+        type (TypeEnum, optional): Return only news or only events
+        upcoming (bool): Return only publications whose event date
+            has not passed yet
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        news_service (NewsService): Service for working with news
+
+    Returns:
+        Page[NewsInfo]: Publications and the next page cursor
+    """
+    content = await news_service.get_feed_json(
+        type=type,
+        upcoming=upcoming,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, NewsInfo),
+    )
+    return Response(content, media_type="application/json")
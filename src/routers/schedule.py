@@ -0,0 +1,157 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+
+from src.core.dependencies import get_admin_or_instructor_user, read_only
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
+from src.service import ScheduleService
+from src.models import User
+from src.schemas import CreateLessonRequest, LessonInfo, UpdateLessonRequest, Page
+from src.settings import settings
+
+router = APIRouter()
+
+
+@router.post("", summary="Schedule a lesson")
+async def create_lesson(
+    lesson_data: CreateLessonRequest,
+    schedule_service: ScheduleService = Depends(ScheduleService),
+    user: User = Depends(get_admin_or_instructor_user),
+) -> LessonInfo:
+    """Adds a lesson of a course to the timetable.
+
+    Args:
+        lesson_data (CreateLessonRequest): Data for creating a lesson
+        schedule_service (ScheduleService): Service for working with the timetable
+        user (User): Authorized administrator or course instructor
+
+    Returns:
+        LessonInfo: Created lesson
+
+    Raises:
+        HTTPException:
+            403 if user does not teach the course
+            404 if course is not found
+            409 if the classroom or the instructor is busy at this time
+    """
+    result = await schedule_service.create_lesson(lesson_data=lesson_data, user=user)
+    return result
+
+
+@router.get("", summary="Get timetable for a period")
+async def get_timetable(
+    date_from: datetime,
+    date_to: datetime,
+    classroom: str = None,
+    instructor_id: int = None,
+    course_id: int = None,
+    schedule_service: ScheduleService = Depends(read_only(ScheduleService)),
+) -> list[LessonInfo]:
+    """Returns lessons taking place between date_from and date_to.
+
+    Args:
+        date_from (datetime): Period start
+        date_to (datetime): Period end, exclusive
+        classroom (str, optional): Filter by classroom
+        instructor_id (int, optional): Filter by instructor ID
+        course_id (int, optional): Filter by course ID
+        schedule_service (ScheduleService): Service for working with the timetable
+
+    Returns:
+        list[LessonInfo]: Lessons ordered by start time
+
+    Raises:
+        HTTPException: 422 if the period is empty or too long
+    """
+    result = await schedule_service.get_timetable(
+        date_from=date_from,
+        date_to=date_to,
+        classroom=classroom,
+        instructor_id=instructor_id,
+        course_id=course_id,
+    )
+    return result
+
+
+@router.get("/course/{course_id}", summary="Get lessons of a course")
+async def get_course_lessons(
+    course_id: int,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    schedule_service: ScheduleService = Depends(read_only(ScheduleService)),
+) -> Page[LessonInfo]:
+    """Returns a page of lessons of a course ordered by start time.
+
+    Args:
+        course_id (int): Unique course identifier
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        schedule_service (ScheduleService): Service for working with the timetable
+
+    Returns:
+        Page[LessonInfo]: Lessons and the next page cursor
+    """
+    result = await schedule_service.get_course_lessons(
+        course_id=course_id,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, LessonInfo),
+    )
+    return ModelResponse(result)
+
+
+@router.put("/{lesson_id}", summary="Update lesson")
+async def update_lesson(
+    lesson_id: int,
+    lesson_data: UpdateLessonRequest,
+    schedule_service: ScheduleService = Depends(ScheduleService),
+    user: User = Depends(get_admin_or_instructor_user),
+) -> LessonInfo:
+    """Moves a lesson or changes its classroom or type.
+
+    Args:
+        lesson_id (int): Unique lesson identifier
+        lesson_data (UpdateLessonRequest): Fields to update
+        schedule_service (ScheduleService): Service for working with the timetable
+        user (User): Authorized administrator or course instructor
+
+    Returns:
+        LessonInfo: Updated lesson
+
+    Raises:
+        HTTPException:
+            403 if user does not teach the course of the lesson
+            404 if lesson is not found
+            409 if the classroom or the instructor is busy at the new time
+    """
+    result = await schedule_service.update_lesson(
+        lesson_id=lesson_id, lesson_data=lesson_data, user=user
+    )
+    return result
+
+
+@router.delete("/{lesson_id}", summary="Delete lesson")
+async def delete_lesson(
+    lesson_id: int,
+    schedule_service: ScheduleService = Depends(ScheduleService),
+    user: User = Depends(get_admin_or_instructor_user),
+) -> bool:
+    """Removes a lesson from the timetable.
+
+    Args:
+        lesson_id (int): Unique lesson identifier
+        schedule_service (ScheduleService): Service for working with the timetable
+        user (User): Authorized administrator or course instructor
+
+    Returns:
+        bool: True if deletion was successful
+
+    Raises:
+        HTTPException:
+            403 if user does not teach the course of the lesson
+            404 if lesson is not found
+    """
+    return await schedule_service.delete_lesson(lesson_id=lesson_id, user=user)
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from src.core.dependencies import get_admin_user, get_current_user
+from src.core.dependencies import get_admin_user, get_current_user, read_only
+from src.core.etag import conditional_response
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
 from src.models.enum import StatusEnum
 from src.service import StudentService
 from src.models import User
-from src.schemas import StudentCreateRequest, StudentInfo, StudentUpdateRequest
+from src.schemas import (
+    StudentCreateRequest,
+    StudentInfo,
+    StudentUpdateRequest,
+    StudentImportResponse,
+    Page,
+)
+from src.settings import settings
 
 router = APIRouter()
 
@@ -33,16 +42,68 @@ async def add_student(
     return result
 
 
+@router.post(
+    "/import",
+    summary="Bulk import students",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/StudentCreateRequest"},
+                    }
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_students(
+    request: Request,
+    student_service: StudentService = Depends(StudentService),
+    user: User = Depends(get_admin_user),
+) -> StudentImportResponse:
+    """Creates many students from a JSON array or a CSV file.
+
+    The CSV file must have a header line with StudentCreateRequest field names.
+    Invalid rows are skipped and reported, valid rows are imported.
+
+    Args:
+        request (Request): Request with a JSON or text/csv body
+        student_service (StudentService): Service for working with students
+        user (User): Authorized administrator
+
+    Returns:
+        StudentImportResponse: Number of imported students and per-row errors
+
+    Raises:
+        HTTPException:
+            403 if user is not an administrator
+            422 if the body cannot be parsed
+    """
+    rows = student_service.parse_import_body(
+        await request.body(), request.headers.get("content-type", "")
+    )
+    result = await student_service.import_students(rows)
+    return result
+
+
 @router.get("/{id}", summary="Get student data by ID")
 async def get_student(
     student_id: int,
-    student_service: StudentService = Depends(StudentService),
+    request: Request,
+    student_service: StudentService = Depends(read_only(StudentService)),
     user: User = Depends(get_current_user),
 ) -> StudentInfo:
     """Gets student information by their ID.
 
+    The response carries an ETag; a matching If-None-Match gets 304.
+
     Args:
         student_id (int): Unique student identifier
+        request (Request): Incoming request
         student_service (StudentService): Service for working with students
         user (User): Authorized user
 
@@ -54,7 +115,7 @@ async def get_student(
     """
     student = await student_service.get_student_info(student_id=student_id)
 
-    return student
+    return conditional_response(request, student)
 
 
 @router.get("", summary="Get filtered list of students")
@@ -64,10 +125,14 @@ async def get_students(
     faculty_id: int = None,
     course_id: int = None,
     enrollment_status: StatusEnum = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    db_json: bool = False,
     user: User = Depends(get_admin_user),
-    student_service: StudentService = Depends(StudentService),
-) -> List[StudentInfo]:
-    """Returns a filtered list of students.
+    student_service: StudentService = Depends(read_only(StudentService)),
+) -> Page[StudentInfo]:
+    """Returns a filtered page of students.
 
     Args:
         group_id (int, optional): Filter by group ID
@@ -75,23 +140,35 @@ async def get_students(
         faculty_id (int, optional): Filter by faculty ID
         course_id (int, optional): Filter by course ID
         enrollment_status (StatusEnum, optional): Filter by enrollment status
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        db_json (bool): Let the database render the page to JSON
         user (User): Authorized administrator
         student_service (StudentService): Service for working with students
 
     Returns:
-        List[StudentInfo]: List of students matching the filters
+        Page[StudentInfo]: Students matching the filters and the next page cursor
 
     Raises:
         HTTPException: 403 if user is not an administrator
     """
-    result = await student_service.get_students(
+    filters = dict(
         group_id=group_id,
         enrollment_year=enrollment_year,
         course_id=course_id,
         enrollment_status=enrollment_status,
         faculty_id=faculty_id,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, StudentInfo),
     )
-    return result
+    if db_json:
+        content = await student_service.get_students_db_json(**filters)
+        return Response(content, media_type="application/json")
+
+    result = await student_service.get_students(**filters)
+    return ModelResponse(result)
 
 
 @router.put("/{id}", summary="Update student data")
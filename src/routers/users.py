@@ -1,41 +1,77 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from src.core.dependencies import get_current_user
+from src.core.dependencies import get_current_user, read_only
+from src.core.etag import version_etag, versioned_response
+from src.core.projection import parse_fields
+from src.core.responses import ModelResponse
 from src.models import User
 from src.schemas import GetAllUsersResponse, UserInfo, UpdateUserRequest
 from src.service import UserService
+from src.settings import settings
 
 router = APIRouter()
 
 
 @router.post("", summary="Returns all active users")
 async def get_all(
-    user_service: UserService = Depends(UserService),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str = None,
+    fields: str = None,
+    db_json: bool = False,
+    user_service: UserService = Depends(read_only(UserService)),
     user: User = Depends(get_current_user),
 ) -> GetAllUsersResponse:
-    """Returns a list of all active users in the system.
+    """Returns a page of active users in the system.
 
     Args:
+        limit (int): Page size
+        cursor (str, optional): Cursor returned with the previous page
+        fields (str, optional): Comma-separated response fields to return
+        db_json (bool): Let the database render the page to JSON
         user_service (UserService): Service for working with users
         user (User): Authorized user
 
     Returns:
-        GetAllUsersResponse: List of active users
+        GetAllUsersResponse: Page of active users and the next page cursor
 
     Raises:
-        HTTPException: 403 if user is not an administrator
+        HTTPException:
+            400 if an unknown field is requested
+            403 if user is not an administrator
     """
-    return await user_service.get_all_users(current_user=user)
+    if db_json:
+        content = await user_service.get_all_users_db_json(
+            current_user=user,
+            limit=limit,
+            cursor=cursor,
+            fields=parse_fields(fields, UserInfo),
+        )
+        return Response(content, media_type="application/json")
+
+    result = await user_service.get_all_users(
+        current_user=user,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields, UserInfo),
+    )
+    return ModelResponse(result)
 
 
 @router.get("/{user_id}", summary="Returns user by id")
 async def get_by_id(
-    user_id: int, user_service: UserService = Depends(UserService)
+    user_id: int,
+    request: Request,
+    user_service: UserService = Depends(read_only(UserService)),
 ) -> UserInfo:
     """Gets user information by their ID.
 
+    The response carries a weak ETag derived from the user's updated_at,
+    which changes with every write; a matching If-None-Match gets 304
+    before the response is built.
+
     Args:
         user_id (int): Unique user identifier
+        request (Request): Incoming request
         user_service (UserService): Service for working with users
 
     Returns:
@@ -44,7 +80,12 @@ async def get_by_id(
     Raises:
         HTTPException: 404 if user is not found
     """
-    return await user_service.get_user_by_id(user_id=user_id)
+    user = await user_service.get_user(user_id=user_id)
+    return versioned_response(
+        request,
+        version_etag(user.id, user.updated_at),
+        lambda: UserInfo.model_validate(user),
+    )
 
 
 @router.put("/{user_id}", summary="Update user profile")
@@ -1,3 +1,4 @@
+from src.schemas.pagination import *
 from src.schemas.auth import *
 from src.schemas.users import *
 from src.schemas.group import *
@@ -5,3 +6,7 @@ from src.schemas.students import *
 from src.schemas.faculty import *
 from src.schemas.instructors import *
 from src.schemas.course import *
+from src.schemas.enrollments import *
+from src.schemas.admin import *
+from src.schemas.schedule import *
+from src.schemas.news import *
@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class PoolStatus(BaseModel):
+    role: str
+    url: str
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class DatabasePoolsResponse(BaseModel):
+    pools: List[PoolStatus]
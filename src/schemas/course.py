@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 from src.models.enum import SemesterEnum
 
 
@@ -10,6 +12,7 @@ class CreateCourseRequest(BaseModel):
     instructor_id: int
     semester: SemesterEnum
     year: int
+    capacity: Optional[int] = Field(None, ge=0)
 
 
 class UpdateCourseRequest(BaseModel):
@@ -19,9 +22,13 @@ class UpdateCourseRequest(BaseModel):
     credits: int
     semester: SemesterEnum
     year: int
+    # Omitted keeps the current capacity, null removes the limit
+    capacity: Optional[int] = Field(None, ge=0)
 
 
 class CourseInfo(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     description: str
@@ -30,3 +37,5 @@ class CourseInfo(BaseModel):
     instructor_id: int
     semester: SemesterEnum
     year: int
+    capacity: Optional[int] = None
+    enrolled_count: int = 0
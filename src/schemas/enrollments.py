@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.models.enum import StatusEnum
+
+
+class EnrollmentInfo(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    student_id: int
+    course_id: int
+    enrollment_date: datetime
+    status: StatusEnum
+
+
+class EnrollRequest(BaseModel):
+    course_id: int
+    # Required for administrators; students always enroll themselves
+    student_id: Optional[int] = None
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.models.enum import TypeEnum
+
+
+class PublishNewsRequest(BaseModel):
+    title: str
+    content: str
+    type: TypeEnum
+    # Required for events; news take their publication time
+    event_date: Optional[datetime] = None
+
+
+class NewsInfo(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    content: str
+    publish_date: datetime
+    author_id: int
+    type: TypeEnum
+    event_date: datetime
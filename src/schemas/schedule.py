@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.models.enum import LessonTypeEnum
+
+
+class CreateLessonRequest(BaseModel):
+    course_id: int
+    start_time: datetime
+    end_time: datetime
+    classroom: str
+    lesson_type: LessonTypeEnum
+
+
+class UpdateLessonRequest(BaseModel):
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    classroom: Optional[str] = None
+    lesson_type: Optional[LessonTypeEnum] = None
+
+
+class LessonInfo(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    course_id: int
+    instructor_id: int
+    start_time: datetime
+    end_time: datetime
+    classroom: str
+    lesson_type: LessonTypeEnum
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel, Field
 
 
@@ -23,3 +25,13 @@ class StudentUpdateRequest(BaseModel):
     group_id: int
     enrollment_year: int
     faculty_id: int
+
+
+class StudentImportError(BaseModel):
+    row: int
+    detail: str
+
+
+class StudentImportResponse(BaseModel):
+    imported: int
+    errors: List[StudentImportError]
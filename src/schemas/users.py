@@ -1,12 +1,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from src.models.enum import UserRoleEnum
 
 
 class UserInfo(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     first_name: str
     last_name: str
@@ -18,6 +20,7 @@ class UserInfo(BaseModel):
 
 class GetAllUsersResponse(BaseModel):
     users: List[UserInfo]
+    next_cursor: Optional[str] = None
 
 
 class UpdateUserRequest(BaseModel):
@@ -2,3 +2,6 @@ from src.service.student import StudentService
 from src.service.instructor import InstructorService
 from src.service.course import CourseService
 from src.service.user import UserService
+from src.service.schedule import ScheduleService
+from src.service.enrollment import EnrollmentService
+from src.service.news import NewsService
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException
@@ -9,6 +11,94 @@ from src.settings import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+def _hash_password(password: str) -> str:
+    """Hashes a password; module-level so that it can run in a worker process."""
+    return pwd_context.hash(password)
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """Verifies a password; module-level so that it can run in a worker process."""
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification off the event loop.
+
+    A bcrypt call takes hundreds of milliseconds of CPU, so it is executed
+    in a dedicated thread or process pool instead of the event loop.
+    Admission is bounded: when ``max_pending`` calls are already running
+    or queued, new ones are rejected with 503 instead of piling up and
+    starving the rest of the API. Callers release their database connection
+    before awaiting a call, so queued calls do not hold pool connections.
+
+    Attributes:
+        executor_type (str): "thread" or "process"
+        workers (int): Number of workers in the pool
+        max_pending (int): Maximum number of running and queued calls
+        pending (int): Number of running and queued calls
+    """
+
+    def __init__(self, executor_type: str, workers: int, max_pending: int):
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor: {executor_type}")
+        self.executor_type = executor_type
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        """Creates the pool on first use."""
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    async def _run(self, func, *args):
+        """Runs a function in the pool if there is room for it.
+
+        Raises:
+            HTTPException: 503 if too many calls are already pending
+        """
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=503,
+                detail="Authentication service is busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Returns a bcrypt hash of the password."""
+        return await self._run(_hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Checks the password against a bcrypt hash."""
+        return await self._run(_verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stops the pool, waiting for running calls to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
 class AuthService:
     """Service for working with authentication and tokens."""
 
@@ -1,9 +1,20 @@
-from typing import List
+import re
+
 from fastapi import Depends, HTTPException
-from src.crud import CourseDAO
+from pydantic_core import to_json
+
+from src.core.cache import course_list_cache, discard_course_lists
+from src.core.db.unit_of_work import UnitOfWork
+from src.core.projection import json_page, page_of
+from src.crud import CourseDAO, EnrollmentDAO, InstructorDAO
 from src.models import Course, User
 from src.models.enum import SemesterEnum, UserRoleEnum
-from src.schemas import CreateCourseRequest, CourseInfo, UpdateCourseRequest
+from src.schemas import CreateCourseRequest, CourseInfo, UpdateCourseRequest, Page
+from src.settings import settings
+
+# Letters and digits only, so that user input never reaches the tsquery syntax
+SEARCH_TERM = re.compile(r"[^\W_]+")
+SEARCH_MAX_TERMS = 8
 
 
 class CourseService:
@@ -13,13 +24,22 @@ class CourseService:
     including user access rights verification.
     """
 
-    def __init__(self, courses_dao: CourseDAO = Depends()):
+    def __init__(
+        self,
+        courses_dao: CourseDAO = Depends(),
+        enrollment_dao: EnrollmentDAO = Depends(),
+        instructor_dao: InstructorDAO = Depends(),
+    ):
         """Initializes the service with necessary DAO objects.
 
         Args:
             courses_dao (CourseDAO): DAO for working with courses, injected through dependency
+            enrollment_dao (EnrollmentDAO): DAO for working with course enrollments
+            instructor_dao (InstructorDAO): DAO for working with instructors
         """
         self._course_dao = courses_dao
+        self._enrollment_dao = enrollment_dao
+        self._instructor_dao = instructor_dao
 
     async def process_information(self, request: Course) -> CourseInfo:
         """Converts a Course object to a CourseInfo schema for API response.
@@ -30,16 +50,7 @@ class CourseService:
         Returns:
             CourseInfo: Schema with course data for API response
         """
-        return CourseInfo(
-            id=request.id,
-            title=request.title,
-            description=request.description,
-            course_code=request.course_code,
-            credits=request.credits,
-            instructor_id=request.instructor_id,
-            semester=request.semester,
-            year=request.year,
-        )
+        return CourseInfo.model_validate(request)
 
     async def create_course(self, course_data: CreateCourseRequest) -> CourseInfo:
         """Creates a new course in the system.
@@ -51,6 +62,7 @@ class CourseService:
             CourseInfo: Created course in response schema format
         """
         course = await self._course_dao.add(course_data)
+        self._invalidate_lists(course)
         return await self.process_information(course)
 
     async def get_course(self, course_id: int) -> CourseInfo:
@@ -68,9 +80,106 @@ class CourseService:
         course = await self._course_dao.find_one(id=course_id)
         return await self.process_information(course)
 
+    @staticmethod
+    def _list_filters(semester: SemesterEnum, year: int, instructor_id: int) -> dict:
+        """Turns course list filters into CourseDAO filter arguments."""
+        course_filters = {}
+
+        if semester is not None:
+            course_filters["semester"] = semester
+
+        if year is not None:
+            course_filters["year"] = year
+
+        if instructor_id is not None:
+            course_filters["instructor_id"] = instructor_id
+
+        return course_filters
+
+    @staticmethod
+    def _list_cache_key(
+        semester: SemesterEnum,
+        year: int,
+        instructor_id: int,
+        limit: int,
+        cursor: str,
+        fields: list[str] = None,
+    ) -> tuple:
+        """Normalizes list filters into a course_list_cache key."""
+        return (
+            semester.name if semester is not None else None,
+            year,
+            instructor_id,
+            max(1, min(limit, settings.PAGE_SIZE_MAX)),
+            cursor,
+            tuple(fields) if fields is not None else None,
+        )
+
+    @staticmethod
+    def _invalidate_lists(course: Course = None) -> None:
+        """Drops cached course lists that may contain the given course.
+
+        Without a course, e.g. when its previous values are unknown,
+        all cached lists are dropped.
+        """
+        if course is None:
+            course_list_cache.clear()
+        else:
+            discard_course_lists(course)
+
+    @staticmethod
+    async def restricted_instructor_id(
+        user: User, instructor_dao: InstructorDAO
+    ) -> int | None:
+        """Returns the instructor whose courses the user may manage.
+
+        Args:
+            user (User): Authorized user
+            instructor_dao (InstructorDAO): DAO used to find the user's instructor
+
+        Returns:
+            int | None: Instructor ID, None for administrators who may manage
+                any course
+
+        Raises:
+            HTTPException: 403 if the user is neither an administrator
+                nor an instructor
+        """
+        if user.user_role == UserRoleEnum.ADMIN:
+            return None
+        instructor = await instructor_dao.find_one_or_none(user_id=user.id)
+        if instructor is None:
+            raise HTTPException(
+                status_code=403, detail="You don't have permission for this"
+            )
+        return instructor.id
+
+    @classmethod
+    async def access_criteria(cls, user: User, instructor_dao: InstructorDAO) -> list:
+        """Returns WHERE clauses restricting access to courses the user owns.
+
+        Used for course writes and for reading the enrollments of a course.
+        """
+        instructor_id = await cls.restricted_instructor_id(user, instructor_dao)
+        if instructor_id is None:
+            return []
+        return [Course.instructor_id == instructor_id]
+
+    async def _is_access_denied(self, course_id: int, criteria: list) -> bool:
+        """Tells whether a restricted write matched nothing because of access rights.
+
+        Only called after a write statement matched no row, so the success
+        path stays a single round-trip.
+        """
+        if not criteria:
+            return False
+        return await self._course_dao.find_one_or_none(id=course_id) is not None
+
     async def delete_course(self, course_id: int, user: User) -> bool:
         """Deletes a course from the system after access rights verification.
 
+        The access check is part of the DELETE statement itself.
+
         Args:
             course_id (int): Unique identifier of the course to delete
             user (User): Authorized user initiating the deletion
@@ -81,12 +190,18 @@ class CourseService:
         Raises:
             HTTPException: 403 if no access rights, 404 if course is not found
         """
-        course = await self._course_dao.find_one(id=course_id)
-        if (user.id != course.instructor_id) and (user.user_role != UserRoleEnum.ADMIN):
-            raise HTTPException(
-                status_code=403, detail="You don't have permission for this"
-            )
-        await self._course_dao.delete(model_id=course_id)
+        criteria = await self.access_criteria(user, self._instructor_dao)
+        try:
+            await self._course_dao.delete(course_id, *criteria)
+        except HTTPException as e:
+            if e.status_code == 404 and await self._is_access_denied(
+                course_id, criteria
+            ):
+                raise HTTPException(
+                    status_code=403, detail="You don't have permission for this"
+                )
+            raise
+        self._invalidate_lists()
         return True
 
     async def update_course(
@@ -94,6 +209,11 @@ class CourseService:
     ) -> CourseInfo:
         """Updates data of an existing course.
 
+        The access check is part of the UPDATE statement itself, and the
+        returned row is used for the response without reading it again.
+        A capacity of null removes the limit. When the capacity changes,
+        seats it frees go to the waitlist in the same transaction.
+
         Args:
             course_id (int): Unique identifier of the course to update
             user (User): Authorized user initiating the update
@@ -106,42 +226,170 @@ class CourseService:
             HTTPException: 403 if no access rights, 404 if course is not found
         """
         update_data = updated_data.dict(exclude_none=True)
-
-        course = await self._course_dao.find_one(id=course_id)
-        if (course.instructor_id != user.id) and (user.user_role != UserRoleEnum.ADMIN):
-            raise HTTPException(status_code=403, detail="You can't update this course")
-
-        if update_data:
-            course_list = await self._course_dao.update(
-                model_id=course_id, **update_data
-            )
-            course = course_list[0]
-
+        if "capacity" in updated_data.model_fields_set:
+            update_data["capacity"] = updated_data.capacity
+
+        instructor_id = await self.restricted_instructor_id(user, self._instructor_dao)
+        if not update_data:
+            course = await self._course_dao.find_one(id=course_id)
+            if instructor_id is not None and course.instructor_id != instructor_id:
+                raise HTTPException(
+                    status_code=403, detail="You can't update this course"
+                )
+            return await self.process_information(course)
+
+        criteria = []
+        if instructor_id is not None:
+            criteria.append(Course.instructor_id == instructor_id)
+        async with UnitOfWork(self._course_dao.session):
+            try:
+                course = await self._course_dao.update(
+                    course_id, *criteria, **update_data
+                )
+            except HTTPException as e:
+                if e.status_code == 404 and await self._is_access_denied(
+                    course_id, criteria
+                ):
+                    raise HTTPException(
+                        status_code=403, detail="You can't update this course"
+                    )
+                raise
+            if "capacity" in update_data:
+                # The seat counter updates are synchronized into ``course``
+                await self._enrollment_dao.promote_waitlisted(course_id)
+        # The course may have left lists matching its previous values
+        self._invalidate_lists()
         return await self.process_information(course)
 
     async def get_courses(
-        self, semester: SemesterEnum = None, year: int = None, instructor_id: int = None
-    ) -> List[CourseInfo]:
-        """Returns a filtered list of courses.
+        self,
+        semester: SemesterEnum = None,
+        year: int = None,
+        instructor_id: int = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[CourseInfo]:
+        """Returns a filtered page of courses.
 
         Args:
             semester (SemesterEnum, optional): Filter by semester
             year (int, optional): Filter by year
             instructor_id (int, optional): Filter by instructor ID
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
 
         Returns:
-            List[CourseInfo]: List of courses matching the filters
+            Page[CourseInfo]: Courses matching the filters and the next page cursor
         """
-        course_filters = {}
+        courses, next_cursor = await self._course_dao.find_page(
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            **self._list_filters(semester, year, instructor_id),
+        )
+        return page_of(CourseInfo, courses, next_cursor, fields)
+
+    async def get_courses_db_json(
+        self,
+        semester: SemesterEnum = None,
+        year: int = None,
+        instructor_id: int = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> bytes:
+        """Returns a filtered page of courses rendered to JSON by the database.
+
+        Produces the same document as serializing get_courses, without
+        loading the courses into Python objects.
 
-        if semester is not None:
-            course_filters["semester"] = semester
+        Args:
+            semester (SemesterEnum, optional): Filter by semester
+            year (int, optional): Filter by year
+            instructor_id (int, optional): Filter by instructor ID
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
 
-        if year is not None:
-            course_filters["year"] = year
+        Returns:
+            bytes: JSON of Page[CourseInfo]
+        """
+        items, next_cursor = await self._course_dao.find_page_json(
+            fields=fields or list(CourseInfo.model_fields),
+            limit=limit,
+            cursor=cursor,
+            **self._list_filters(semester, year, instructor_id),
+        )
+        return json_page(items, next_cursor)
 
-        if instructor_id is not None:
-            course_filters["instructor_id"] = instructor_id
+    async def search_courses(
+        self, query: str, limit: int = settings.PAGE_SIZE_DEFAULT, offset: int = 0
+    ) -> list[CourseInfo]:
+        """Searches courses by words of their title and description.
 
-        courses = await self._course_dao.find_all(**course_filters)
-        return [await self.process_information(course) for course in courses]
+        Every word of the query must occur in the course, either whole or as
+        the beginning of a longer word, so results narrow down while the user
+        is typing.
+
+        Args:
+            query (str): Search query
+            limit (int): Page size
+            offset (int): Number of courses to skip
+
+        Returns:
+            list[CourseInfo]: Found courses, best matches first
+        """
+        terms = SEARCH_TERM.findall(query.lower())[:SEARCH_MAX_TERMS]
+        courses = await self._course_dao.search(terms, limit=limit, offset=offset)
+        return [CourseInfo.model_validate(course) for course in courses]
+
+    async def get_courses_json(
+        self,
+        semester: SemesterEnum = None,
+        year: int = None,
+        instructor_id: int = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+        db_json: bool = False,
+    ) -> bytes:
+        """Returns a filtered page of courses serialized to JSON.
+
+        Pages are cached in course_list_cache by their normalized filters
+        and invalidated by course writes of this worker; writes of other
+        workers become visible after settings.COURSE_CACHE_TTL_SECONDS.
+        Pages rendered by the database are equivalent to the others, so
+        both kinds share the cache and ``db_json`` only matters on a miss.
+
+        Args:
+            semester (SemesterEnum, optional): Filter by semester
+            year (int, optional): Filter by year
+            instructor_id (int, optional): Filter by instructor ID
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+            db_json (bool): Render the page in the database on a cache miss
+
+        Returns:
+            bytes: JSON of Page[CourseInfo]
+        """
+        key = self._list_cache_key(semester, year, instructor_id, limit, cursor, fields)
+        content = course_list_cache.get(key)
+        if content is None:
+            generation = course_list_cache.generation
+            filters = dict(
+                semester=semester,
+                year=year,
+                instructor_id=instructor_id,
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
+            )
+            if db_json:
+                content = await self.get_courses_db_json(**filters)
+            else:
+                content = to_json(await self.get_courses(**filters))
+            course_list_cache.set(key, content, generation=generation)
+        return content
@@ -0,0 +1,176 @@
+from fastapi import Depends, HTTPException
+
+from src.core.projection import page_of
+
+from src.crud import CourseDAO, EnrollmentDAO, InstructorDAO, StudentDAO
+from src.models import Course, Enrollment, User
+from src.models.enum import StatusEnum, UserRoleEnum
+from src.schemas import EnrollRequest, EnrollmentInfo, Page
+from src.service.course import CourseService
+from src.settings import settings
+
+
+class EnrollmentService:
+    """Service for enrolling students in courses.
+
+    Every course may limit the number of active enrollments; students
+    enrolling in a full course are put on its waitlist and get a seat
+    automatically when someone drops the course.
+    """
+
+    def __init__(
+        self,
+        enrollment_dao: EnrollmentDAO = Depends(),
+        student_dao: StudentDAO = Depends(),
+        courses_dao: CourseDAO = Depends(),
+        instructor_dao: InstructorDAO = Depends(),
+    ):
+        """Initializes the service with necessary DAO objects.
+
+        Args:
+            enrollment_dao (EnrollmentDAO): DAO for working with enrollments
+            student_dao (StudentDAO): DAO for working with students
+            courses_dao (CourseDAO): DAO for working with courses
+            instructor_dao (InstructorDAO): DAO for working with instructors
+        """
+        self._enrollment_dao = enrollment_dao
+        self._student_dao = student_dao
+        self._course_dao = courses_dao
+        self._instructor_dao = instructor_dao
+
+    async def _resolve_student_id(self, user: User, student_id: int = None) -> int:
+        """Determines the student an enrollment request is made for.
+
+        Students act on their own behalf, administrators on behalf of any
+        student given by ``student_id``.
+
+        Raises:
+            HTTPException:
+                403 - If a student acts for someone else or the user is
+                    neither a student nor an administrator
+                404 - If the student is not found
+                422 - If an administrator does not specify the student
+        """
+        if user.user_role == UserRoleEnum.ADMIN:
+            if student_id is None:
+                raise HTTPException(status_code=422, detail="student_id is required")
+            await self._student_dao.find_one(id=student_id)
+            return student_id
+
+        if user.user_role == UserRoleEnum.STUDENT:
+            student = await self._student_dao.find_one(user_id=user.id)
+            if student_id is not None and student_id != student.id:
+                raise HTTPException(
+                    status_code=403, detail="You can only manage your own enrollments"
+                )
+            return student.id
+
+        raise HTTPException(status_code=403, detail="Only students can enroll")
+
+    async def enroll(self, enroll_data: EnrollRequest, user: User) -> EnrollmentInfo:
+        """Enrolls a student in a course or puts them on its waitlist.
+
+        Args:
+            enroll_data (EnrollRequest): Course and, for administrators, student
+            user (User): Authorized student or administrator
+
+        Returns:
+            EnrollmentInfo: Enrollment with status ACTIVE or WAITLISTED
+
+        Raises:
+            HTTPException:
+                403 - If the user may not enroll this student
+                404 - If the student or the course is not found
+                409 - If the student is already enrolled in the course
+        """
+        student_id = await self._resolve_student_id(user, enroll_data.student_id)
+        enrollment = await self._enrollment_dao.enroll(
+            student_id=student_id, course_id=enroll_data.course_id
+        )
+        return EnrollmentInfo.model_validate(enrollment)
+
+    async def drop(
+        self, course_id: int, user: User, student_id: int = None
+    ) -> EnrollmentInfo:
+        """Drops an enrollment, passing the freed seat to the waitlist.
+
+        Args:
+            course_id (int): Course ID
+            user (User): Authorized student or administrator
+            student_id (int, optional): Student ID, required for administrators
+
+        Returns:
+            EnrollmentInfo: Enrollment with status DROPPED
+
+        Raises:
+            HTTPException:
+                403 - If the user may not manage this student
+                404 - If the student is not enrolled in the course
+        """
+        student_id = await self._resolve_student_id(user, student_id)
+        enrollment = await self._enrollment_dao.drop(
+            student_id=student_id, course_id=course_id
+        )
+        return EnrollmentInfo.model_validate(enrollment)
+
+    async def get_course_enrollments(
+        self,
+        course_id: int,
+        user: User,
+        status: StatusEnum = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[EnrollmentInfo]:
+        """Returns a page of enrollments of a course.
+
+        Instructors only see the enrollments of their own courses. Their
+        instructor is looked up first, and the access check is part of the
+        page query; only an empty page costs one more query to tell a foreign
+        course from a course without enrollments.
+
+        Args:
+            course_id (int): Course ID
+            user (User): Authorized administrator or instructor
+            status (StatusEnum, optional): Filter by enrollment status
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            Page[EnrollmentInfo]: Enrollments ordered by student and the
+                next page cursor
+
+        Raises:
+            HTTPException: 403 if the user is not an instructor or the course
+                belongs to another instructor
+        """
+        enrollment_filters = {"course_id": course_id}
+        if status is not None:
+            enrollment_filters["status"] = status
+
+        access = await CourseService.access_criteria(user, self._instructor_dao)
+        criteria = []
+        if access:
+            criteria.append(
+                self._course_dao.exists(Course.id == Enrollment.course_id, *access)
+            )
+
+        enrollments, next_cursor = await self._enrollment_dao.find_page(
+            *criteria,
+            limit=limit,
+            cursor=cursor,
+            order_by="student_id",
+            fields=fields,
+            **enrollment_filters,
+        )
+        if (
+            not enrollments
+            and access
+            and not await self._course_dao.find_all(*access, id=course_id, limit=1)
+            and await self._course_dao.find_one_or_none(id=course_id) is not None
+        ):
+            raise HTTPException(
+                status_code=403, detail="You don't have permission for this"
+            )
+        return page_of(EnrollmentInfo, enrollments, next_cursor, fields)
@@ -0,0 +1,144 @@
+import csv
+import io
+from typing import AsyncIterator, Type
+
+from pydantic import BaseModel
+
+from src.core.db.database import read_session
+from src.core.loader import EntityLoader
+from src.crud import StudentDAO, UserDAO, EnrollmentDAO
+from src.models.enum import ExportFormatEnum
+from src.schemas import StudentInfo, UserInfo, EnrollmentInfo
+from src.service.student import StudentService
+from src.settings import settings
+
+
+class ExportService:
+    """Service for streaming full tables as NDJSON or CSV.
+
+    Every export opens its own read replica session for the lifetime of the
+    response body and reads rows through a server-side cursor, so peak
+    memory stays flat regardless of the table size and the first bytes
+    are sent as soon as the first batch arrives.
+    """
+
+    MEDIA_TYPES = {
+        ExportFormatEnum.NDJSON: "application/x-ndjson",
+        ExportFormatEnum.CSV: "text/csv",
+    }
+
+    @staticmethod
+    def _csv_line(values: list) -> str:
+        """Renders a single CSV record."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
+
+    @classmethod
+    async def _encode(
+        cls,
+        items: AsyncIterator[BaseModel],
+        schema: Type[BaseModel],
+        export_format: ExportFormatEnum,
+    ) -> AsyncIterator[bytes]:
+        """Serializes a stream of schema objects in the requested format.
+
+        Records are grouped into chunks of settings.EXPORT_CHUNK_SIZE
+        to keep the number of writes to the socket low.
+
+        Args:
+            items (AsyncIterator[BaseModel]): Objects to serialize
+            schema (Type[BaseModel]): Schema of the objects, defines CSV columns
+            export_format (ExportFormatEnum): Output format
+
+        Yields:
+            bytes: Encoded chunks of the response body
+        """
+        fields = list(schema.model_fields)
+        if export_format == ExportFormatEnum.CSV:
+            yield cls._csv_line(fields).encode()
+
+        chunk = []
+        async for item in items:
+            if export_format == ExportFormatEnum.CSV:
+                data = item.model_dump(mode="json")
+                chunk.append(cls._csv_line([data[field] for field in fields]))
+            else:
+                chunk.append(item.model_dump_json() + "\n")
+
+            if len(chunk) >= settings.EXPORT_CHUNK_SIZE:
+                yield "".join(chunk).encode()
+                chunk.clear()
+
+        if chunk:
+            yield "".join(chunk).encode()
+
+    @classmethod
+    async def export_students(
+        cls, export_format: ExportFormatEnum
+    ) -> AsyncIterator[bytes]:
+        """Streams all students with their group and faculty names.
+
+        Args:
+            export_format (ExportFormatEnum): Output format
+
+        Yields:
+            bytes: Encoded chunks of the response body
+        """
+
+        async def items():
+            async with read_session() as session:
+                loader = EntityLoader(session)
+                async for student in StudentDAO(session).stream():
+                    infos = await StudentService.build_infos([student], loader)
+                    yield infos[0]
+
+        async for chunk in cls._encode(items(), StudentInfo, export_format):
+            yield chunk
+
+    @classmethod
+    async def export_users(
+        cls, export_format: ExportFormatEnum
+    ) -> AsyncIterator[bytes]:
+        """Streams all users without their password hashes.
+
+        Args:
+            export_format (ExportFormatEnum): Output format
+
+        Yields:
+            bytes: Encoded chunks of the response body
+        """
+
+        async def items():
+            async with read_session() as session:
+                async for user in UserDAO(session).stream():
+                    yield UserInfo.model_validate(user)
+
+        async for chunk in cls._encode(items(), UserInfo, export_format):
+            yield chunk
+
+    @classmethod
+    async def export_enrollments(
+        cls, export_format: ExportFormatEnum, course_id: int = None
+    ) -> AsyncIterator[bytes]:
+        """Streams course enrollments.
+
+        Args:
+            export_format (ExportFormatEnum): Output format
+            course_id (int, optional): Export only enrollments of this course
+
+        Yields:
+            bytes: Encoded chunks of the response body
+        """
+        enrollment_filters = {}
+        if course_id is not None:
+            enrollment_filters["course_id"] = course_id
+
+        async def items():
+            async with read_session() as session:
+                dao = EnrollmentDAO(session)
+                async for enrollment in dao.stream(**enrollment_filters):
+                    yield EnrollmentInfo.model_validate(enrollment)
+
+        async for chunk in cls._encode(items(), EnrollmentInfo, export_format):
+            yield chunk
@@ -1,11 +1,13 @@
-from typing import List
-
 from fastapi import Depends
 
+from src.core.db.unit_of_work import UnitOfWork
+from src.core.loader import EntityLoader
+from src.core.projection import page_of
 from src.crud import InstructorDAO, CourseDAO, UserDAO
-from src.models import Instructor
+from src.models import Course, Instructor
 from src.models.enum import UserRoleEnum
-from src.schemas import CreateInstructorRequest, InstructorInfo
+from src.schemas import CreateInstructorRequest, InstructorInfo, Page
+from src.settings import settings
 
 
 class InstructorService:
@@ -20,6 +22,7 @@ class InstructorService:
         user_dao: UserDAO = Depends(),
         instructor_dao: InstructorDAO = Depends(),
         courses_dao: CourseDAO = Depends(),
+        loader: EntityLoader = Depends(),
     ):
         """Initializes the service with necessary DAO objects.
 
@@ -27,10 +30,12 @@ class InstructorService:
             user_dao (UserDAO): DAO for working with users
             instructor_dao (InstructorDAO): DAO for working with instructors
             courses_dao (CourseDAO): DAO for working with courses
+            loader (EntityLoader): Batching loader of entities by ID
         """
         self._user_dao = user_dao
         self._instructor_dao = instructor_dao
         self._course_dao = courses_dao
+        self._loader = loader
 
     async def process_information(self, request: Instructor) -> InstructorInfo:
         """Converts an Instructor object to an InstructorInfo schema for API response.
@@ -41,19 +46,15 @@ class InstructorService:
         Returns:
             InstructorInfo: Schema with instructor data for API response
         """
-        return InstructorInfo(
-            id=request.id,
-            user_id=request.user_id,
-            position=request.position,
-            department=request.department,
-            academic_degree=request.academic_degree,
-        )
+        return InstructorInfo.model_validate(request)
 
     async def add_instructor(
         self, instructor_data: CreateInstructorRequest
     ) -> InstructorInfo:
         """Creates a new instructor in the system.
 
+        The instructor and the role of their user are written in one transaction.
+
         Args:
             instructor_data (CreateInstructorRequest): Data for creating an instructor
 
@@ -63,10 +64,11 @@ class InstructorService:
         Raises:
             HTTPException: 400 on data validation errors
         """
-        instructor = await self._instructor_dao.add(instructor_data)
-        await self._user_dao.update(
-            model_id=instructor.user_id, user_role=UserRoleEnum.INSTRUCTOR
-        )
+        async with UnitOfWork(self._instructor_dao.session):
+            instructor = await self._instructor_dao.add(instructor_data)
+            await self._user_dao.update(
+                model_id=instructor.user_id, user_role=UserRoleEnum.INSTRUCTOR
+            )
         return await self.process_information(instructor)
 
     async def get_instructor(self, instructor_id) -> InstructorInfo:
@@ -81,34 +83,47 @@ class InstructorService:
         Raises:
             HTTPException: 404 if instructor is not found
         """
-        instructor = await self._instructor_dao.find_one(id=instructor_id)
+        instructor = await self._loader.find_one(Instructor, instructor_id)
         return await self.process_information(instructor)
 
     async def get_instructors(
-        self, department: str = None, course_id: int = None
-    ) -> List[InstructorInfo]:
-        """Returns a filtered list of instructors.
+        self,
+        department: str = None,
+        course_id: int = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[InstructorInfo]:
+        """Returns a filtered page of instructors.
 
         Args:
             department (str, optional): Filter by department
             course_id (int, optional): Filter by course ID that the instructor teaches
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
 
         Returns:
-            List[InstructorInfo]: List of instructors matching the filters
+            Page[InstructorInfo]: Instructors matching the filters and the next page cursor
         """
         instructor_filters = {}
 
         if department is not None:
             instructor_filters["department"] = department
 
+        criteria = []
         if course_id is not None:
-            course = await self._course_dao.find_one_or_none(id=course_id)
-            if not course:
-                return []
-            instructor_filters["id"] = course.instructor_id
-
-        instructors = await self._instructor_dao.find_all(**instructor_filters)
-
-        return [
-            await self.process_information(instructor) for instructor in instructors
-        ]
+            criteria.append(
+                self._course_dao.exists(
+                    Course.instructor_id == Instructor.id, id=course_id
+                )
+            )
+
+        instructors, next_cursor = await self._instructor_dao.find_page(
+            *criteria,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            **instructor_filters,
+        )
+        return page_of(InstructorInfo, instructors, next_cursor, fields)
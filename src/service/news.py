@@ -0,0 +1,144 @@
+from datetime import datetime
+
+from fastapi import Depends, HTTPException
+from pydantic_core import to_json
+
+from src.core.cache import news_feed_cache
+from src.core.projection import page_of
+from src.crud import NewsDAO
+from src.models import NewsEvent, User
+from src.models.enum import TypeEnum
+from src.schemas import NewsInfo, Page, PublishNewsRequest
+from src.settings import settings
+
+
+class NewsService:
+    """Service for publishing news and events and reading the feed.
+
+    The feed is ordered newest-first by publication date. Its first pages
+    are what almost every reader requests, so they are cached serialized
+    and dropped whenever something is published.
+    """
+
+    def __init__(self, news_dao: NewsDAO = Depends()):
+        """Initializes the service with necessary DAO objects.
+
+        Args:
+            news_dao (NewsDAO): DAO for working with news and events
+        """
+        self._news_dao = news_dao
+
+    async def publish(self, news_data: PublishNewsRequest, user: User) -> NewsInfo:
+        """Publishes a news item or an event on behalf of the user.
+
+        News take their publication time as event date.
+
+        Args:
+            news_data (PublishNewsRequest): Data of the publication
+            user (User): Authorized administrator or instructor
+
+        Returns:
+            NewsInfo: Published news item or event
+
+        Raises:
+            HTTPException: 422 if an event has no event date
+        """
+        if news_data.type == TypeEnum.EVENT and news_data.event_date is None:
+            raise HTTPException(status_code=422, detail="Events require event_date")
+
+        publish_date = datetime.utcnow()
+        news = await self._news_dao.add(
+            {
+                **news_data.model_dump(),
+                "author_id": user.id,
+                "publish_date": publish_date,
+                "event_date": news_data.event_date or publish_date,
+            }
+        )
+        news_feed_cache.clear()
+        return NewsInfo.model_validate(news)
+
+    async def get_feed(
+        self,
+        type: TypeEnum = None,
+        upcoming: bool = False,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[NewsInfo]:
+        """Returns a page of the feed, newest publications first.
+
+        Args:
+            type (TypeEnum, optional): Return only news or only events
+            upcoming (bool): Return only publications whose event date
+                has not passed yet
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            Page[NewsInfo]: Publications and the next page cursor
+        """
+        criteria = []
+        if upcoming:
+            criteria.append(NewsEvent.event_date >= datetime.utcnow())
+
+        news_filters = {}
+        if type is not None:
+            news_filters["type"] = type
+
+        news, next_cursor = await self._news_dao.find_page(
+            *criteria,
+            limit=limit,
+            cursor=cursor,
+            order_by="publish_date",
+            descending=True,
+            fields=fields,
+            **news_filters,
+        )
+        return page_of(NewsInfo, news, next_cursor, fields)
+
+    async def get_feed_json(
+        self,
+        type: TypeEnum = None,
+        upcoming: bool = False,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> bytes:
+        """Returns a page of the feed serialized to JSON.
+
+        First pages are served from news_feed_cache, which is cleared by
+        publications of this worker; publications of other workers, and
+        events that have started for upcoming feeds, show up after
+        settings.NEWS_CACHE_TTL_SECONDS. Later pages are always read
+        from the database.
+
+        Args:
+            type (TypeEnum, optional): Return only news or only events
+            upcoming (bool): Return only publications whose event date
+                has not passed yet
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            bytes: JSON of Page[NewsInfo]
+        """
+        if cursor is not None:
+            page = await self.get_feed(type, upcoming, limit, cursor, fields)
+            return to_json(page)
+
+        key = (
+            type.name if type is not None else None,
+            upcoming,
+            max(1, min(limit, settings.PAGE_SIZE_MAX)),
+            tuple(fields) if fields is not None else None,
+        )
+        content = news_feed_cache.get(key)
+        if content is None:
+            generation = news_feed_cache.generation
+            page = await self.get_feed(type, upcoming, limit, fields=fields)
+            content = to_json(page)
+            news_feed_cache.set(key, content, generation=generation)
+        return content
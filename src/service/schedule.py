@@ -0,0 +1,243 @@
+from datetime import datetime, timedelta
+
+from fastapi import Depends, HTTPException
+
+from src.core.projection import page_of
+
+from src.crud import CourseDAO, InstructorDAO, ScheduleDAO
+from src.models import Schedule, User
+from src.models.enum import UserRoleEnum
+from src.schemas import CreateLessonRequest, LessonInfo, UpdateLessonRequest, Page
+from src.settings import settings
+
+
+class ScheduleService:
+    """Service for managing the timetable of courses.
+
+    Lessons may be scheduled by administrators and by the instructor of the
+    course. Double-booked classrooms and overlapping lessons of one
+    instructor are rejected by the database with 409.
+    """
+
+    def __init__(
+        self,
+        schedule_dao: ScheduleDAO = Depends(),
+        courses_dao: CourseDAO = Depends(),
+        instructor_dao: InstructorDAO = Depends(),
+    ):
+        """Initializes the service with necessary DAO objects.
+
+        Args:
+            schedule_dao (ScheduleDAO): DAO for working with lessons
+            courses_dao (CourseDAO): DAO for working with courses
+            instructor_dao (InstructorDAO): DAO for working with instructors
+        """
+        self._schedule_dao = schedule_dao
+        self._course_dao = courses_dao
+        self._instructor_dao = instructor_dao
+
+    async def _restricted_instructor_id(self, user: User) -> int | None:
+        """Returns the instructor whose lessons the user may change.
+
+        Returns:
+            int | None: Instructor ID, None for administrators who may change
+                any lesson
+
+        Raises:
+            HTTPException: 403 if the user is neither an administrator
+                nor an instructor
+        """
+        if user.user_role == UserRoleEnum.ADMIN:
+            return None
+        instructor = await self._instructor_dao.find_one_or_none(user_id=user.id)
+        if instructor is None:
+            raise HTTPException(
+                status_code=403, detail="You don't have permission for this"
+            )
+        return instructor.id
+
+    async def _access_criteria(self, user: User) -> list:
+        """Returns WHERE clauses restricting writes to lessons the user may change."""
+        instructor_id = await self._restricted_instructor_id(user)
+        if instructor_id is None:
+            return []
+        return [Schedule.instructor_id == instructor_id]
+
+    async def _is_access_denied(self, lesson_id: int, criteria: list) -> bool:
+        """Tells whether a restricted write matched nothing because of access rights."""
+        if not criteria:
+            return False
+        return await self._schedule_dao.find_one_or_none(id=lesson_id) is not None
+
+    async def create_lesson(
+        self, lesson_data: CreateLessonRequest, user: User
+    ) -> LessonInfo:
+        """Schedules a lesson of a course.
+
+        The lesson is assigned to the instructor of the course.
+
+        Args:
+            lesson_data (CreateLessonRequest): Data for creating a lesson
+            user (User): Authorized administrator or course instructor
+
+        Returns:
+            LessonInfo: Created lesson
+
+        Raises:
+            HTTPException:
+                403 - If the user does not teach the course
+                404 - If the course is not found
+                409 - If the classroom or the instructor is busy at this time
+        """
+        instructor_id = await self._restricted_instructor_id(user)
+        course = await self._course_dao.find_one(id=lesson_data.course_id)
+        if instructor_id is not None and course.instructor_id != instructor_id:
+            raise HTTPException(
+                status_code=403, detail="You can't schedule lessons of this course"
+            )
+
+        lesson = await self._schedule_dao.add(
+            {**lesson_data.model_dump(), "instructor_id": course.instructor_id}
+        )
+        return LessonInfo.model_validate(lesson)
+
+    async def update_lesson(
+        self, lesson_id: int, lesson_data: UpdateLessonRequest, user: User
+    ) -> LessonInfo:
+        """Moves a lesson or changes its classroom or type.
+
+        Args:
+            lesson_id (int): Unique lesson identifier
+            lesson_data (UpdateLessonRequest): Fields to update
+            user (User): Authorized administrator or course instructor
+
+        Returns:
+            LessonInfo: Updated lesson
+
+        Raises:
+            HTTPException:
+                403 - If the user does not teach the course of the lesson
+                404 - If the lesson is not found
+                409 - If the classroom or the instructor is busy at the new time
+        """
+        criteria = await self._access_criteria(user)
+        update_data = lesson_data.model_dump(exclude_none=True)
+
+        if not update_data:
+            lesson = await self._schedule_dao.find_one(id=lesson_id)
+            return LessonInfo.model_validate(lesson)
+
+        try:
+            lesson = await self._schedule_dao.update(
+                lesson_id, *criteria, **update_data
+            )
+        except HTTPException as e:
+            if e.status_code == 404 and await self._is_access_denied(
+                lesson_id, criteria
+            ):
+                raise HTTPException(
+                    status_code=403, detail="You can't update this lesson"
+                )
+            raise
+        return LessonInfo.model_validate(lesson)
+
+    async def delete_lesson(self, lesson_id: int, user: User) -> bool:
+        """Removes a lesson from the timetable.
+
+        Args:
+            lesson_id (int): Unique lesson identifier
+            user (User): Authorized administrator or course instructor
+
+        Returns:
+            bool: True if deletion was successful
+
+        Raises:
+            HTTPException: 403 if the user does not teach the course of the
+                lesson, 404 if the lesson is not found
+        """
+        criteria = await self._access_criteria(user)
+        try:
+            await self._schedule_dao.delete(lesson_id, *criteria)
+        except HTTPException as e:
+            if e.status_code == 404 and await self._is_access_denied(
+                lesson_id, criteria
+            ):
+                raise HTTPException(
+                    status_code=403, detail="You can't delete this lesson"
+                )
+            raise
+        return True
+
+    async def get_course_lessons(
+        self,
+        course_id: int,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[LessonInfo]:
+        """Returns a page of lessons of a course ordered by start time.
+
+        Args:
+            course_id (int): Unique course identifier
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            Page[LessonInfo]: Lessons and the next page cursor
+        """
+        lessons, next_cursor = await self._schedule_dao.find_page(
+            limit=limit,
+            cursor=cursor,
+            order_by="start_time",
+            fields=fields,
+            course_id=course_id,
+        )
+        return page_of(LessonInfo, lessons, next_cursor, fields)
+
+    async def get_timetable(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        classroom: str = None,
+        instructor_id: int = None,
+        course_id: int = None,
+    ) -> list[LessonInfo]:
+        """Returns lessons taking place in a period.
+
+        Args:
+            date_from (datetime): Period start
+            date_to (datetime): Period end, exclusive
+            classroom (str, optional): Filter by classroom
+            instructor_id (int, optional): Filter by instructor ID
+            course_id (int, optional): Filter by course ID
+
+        Returns:
+            list[LessonInfo]: Lessons overlapping the period ordered by start time
+
+        Raises:
+            HTTPException: 422 if the period is empty or longer than
+                settings.TIMETABLE_MAX_DAYS
+        """
+        if date_to <= date_from:
+            raise HTTPException(
+                status_code=422, detail="date_to must be later than date_from"
+            )
+        if date_to - date_from > timedelta(days=settings.TIMETABLE_MAX_DAYS):
+            raise HTTPException(
+                status_code=422,
+                detail=f"Period must not exceed {settings.TIMETABLE_MAX_DAYS} days",
+            )
+
+        lesson_filters = {}
+        if classroom is not None:
+            lesson_filters["classroom"] = classroom
+        if instructor_id is not None:
+            lesson_filters["instructor_id"] = instructor_id
+        if course_id is not None:
+            lesson_filters["course_id"] = course_id
+
+        lessons = await self._schedule_dao.find_overlapping(
+            date_from, date_to, **lesson_filters
+        )
+        return [LessonInfo.model_validate(lesson) for lesson in lessons]
@@ -1,9 +1,30 @@
-from typing import List
-from fastapi import Depends
-
-from src.crud import StudentDAO, FacultyDAO, GroupDAO, CourseDAO, EnrollmentDAO, UserDAO
+import asyncio
+import csv
+import io
+import json
+
+from fastapi import Depends, HTTPException
+from pydantic import ValidationError
+
+from src.core.cache import group_names, faculty_names
+from src.core.db.unit_of_work import UnitOfWork
+from src.core.loader import EntityLoader
+from src.core.projection import json_page
+from src.crud import StudentDAO, CourseDAO, EnrollmentDAO, UserDAO
+from src.models import Enrollment, Faculty, Group, Student, User
 from src.models.enum import StatusEnum, UserRoleEnum
-from src.schemas import StudentCreateRequest, StudentInfo, StudentUpdateRequest
+from src.schemas import (
+    StudentCreateRequest,
+    StudentInfo,
+    StudentUpdateRequest,
+    StudentImportError,
+    StudentImportResponse,
+    Page,
+)
+from src.settings import settings
+
+# StudentInfo fields resolved from a student column through a reference cache
+NAME_FIELDS = {"group_name": "group_id", "faculty_name": "faculty_id"}
 
 
 class StudentService:
@@ -17,27 +38,119 @@ class StudentService:
         self,
         user_dao: UserDAO = Depends(),
         student_dao: StudentDAO = Depends(),
-        faculty_dao: FacultyDAO = Depends(),
-        group_dao: GroupDAO = Depends(),
         enrollment_dao: EnrollmentDAO = Depends(),
         courses_dao: CourseDAO = Depends(),
+        loader: EntityLoader = Depends(),
     ):
         """Initializes DAO for working with system entities.
 
         Args:
             user_dao (UserDAO): DAO for working with users
             student_dao (StudentDAO): DAO for working with students
-            faculty_dao (FacultyDAO): DAO for working with faculties
-            group_dao (GroupDAO): DAO for working with groups
             enrollment_dao (EnrollmentDAO): DAO for working with course enrollments
             courses_dao (CourseDAO): DAO for working with courses
+            loader (EntityLoader): Batching loader of entities by ID, also
+                used for groups, faculties and users referenced by students
         """
         self._user_dao = user_dao
         self._student_dao = student_dao
-        self._faculty_dao = faculty_dao
-        self._group_dao = group_dao
         self._enrollment_dao = enrollment_dao
         self._course_dao = courses_dao
+        self._loader = loader
+
+    @staticmethod
+    async def _resolve_names(
+        loader: EntityLoader, group_ids: set[int], faculty_ids: set[int]
+    ) -> tuple[dict[int, str], dict[int, str]]:
+        """Resolves group and faculty names through the reference caches.
+
+        Names missing from the caches are loaded in one batch per table.
+        """
+        return await asyncio.gather(
+            group_names.resolve(loader, group_ids),
+            faculty_names.resolve(loader, faculty_ids),
+        )
+
+    @staticmethod
+    async def build_infos(
+        students: list[Student], loader: EntityLoader
+    ) -> list[StudentInfo]:
+        """Builds StudentInfo DTOs for a batch of students.
+
+        Group and faculty names are taken from the in-memory reference caches,
+        so no queries are issued once the caches are warm.
+
+        Args:
+            students (list[Student]): Student objects from the database
+            loader (EntityLoader): Loader of the names missing from the caches
+
+        Returns:
+            list[StudentInfo]: DTOs in the order of ``students``
+
+        Raises:
+            HTTPException: 404 if a related group or faculty does not exist
+        """
+        groups, faculties = await StudentService._resolve_names(
+            loader, {s.group_id for s in students}, {s.faculty_id for s in students}
+        )
+
+        infos = []
+        for student in students:
+            if student.group_id not in groups:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Group with id {student.group_id} not found",
+                )
+            if student.faculty_id not in faculties:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Faculty with id {student.faculty_id} not found",
+                )
+            infos.append(
+                StudentInfo(
+                    id=student.id,
+                    user_id=student.user_id,
+                    student_number=student.student_number,
+                    group_name=groups[student.group_id],
+                    enrollment_year=student.enrollment_year,
+                    faculty_name=faculties[student.faculty_id],
+                )
+            )
+        return infos
+
+    async def _build_infos(self, students: list[Student]) -> list[StudentInfo]:
+        """Builds StudentInfo DTOs using the loader of this service."""
+        return await self.build_infos(students, self._loader)
+
+    async def _build_sparse_infos(self, rows: list, fields: list[str]) -> list[dict]:
+        """Builds sparse StudentInfo items from projected student rows.
+
+        Args:
+            rows (list[Row]): Rows selected with the columns behind ``fields``
+            fields (list[str]): Requested StudentInfo fields
+
+        Returns:
+            list[dict]: Items with the requested fields only; names of
+                unknown groups and faculties are None
+        """
+        names = {}
+        names["group_name"], names["faculty_name"] = await self._resolve_names(
+            self._loader,
+            {row.group_id for row in rows} if "group_name" in fields else set(),
+            {row.faculty_id for row in rows} if "faculty_name" in fields else set(),
+        )
+
+        return [
+            {
+                name: (
+                    names[name].get(getattr(row, NAME_FIELDS[name]))
+                    if name in NAME_FIELDS
+                    else getattr(row, name)
+                )
+                for name in fields
+            }
+            for row in rows
+        ]
 
     async def get_student_info(self, student_id: int) -> StudentInfo:
         """Gets extended information about a student by their ID.
@@ -51,22 +164,14 @@ class StudentService:
         Raises:
             HTTPException: 404 if student or related entities are not found
         """
-        student_data = await self._student_dao.find_one(id=student_id)
-        group = await self._group_dao.find_one(id=student_data.group_id)
-        faculty = await self._faculty_dao.find_one(id=student_data.faculty_id)
-
-        return StudentInfo(
-            id=student_data.id,
-            user_id=student_data.user_id,
-            student_number=student_data.student_number,
-            group_name=group.name,
-            enrollment_year=student_data.enrollment_year,
-            faculty_name=faculty.name,
-        )
+        student = await self._loader.find_one(Student, student_id)
+        return (await self._build_infos([student]))[0]
 
     async def add_student(self, student_data: StudentCreateRequest) -> StudentInfo:
         """Creates a new student and returns their extended data.
 
+        The student and the role of their user are written in one transaction.
+
         Args:
             student_data (StudentCreateRequest): DTO with data for student creation
 
@@ -78,11 +183,12 @@ class StudentService:
                 400 - On data validation errors
                 404 - If related group or faculty does not exist
         """
-        student = await self._student_dao.add(student_data)
-        await self._user_dao.update(
-            model_id=student.user_id, user_role=UserRoleEnum.STUDENT
-        )
-        return await self.get_student_info(student.id)
+        async with UnitOfWork(self._student_dao.session):
+            student = await self._student_dao.add(student_data)
+            await self._user_dao.update(
+                model_id=student.user_id, user_role=UserRoleEnum.STUDENT
+            )
+        return (await self._build_infos([student]))[0]
 
     async def get_students(
         self,
@@ -91,8 +197,11 @@ class StudentService:
         faculty_id: int = None,
         course_id: int = None,
         enrollment_status: StatusEnum = None,
-    ) -> List[StudentInfo]:
-        """Returns a filtered list of students with additional information.
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> Page[StudentInfo]:
+        """Returns a filtered page of students with additional information.
 
         Supports combined filtering by:
         - Group
@@ -107,10 +216,98 @@ class StudentService:
             faculty_id (int, optional): Filter by faculty ID
             course_id (int, optional): Filter by course ID
             enrollment_status (StatusEnum, optional): Filter by enrollment status
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
 
         Returns:
-            List[StudentInfo]: List of students matching the filters
+            Page[StudentInfo]: Students matching the filters and the next page cursor
         """
+        criteria, student_filters = self._list_filters(
+            group_id, enrollment_year, faculty_id, course_id, enrollment_status
+        )
+
+        if fields is not None:
+            rows, next_cursor = await self._student_dao.find_page(
+                *criteria,
+                limit=limit,
+                cursor=cursor,
+                fields=[NAME_FIELDS.get(name, name) for name in fields],
+                **student_filters,
+            )
+            return Page[dict](
+                items=await self._build_sparse_infos(rows, fields),
+                next_cursor=next_cursor,
+            )
+
+        students, next_cursor = await self._student_dao.find_page(
+            *criteria, limit=limit, cursor=cursor, **student_filters
+        )
+        return Page[StudentInfo](
+            items=await self._build_infos(students), next_cursor=next_cursor
+        )
+
+    async def get_students_db_json(
+        self,
+        group_id: int = None,
+        enrollment_year: int = None,
+        faculty_id: int = None,
+        course_id: int = None,
+        enrollment_status: StatusEnum = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> bytes:
+        """Returns a filtered page of students rendered to JSON by the database.
+
+        Produces the same document as serializing get_students. Group and
+        faculty names are joined in the query instead of being resolved
+        through the reference caches.
+
+        Args:
+            group_id (int, optional): Filter by group ID
+            enrollment_year (int, optional): Filter by enrollment year
+            faculty_id (int, optional): Filter by faculty ID
+            course_id (int, optional): Filter by course ID
+            enrollment_status (StatusEnum, optional): Filter by enrollment status
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            bytes: JSON of Page[StudentInfo]
+        """
+        criteria, student_filters = self._list_filters(
+            group_id, enrollment_year, faculty_id, course_id, enrollment_status
+        )
+        fields = fields or list(StudentInfo.model_fields)
+
+        joins = []
+        if "group_name" in fields:
+            joins.append((Group, Group.id == Student.group_id))
+        if "faculty_name" in fields:
+            joins.append((Faculty, Faculty.id == Student.faculty_id))
+
+        items, next_cursor = await self._student_dao.find_page_json(
+            *criteria,
+            fields=fields,
+            expressions={"group_name": Group.name, "faculty_name": Faculty.name},
+            joins=joins,
+            limit=limit,
+            cursor=cursor,
+            **student_filters,
+        )
+        return json_page(items, next_cursor)
+
+    def _list_filters(
+        self,
+        group_id: int = None,
+        enrollment_year: int = None,
+        faculty_id: int = None,
+        course_id: int = None,
+        enrollment_status: StatusEnum = None,
+    ) -> tuple[list, dict]:
+        """Turns student list filters into StudentDAO criteria and filters."""
         student_filters = {}
 
         if group_id is not None:
@@ -122,8 +319,7 @@ class StudentService:
         if faculty_id is not None:
             student_filters["faculty_id"] = faculty_id
 
-        students = await self._student_dao.find_all(**student_filters)
-
+        criteria = []
         if course_id is not None or enrollment_status is not None:
             enrollment_filter = {}
             if course_id is not None:
@@ -131,11 +327,13 @@ class StudentService:
             if enrollment_status is not None:
                 enrollment_filter["status"] = enrollment_status
 
-            enrollments = await self._enrollment_dao.find_all(**enrollment_filter)
-            valid_student_ids = {e.student_id for e in enrollments}
-            students = [s for s in students if s.id in valid_student_ids]
+            criteria.append(
+                self._enrollment_dao.exists(
+                    Enrollment.student_id == Student.id, **enrollment_filter
+                )
+            )
 
-        return [await self.get_student_info(student.id) for student in students]
+        return criteria, student_filters
 
     async def update_student(self, student_id: int, update_data: StudentUpdateRequest):
         """Updates student data and returns current information.
@@ -155,11 +353,173 @@ class StudentService:
         update_data = update_data.dict(exclude_none=True)
 
         if update_data:
-            student_list = await self._student_dao.update(
-                model_id=student_id, **update_data
+            student = await self._student_dao.update(model_id=student_id, **update_data)
+            return (await self._build_infos([student]))[0]
+
+        return await self.get_student_info(student_id=student_id)
+
+    @staticmethod
+    def parse_import_body(body: bytes, content_type: str) -> list:
+        """Parses a bulk import payload into raw rows.
+
+        Args:
+            body (bytes): Request body
+            content_type (str): Content-Type header of the request;
+                ``text/csv`` is parsed as CSV with a header line,
+                anything else as a JSON array of objects
+
+        Returns:
+            list: Raw rows, validated later one by one
+
+        Raises:
+            HTTPException: 422 if the payload cannot be parsed
+                or has too many rows
+        """
+        try:
+            if content_type.startswith("text/csv"):
+                rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+            else:
+                rows = json.loads(body)
+        except (ValueError, csv.Error) as e:
+            raise HTTPException(status_code=422, detail=f"Invalid payload: {e}")
+
+        if not isinstance(rows, list):
+            raise HTTPException(status_code=422, detail="Expected a list of students")
+        if len(rows) > settings.BULK_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=422,
+                detail=f"At most {settings.BULK_IMPORT_MAX_ROWS} rows can be imported",
+            )
+        return rows
+
+    async def _import_chunk(
+        self, chunk: list[tuple[int, StudentCreateRequest]]
+    ) -> tuple[int, list[StudentImportError]]:
+        """Inserts a chunk of validated rows and gives their users the student role.
+
+        The chunk is written with one INSERT and one UPDATE in a unit of work.
+        If the database rejects it, the rows are retried one by one, each in
+        its own savepoint, so that only the offending rows are reported.
+
+        Args:
+            chunk (list[tuple[int, StudentCreateRequest]]): Row numbers and rows
+
+        Returns:
+            tuple[int, list[StudentImportError]]: Number of imported students
+                and errors of the rejected rows
+        """
+        session = self._student_dao.session
+        try:
+            async with UnitOfWork(session):
+                created = await self._student_dao.add_many(
+                    [student for _, student in chunk]
+                )
+                await self._user_dao.set_role(
+                    [student.user_id for student in created], UserRoleEnum.STUDENT
+                )
+            return len(created), []
+        except HTTPException:
+            pass
+
+        imported = 0
+        errors = []
+        async with UnitOfWork(session):
+            for number, student in chunk:
+                try:
+                    async with session.begin_nested():
+                        await self._student_dao.add(student)
+                        await self._user_dao.set_role(
+                            [student.user_id], UserRoleEnum.STUDENT
+                        )
+                except HTTPException as e:
+                    errors.append(StudentImportError(row=number, detail=e.detail))
+                    continue
+                imported += 1
+        return imported, errors
+
+    async def import_students(self, rows: list) -> StudentImportResponse:
+        """Creates many students at once and reports per-row errors.
+
+        Rows are validated against StudentCreateRequest, then the referenced
+        users, groups and faculties are loaded together, one query per table.
+        Valid rows are inserted in chunks of settings.BULK_IMPORT_CHUNK_SIZE.
+        Every chunk is a unit of work: its students are inserted and their
+        users get the student role with a single UPDATE, then both are
+        committed together; a chunk the database rejects is retried row by
+        row. Users that already are students are skipped, so a partially
+        failed import can be safely repeated.
+        Rows whose student exists but whose user never got the student role,
+        which happens when an earlier import stopped before assigning it,
+        are counted as imported and get the role now.
+
+        Args:
+            rows (list): Raw rows as returned by parse_import_body
+
+        Returns:
+            StudentImportResponse: Number of imported students and errors
+                keyed by the 1-based row number
+        """
+        errors = []
+        candidates = []
+        for number, row in enumerate(rows, start=1):
+            try:
+                candidates.append((number, StudentCreateRequest.model_validate(row)))
+            except ValidationError as e:
+                detail = "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                    for error in e.errors()
+                )
+                errors.append(StudentImportError(row=number, detail=detail))
+
+        user_ids = {student.user_id for _, student in candidates}
+        group_ids = {student.group_id for _, student in candidates}
+        faculty_ids = {student.faculty_id for _, student in candidates}
+
+        users, groups, faculties = await asyncio.gather(
+            self._loader.load_many(User, sorted(user_ids)),
+            self._loader.load_many(Group, sorted(group_ids)),
+            self._loader.load_many(Faculty, sorted(faculty_ids)),
+        )
+        known_users = {u.id: u.user_role for u in users if u is not None}
+        known_groups = {g.id for g in groups if g is not None}
+        known_faculties = {f.id for f in faculties if f is not None}
+        taken_users = {
+            s.user_id for s in await self._student_dao.find_all(user_id__in=user_ids)
+        }
+
+        valid = []
+        unassigned_user_ids = []
+        for number, student in candidates:
+            if student.user_id not in known_users:
+                detail = f"User with id {student.user_id} not found"
+            elif student.group_id not in known_groups:
+                detail = f"Group with id {student.group_id} not found"
+            elif student.faculty_id not in known_faculties:
+                detail = f"Faculty with id {student.faculty_id} not found"
+            elif student.user_id in taken_users:
+                # An earlier import may have stopped before assigning the role
+                if known_users[student.user_id] != UserRoleEnum.STUDENT:
+                    known_users[student.user_id] = UserRoleEnum.STUDENT
+                    unassigned_user_ids.append(student.user_id)
+                    continue
+                detail = f"User with id {student.user_id} is already a student"
+            else:
+                taken_users.add(student.user_id)
+                known_users[student.user_id] = UserRoleEnum.STUDENT
+                valid.append((number, student))
+                continue
+            errors.append(StudentImportError(row=number, detail=detail))
+
+        imported = await self._user_dao.set_role(
+            unassigned_user_ids, UserRoleEnum.STUDENT
+        )
+        chunk_size = settings.BULK_IMPORT_CHUNK_SIZE
+        for start in range(0, len(valid), chunk_size):
+            chunk_imported, chunk_errors = await self._import_chunk(
+                valid[start : start + chunk_size]
             )
-            student = student_list[0]
-        else:
-            student = await self._student_dao.find_one(id=student_id)
+            imported += chunk_imported
+            errors.extend(chunk_errors)
 
-        return await self.get_student_info(student_id=student.id)
+        errors.sort(key=lambda error: error.row)
+        return StudentImportResponse(imported=imported, errors=errors)
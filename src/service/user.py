@@ -1,9 +1,11 @@
 from fastapi import Depends, HTTPException
 
+from src.core.projection import json_page, project
 from src.crud import UserDAO
 from src.models import User
 from src.models.enum import UserRoleEnum
 from src.schemas import GetAllUsersResponse, UserInfo, UpdateUserRequest
+from src.settings import settings
 
 
 class UserService:
@@ -21,14 +23,68 @@ class UserService:
         """
         self._user_dao = user_dao
 
-    async def get_all_users(self, current_user: User) -> GetAllUsersResponse:
-        """Returns a list of all active users in the system.
+    async def get_all_users(
+        self,
+        current_user: User,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> GetAllUsersResponse | dict:
+        """Returns a page of active users in the system.
+
+        Only the columns of the response are selected, so password hashes
+        are never read for the list.
+
+        Args:
+            current_user (User): Authorized user
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
+
+        Returns:
+            GetAllUsersResponse | dict: Page of active users and the next page
+                cursor; a plain dict of sparse users when fields are given
+
+        Raises:
+            HTTPException: 403 if user is not an administrator
+        """
+        if current_user.user_role != UserRoleEnum.ADMIN:
+            raise HTTPException(status_code=403, detail="Only admin can get all users")
+
+        users, next_cursor = await self._user_dao.find_page(
+            limit=limit,
+            cursor=cursor,
+            fields=fields or list(UserInfo.model_fields),
+            is_active=True,
+        )
+        if fields is not None:
+            return {
+                "users": [project(user, fields) for user in users],
+                "next_cursor": next_cursor,
+            }
+
+        users_response = [UserInfo.model_validate(user) for user in users]
+        return GetAllUsersResponse(users=users_response, next_cursor=next_cursor)
+
+    async def get_all_users_db_json(
+        self,
+        current_user: User,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str = None,
+        fields: list[str] = None,
+    ) -> bytes:
+        """Returns a page of active users rendered to JSON by the database.
+
+        Produces the same document as serializing get_all_users.
 
         Args:
             current_user (User): Authorized user
+            limit (int): Page size
+            cursor (str, optional): Cursor of the page to return
+            fields (list[str], optional): Response fields to return, all by default
 
         Returns:
-            GetAllUsersResponse: List of active users
+            bytes: JSON of GetAllUsersResponse
 
         Raises:
             HTTPException: 403 if user is not an administrator
@@ -36,21 +92,27 @@ class UserService:
         if current_user.user_role != UserRoleEnum.ADMIN:
             raise HTTPException(status_code=403, detail="Only admin can get all users")
 
-        users = await self._user_dao.find_all(is_active=True)
-        users_response = [
-            UserInfo(
-                id=user.id,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                username=user.username,
-                user_role=user.user_role,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
-            for user in users
-        ]
-
-        return GetAllUsersResponse(users=users_response)
+        users, next_cursor = await self._user_dao.find_page_json(
+            fields=fields or list(UserInfo.model_fields),
+            limit=limit,
+            cursor=cursor,
+            is_active=True,
+        )
+        return json_page(users, next_cursor, key="users")
+
+    async def get_user(self, user_id: int) -> User:
+        """Gets a user by their ID without converting it to the response schema.
+
+        Args:
+            user_id (int): Unique user identifier
+
+        Returns:
+            User: User object from the database
+
+        Raises:
+            HTTPException: 404 if user is not found
+        """
+        return await self._user_dao.find_one(id=user_id)
 
     async def get_user_by_id(self, user_id: int) -> UserInfo:
         """Gets user information by their ID.
@@ -64,16 +126,7 @@ class UserService:
         Raises:
             HTTPException: 404 if user is not found
         """
-        user = await self._user_dao.find_one(id=user_id)
-        return UserInfo(
-            id=user.id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            username=user.username,
-            user_role=user.user_role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return UserInfo.model_validate(await self.get_user(user_id))
 
     async def update_user(
         self, user_id: int, update_data: UpdateUserRequest, current_user: User
@@ -101,19 +154,11 @@ class UserService:
         update_data = update_data.dict(exclude_none=True)
 
         if update_data:
-            await self._user_dao.update(model_id=user_id, **update_data)
-
-        user = await self._user_dao.find_one(id=user_id)
-
-        return UserInfo(
-            id=user.id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            username=user.username,
-            user_role=user.user_role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+            user = await self._user_dao.update(model_id=user_id, **update_data)
+        else:
+            user = await self._user_dao.find_one(id=user_id)
+
+        return UserInfo.model_validate(user)
 
     async def deactivate_user(self, user_id: int, current_user: User) -> bool:
         """Deactivates a user in the system.
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +12,50 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int
 
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: List[str] = []
+
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 500
+
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    TIMETABLE_MAX_DAYS: int = 31
+
+    # Writes of this worker invalidate its user cache at once; other workers
+    # see a deactivation or a role change only after USER_CACHE_TTL_SECONDS
+    USER_CACHE_MAXSIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 30
+
+    COURSE_CACHE_MAXSIZE: int = 1024
+    COURSE_CACHE_TTL_SECONDS: float = 60
+
+    NEWS_CACHE_MAXSIZE: int = 64
+    NEWS_CACHE_TTL_SECONDS: float = 60
+
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    BULK_IMPORT_MAX_ROWS: int = 10000
+    BULK_IMPORT_CHUNK_SIZE: int = 1000
+
+    # max-age of Cache-Control on single-object reads; they always carry an ETag
+    HTTP_CACHE_MAX_AGE: int = 0
+
+    # Client networks allowed to read /metrics; it reveals routes, latencies and
+    # pool state, so keep it to the scraper and never expose it publicly
+    METRICS_ALLOWED_NETWORKS: List[str] = ["127.0.0.1/32", "::1/128"]
+
+    # Requests exceeding either threshold are logged; 0 disables the check
+    SLOW_REQUEST_QUERY_COUNT: int = 20
+    SLOW_REQUEST_DB_MS: float = 500
 
     class Config:
         env_file = ".env"
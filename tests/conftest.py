@@ -0,0 +1,59 @@
+"""Test configuration.
+
+Tests run against the PostgreSQL database given by TEST_DATABASE_URL, with
+migrations applied (``alembic upgrade head``). The rows a test creates are
+removed when it finishes. Without TEST_DATABASE_URL no tests are collected.
+
+Test functions may be coroutines: each runs in its own event loop, and the
+connection pools are disposed afterwards, because asyncpg connections cannot
+be shared between loops.
+"""
+
+import asyncio
+import inspect
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL is None:
+    collect_ignore_glob = ["test_*.py"]
+else:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ["DATABASE_REPLICA_URLS"] = "[]"
+    os.environ["DB_ECHO"] = "false"
+    for name, value in {
+        "ACCESS_SECRET_KEY": "test",
+        "REFRESH_SECRET_KEY": "test",
+        "ALGORITHM": "HS256",
+        "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+        "REFRESH_TOKEN_EXPIRE_MINUTES": "60",
+    }.items():
+        os.environ.setdefault(name, value)
+
+
+def pytest_report_header(config):
+    if TEST_DATABASE_URL is None:
+        return "TEST_DATABASE_URL is not set, database tests are skipped"
+
+
+async def _run_test(test) -> None:
+    from src.core.db.database import engine, read_engines
+
+    try:
+        await test
+    finally:
+        for used_engine in {engine, *read_engines}:
+            await used_engine.dispose()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {
+        name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames
+    }
+    asyncio.run(_run_test(pyfuncitem.obj(**arguments)))
+    return True
@@ -0,0 +1,143 @@
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete
+
+from src.core.db.database import async_session
+from src.core.db.stats import QueryStats, current_query_stats
+from src.models import (
+    Course,
+    Enrollment,
+    Faculty,
+    Group,
+    Instructor,
+    Student,
+    User,
+)
+from src.models.enum import SemesterEnum, UserRoleEnum
+
+
+@dataclass
+class University:
+    """IDs of the rows created by ``university``."""
+
+    faculty_id: int
+    group_id: int
+    instructor_id: int
+    instructor_user_id: int
+    student_ids: list[int] = field(default_factory=list)
+    student_user_ids: list[int] = field(default_factory=list)
+    course_ids: list[int] = field(default_factory=list)
+
+
+@contextmanager
+def count_queries():
+    """Counts the statements executed inside the block, like QueryStatsMiddleware."""
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+@asynccontextmanager
+async def university(students: int = 0, courses: int = 0, capacity: int = None):
+    """Creates a faculty and a group with students and an instructor with courses.
+
+    Every row is removed when the block exits, including enrollments
+    in the created courses.
+
+    Args:
+        students (int): Number of students in the group
+        courses (int): Number of courses taught by the instructor
+        capacity (int, optional): Capacity of every course, unlimited by default
+
+    Yields:
+        University: IDs of the created rows
+    """
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        faculty = Faculty(name=f"test-{tag}")
+        group = Group(name=f"test-{tag}")
+        users = [
+            User(
+                first_name="Test",
+                last_name=str(number),
+                username=f"test-{tag}-{number}",
+                password="-",
+                user_role=UserRoleEnum.STUDENT if number else UserRoleEnum.INSTRUCTOR,
+            )
+            for number in range(students + 1)
+        ]
+        session.add_all([faculty, group, *users])
+        await session.flush()
+
+        instructor = Instructor(
+            user_id=users[0].id,
+            position="-",
+            department=f"test-{tag}",
+            academic_degree="-",
+        )
+        session.add(instructor)
+        await session.flush()
+
+        student_rows = [
+            Student(
+                user_id=user.id,
+                student_number=f"{tag}-{number}",
+                group_id=group.id,
+                enrollment_year=2020 + number % 5,
+                faculty_id=faculty.id,
+            )
+            for number, user in enumerate(users[1:])
+        ]
+        course_rows = [
+            Course(
+                title=f"Course {number}",
+                description="Introduction to the subject",
+                course_code=f"{tag}-{number}",
+                credits=number % 6 + 1,
+                instructor_id=instructor.id,
+                semester=SemesterEnum.AUTUMN if number % 2 else SemesterEnum.SPRING,
+                year=2020 + number % 5,
+                capacity=capacity,
+            )
+            for number in range(courses)
+        ]
+        session.add_all([*student_rows, *course_rows])
+        await session.commit()
+
+        created = University(
+            faculty_id=faculty.id,
+            group_id=group.id,
+            instructor_id=instructor.id,
+            instructor_user_id=users[0].id,
+            student_ids=[student.id for student in student_rows],
+            student_user_ids=[user.id for user in users[1:]],
+            course_ids=[course.id for course in course_rows],
+        )
+
+    try:
+        yield created
+    finally:
+        async with async_session() as session:
+            await session.execute(
+                delete(Enrollment).where(Enrollment.course_id.in_(created.course_ids))
+            )
+            await session.execute(
+                delete(Course).filter_by(instructor_id=created.instructor_id)
+            )
+            await session.execute(
+                delete(Instructor).filter_by(id=created.instructor_id)
+            )
+            await session.execute(delete(Student).filter_by(group_id=created.group_id))
+            await session.execute(
+                delete(User).where(
+                    User.id.in_([created.instructor_user_id, *created.student_user_ids])
+                )
+            )
+            await session.execute(delete(Group).filter_by(id=created.group_id))
+            await session.execute(delete(Faculty).filter_by(id=created.faculty_id))
+            await session.commit()
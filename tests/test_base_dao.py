@@ -0,0 +1,90 @@
+import pytest
+from fastapi import HTTPException
+
+from src.core.db.database import async_session, engine
+from src.crud import CourseDAO, EnrollmentDAO, FacultyDAO, InstructorDAO, UserDAO
+from src.models import User
+from src.models.enum import SemesterEnum, UserRoleEnum
+from src.schemas import UpdateCourseRequest, UpdateUserRequest
+from src.service import CourseService, UserService
+from tests.factories import count_queries, university
+
+ADMIN = User(id=0, user_role=UserRoleEnum.ADMIN)
+
+
+async def test_writes_take_one_statement_each():
+    async with async_session() as session:
+        faculty_dao = FacultyDAO(session)
+
+        with count_queries() as stats:
+            faculty = await faculty_dao.add({"name": "test-faculty"})
+        assert stats.count == 1
+
+        with count_queries() as stats:
+            updated = await faculty_dao.update(faculty.id, name="test-renamed")
+        assert stats.count == 1
+        assert updated.name == "test-renamed"
+
+        with count_queries() as stats:
+            assert await faculty_dao.delete(faculty.id) is True
+        assert stats.count == 1
+
+
+async def test_writes_to_missing_rows_take_one_statement_each():
+    async with async_session() as session:
+        faculty_dao = FacultyDAO(session)
+
+        with count_queries() as stats, pytest.raises(HTTPException) as error:
+            await faculty_dao.update(0, name="missing")
+        assert stats.count == 1
+        assert error.value.status_code == 404
+
+        with count_queries() as stats, pytest.raises(HTTPException) as error:
+            await faculty_dao.delete(0)
+        assert stats.count == 1
+        assert error.value.status_code == 404
+
+
+async def test_update_services_reuse_the_returned_row():
+    async with university(courses=1) as created:
+        async with async_session() as session:
+            course_service = CourseService(
+                CourseDAO(session), EnrollmentDAO(session), InstructorDAO(session)
+            )
+            with count_queries() as stats:
+                course = await course_service.update_course(
+                    created.course_ids[0],
+                    ADMIN,
+                    UpdateCourseRequest(
+                        title="Renamed",
+                        description="-",
+                        course_code="-",
+                        credits=1,
+                        semester=SemesterEnum.SPRING,
+                        year=2026,
+                    ),
+                )
+            assert stats.count == 1
+            assert course.title == "Renamed"
+
+            user_service = UserService(UserDAO(session))
+            with count_queries() as stats:
+                user = await user_service.update_user(
+                    created.instructor_user_id,
+                    UpdateUserRequest(first_name="Renamed", last_name=None),
+                    ADMIN,
+                )
+            assert stats.count == 1
+            assert user.first_name == "Renamed"
+
+
+async def test_release_connection_returns_it_to_the_pool():
+    async with university(students=1) as created:
+        async with async_session() as session:
+            user_dao = UserDAO(session)
+            user = await user_dao.find_one(id=created.student_user_ids[0])
+            assert engine.pool.checkedout() == 1
+
+            await user_dao.release_connection()
+            assert engine.pool.checkedout() == 0
+            assert user.user_role == UserRoleEnum.STUDENT
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from pydantic_core import to_json
+
+from src.core.db.database import async_session
+from src.core.dependencies import read_only
+from src.models import User
+from src.models.enum import UserRoleEnum
+from src.service import CourseService, StudentService, UserService
+from tests.factories import university
+
+ADMIN = User(id=0, user_role=UserRoleEnum.ADMIN)
+ROWS = 25
+PAGE_SIZE = 10
+
+LISTS = [
+    (StudentService, "get_students", ["id", "group_name", "enrollment_year"]),
+    (CourseService, "get_courses", ["title", "semester", "capacity"]),
+    (UserService, "get_all_users", ["username", "user_role", "created_at"]),
+]
+
+
+async def walk(service, method: str, filters: dict) -> list:
+    """Returns every page of a list as parsed JSON, following the cursors."""
+    pages = []
+    cursor = None
+    while True:
+        page = await getattr(service, method)(cursor=cursor, **filters)
+        document = json.loads(page if isinstance(page, bytes) else to_json(page))
+        pages.append(document)
+        cursor = document["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sparse", [False, True], ids=["full", "sparse"])
+@pytest.mark.parametrize(
+    "service_cls, method, fields", LISTS, ids=[item[1] for item in LISTS]
+)
+async def test_database_rendered_pages_match_response_models(
+    service_cls, method, fields, sparse
+):
+    async with university(students=ROWS, courses=ROWS) as created:
+        filters = {
+            "get_students": {"group_id": created.group_id},
+            "get_courses": {"instructor_id": created.instructor_id},
+            "get_all_users": {"current_user": ADMIN},
+        }[method]
+        filters.update(limit=PAGE_SIZE, fields=fields if sparse else None)
+
+        async with async_session() as session:
+            service = await read_only(service_cls)(session)
+            expected = await walk(service, method, filters)
+            rendered = await walk(service, f"{method}_db_json", filters)
+
+    assert len(expected) > 1
+    assert rendered == expected
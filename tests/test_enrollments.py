@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from src.core.cache import course_list_cache
+from src.core.db.database import async_session
+from src.core.dependencies import read_only
+from src.crud import CourseDAO, EnrollmentDAO, InstructorDAO, UserDAO
+from src.models import Course, Enrollment, User
+from src.models.enum import SemesterEnum, StatusEnum, UserRoleEnum
+from src.schemas import UpdateCourseRequest
+from src.service import CourseService, EnrollmentService
+from tests.factories import university
+
+ADMIN = User(id=0, user_role=UserRoleEnum.ADMIN)
+
+STUDENTS = 60
+CAPACITY = 10
+
+
+def course_update(capacity: int | None) -> UpdateCourseRequest:
+    return UpdateCourseRequest(
+        title="Course",
+        description="-",
+        course_code="-",
+        credits=1,
+        semester=SemesterEnum.AUTUMN,
+        year=2026,
+        capacity=capacity,
+    )
+
+
+async def test_capacity_increase_promotes_waitlisted_students():
+    async with university(students=4, courses=1, capacity=1) as created:
+        course_id = created.course_ids[0]
+        async with async_session() as session:
+            enrollment_dao = EnrollmentDAO(session)
+            statuses = [
+                (await enrollment_dao.enroll(student_id, course_id)).status
+                for student_id in created.student_ids
+            ]
+        assert statuses == [StatusEnum.ACTIVE] + [StatusEnum.WAITLISTED] * 3
+
+        async with async_session() as session:
+            service = CourseService(
+                CourseDAO(session), EnrollmentDAO(session), InstructorDAO(session)
+            )
+            course = await service.update_course(course_id, ADMIN, course_update(2))
+            assert course.enrolled_count == 2
+
+            enrollments = await EnrollmentDAO(session).find_all(
+                course_id=course_id, status=StatusEnum.ACTIVE
+            )
+            # The waitlist is served in arrival order
+            assert {e.student_id for e in enrollments} == set(created.student_ids[:2])
+
+            course = await service.update_course(course_id, ADMIN, course_update(None))
+            assert course.capacity is None
+            assert course.enrolled_count == 4
+
+
+async def test_instructors_only_see_rosters_of_their_courses():
+    async with university(students=1, courses=1) as own, university(
+        courses=1
+    ) as foreign:
+        async with async_session() as session:
+            await EnrollmentDAO(session).enroll(own.student_ids[0], own.course_ids[0])
+
+        async with async_session() as session:
+            owner = await UserDAO(session).find_one(id=own.instructor_user_id)
+            service = await read_only(EnrollmentService)(session)
+            page = await service.get_course_enrollments(own.course_ids[0], owner)
+            assert [e.student_id for e in page.items] == own.student_ids
+
+            page = await service.get_course_enrollments(
+                own.course_ids[0], owner, status=StatusEnum.DROPPED
+            )
+            assert page.items == []
+
+            with pytest.raises(HTTPException) as error:
+                await service.get_course_enrollments(foreign.course_ids[0], owner)
+            assert error.value.status_code == 403
+
+            page = await service.get_course_enrollments(foreign.course_ids[0], ADMIN)
+            assert page.items == []
+
+
+async def test_instructors_only_update_their_courses():
+    async with university(courses=1) as own, university(courses=1) as foreign:
+        async with async_session() as session:
+            owner = await UserDAO(session).find_one(id=own.instructor_user_id)
+            service = CourseService(
+                CourseDAO(session), EnrollmentDAO(session), InstructorDAO(session)
+            )
+            course = await service.update_course(
+                own.course_ids[0], owner, course_update(5)
+            )
+            assert course.capacity == 5
+
+            with pytest.raises(HTTPException) as error:
+                await service.update_course(
+                    foreign.course_ids[0], owner, course_update(5)
+                )
+            assert error.value.status_code == 403
+
+
+async def test_seat_changes_only_drop_course_lists_showing_the_course():
+    async with university(students=1, courses=1) as created:
+        # The course is taught in the spring of 2020
+        shown = CourseService._list_cache_key(SemesterEnum.SPRING, 2020, None, 10, None)
+        other = CourseService._list_cache_key(SemesterEnum.SPRING, 2021, None, 10, None)
+        for event in (enroll, drop):
+            course_list_cache.set(shown, b"[]")
+            course_list_cache.set(other, b"[]")
+
+            await event(created.student_ids[0], created.course_ids[0])
+            assert course_list_cache.get(shown) is None
+            assert course_list_cache.get(other) == b"[]"
+
+
+async def enroll(student_id: int, course_id: int) -> StatusEnum:
+    """Enrolls a student in a session of its own, as a separate request would."""
+    async with async_session() as session:
+        enrollment = await EnrollmentDAO(session).enroll(student_id, course_id)
+        return enrollment.status
+
+
+async def drop(student_id: int, course_id: int) -> StatusEnum:
+    async with async_session() as session:
+        enrollment = await EnrollmentDAO(session).drop(student_id, course_id)
+        return enrollment.status
+
+
+async def seat_counts(course_id: int) -> tuple[int, dict]:
+    """Returns course.enrolled_count and the number of enrollments by status."""
+    async with async_session() as session:
+        enrolled_count = (await session.get(Course, course_id)).enrolled_count
+        result = await session.execute(
+            select(Enrollment.status, func.count())
+            .filter_by(course_id=course_id)
+            .group_by(Enrollment.status)
+        )
+        return enrolled_count, dict(result.all())
+
+
+async def test_concurrent_enrollments_never_exceed_capacity():
+    async with university(students=STUDENTS, courses=1, capacity=CAPACITY) as created:
+        course_id = created.course_ids[0]
+        first = created.student_ids[: STUDENTS // 2]
+        late = created.student_ids[STUDENTS // 2 :]
+
+        statuses = await asyncio.gather(*(enroll(sid, course_id) for sid in first))
+        assert statuses.count(StatusEnum.ACTIVE) == CAPACITY
+
+        enrolled_count, counts = await seat_counts(course_id)
+        assert enrolled_count == counts[StatusEnum.ACTIVE] == CAPACITY
+        assert counts[StatusEnum.WAITLISTED] == len(first) - CAPACITY
+
+        holders = [
+            sid for sid, status in zip(first, statuses) if status == StatusEnum.ACTIVE
+        ]
+        dropping = holders[: CAPACITY // 2]
+        await asyncio.gather(
+            *(drop(sid, course_id) for sid in dropping),
+            *(enroll(sid, course_id) for sid in late),
+        )
+
+        # Freed seats went to waitlisted students, none was left empty
+        enrolled_count, counts = await seat_counts(course_id)
+        assert enrolled_count == counts[StatusEnum.ACTIVE] == CAPACITY
+        assert counts[StatusEnum.DROPPED] == len(dropping)
+        assert counts[StatusEnum.WAITLISTED] == STUDENTS - len(dropping) - CAPACITY
@@ -0,0 +1,32 @@
+import asyncio
+
+from src.core.db.database import async_session
+from src.core.loader import EntityLoader
+from src.models import Faculty, Group, Student
+from tests.factories import count_queries, university
+
+
+async def test_loads_issued_together_take_one_query_per_model():
+    async with university(students=3) as created:
+        async with async_session() as session:
+            loader = EntityLoader(session)
+            with count_queries() as stats:
+                students, group, faculty, first = await asyncio.gather(
+                    loader.load_many(Student, [*created.student_ids, 0]),
+                    loader.load(Group, created.group_id),
+                    loader.load(Faculty, created.faculty_id),
+                    loader.load(Student, created.student_ids[0]),
+                )
+            assert stats.count == 3
+            assert [s.id if s else None for s in students] == [
+                *created.student_ids,
+                None,
+            ]
+            assert group.id == created.group_id
+            assert faculty.id == created.faculty_id
+            assert first is students[0]
+
+            with count_queries() as stats:
+                assert await loader.load(Student, 0) is None
+                assert await loader.load(Group, created.group_id) is group
+            assert stats.count == 0
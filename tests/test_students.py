@@ -0,0 +1,114 @@
+from sqlalchemy import delete
+
+from src.core.db.database import async_session
+from src.core.dependencies import read_only
+from src.core.loader import EntityLoader
+from src.crud import CourseDAO, EnrollmentDAO, StudentDAO, UserDAO
+from src.models import Student
+from src.models.enum import UserRoleEnum
+from src.service import StudentService
+from tests.factories import count_queries, university
+
+PAGE_SIZE = 20
+
+
+async def test_student_list_query_count_does_not_grow_with_page_size():
+    async with university(students=2 * PAGE_SIZE) as created:
+        async with async_session() as session:
+            service = await read_only(StudentService)(session)
+            # Load the reference caches, so both pages are measured warm
+            await service.get_students(group_id=created.group_id, limit=1)
+
+            with count_queries() as small:
+                page = await service.get_students(
+                    group_id=created.group_id, limit=PAGE_SIZE
+                )
+            assert len(page.items) == PAGE_SIZE
+
+            with count_queries() as large:
+                page = await service.get_students(
+                    group_id=created.group_id, limit=2 * PAGE_SIZE
+                )
+            assert len(page.items) == 2 * PAGE_SIZE
+
+    assert small.count == large.count == 1
+
+
+async def test_import_assigns_the_student_role_with_the_rows():
+    async with university(students=1) as created:
+        async with async_session() as session:
+            # A student left without the role by an interrupted import
+            await UserDAO(session).set_role(
+                created.student_user_ids, UserRoleEnum.ADMIN
+            )
+            row = {
+                "student_number": "imported",
+                "group_id": created.group_id,
+                "enrollment_year": 2026,
+                "faculty_id": created.faculty_id,
+            }
+            service = StudentService(
+                UserDAO(session),
+                StudentDAO(session),
+                EnrollmentDAO(session),
+                CourseDAO(session),
+                EntityLoader(session),
+            )
+            result = await service.import_students(
+                [
+                    {**row, "user_id": created.instructor_user_id},
+                    {**row, "user_id": created.student_user_ids[0]},
+                    {**row, "user_id": created.instructor_user_id},
+                ]
+            )
+        assert result.imported == 2
+        assert [(e.row, e.detail) for e in result.errors] == [
+            (3, f"User with id {created.instructor_user_id} is already a student")
+        ]
+
+        async with async_session() as session:
+            users = await UserDAO(session).find_all(
+                id__in=[created.instructor_user_id, *created.student_user_ids]
+            )
+            assert {user.user_role for user in users} == {UserRoleEnum.STUDENT}
+
+
+async def test_import_reports_only_the_rows_the_database_rejects():
+    async with university(students=1) as created:
+        async with async_session() as session:
+            # Two users that are not students yet
+            await session.execute(delete(Student).filter_by(group_id=created.group_id))
+            await session.commit()
+            service = StudentService(
+                UserDAO(session),
+                StudentDAO(session),
+                EnrollmentDAO(session),
+                CourseDAO(session),
+                EntityLoader(session),
+            )
+            row = {
+                "student_number": "imported",
+                "group_id": created.group_id,
+                "faculty_id": created.faculty_id,
+            }
+            result = await service.import_students(
+                [
+                    # Out of the integer column's range
+                    {
+                        **row,
+                        "user_id": created.instructor_user_id,
+                        "enrollment_year": 2**31,
+                    },
+                    {
+                        **row,
+                        "user_id": created.student_user_ids[0],
+                        "enrollment_year": 2026,
+                    },
+                ]
+            )
+        assert result.imported == 1
+        assert [error.row for error in result.errors] == [1]
+
+        async with async_session() as session:
+            students = await StudentDAO(session).find_all(group_id=created.group_id)
+            assert [student.user_id for student in students] == created.student_user_ids